@@ -0,0 +1,145 @@
+"""
+In-process technician load index for auto-assignment.
+
+Each maintenance team has a min-heap of its active technicians keyed by open
+workload (assigned requests in new or in_progress). Picking the least loaded
+technician is a heap peek, so auto-assignment adds no query to the create path.
+The crud layer adjusts loads after each commit that assigns, reassigns, closes,
+reopens or deletes a request. Heap entries are never updated in place: a load
+change pushes a new entry and stale ones are skipped when they surface.
+
+The index is per worker and does not see writes made by other workers or by
+cascades, so a background thread rebuilds it from the database every
+AUTO_ASSIGN_RECONCILE_SECONDS to bound the drift.
+"""
+import heapq
+import itertools
+import logging
+import threading
+from uuid import UUID
+
+from sqlalchemy import func, and_
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.models.technician import Technician
+from app.models.maintenance_request import MaintenanceRequest, RequestStage
+
+OPEN_STAGES = (RequestStage.new, RequestStage.in_progress)
+
+logger = logging.getLogger("gearguard.assignment")
+
+
+class TechnicianLoadIndex:
+    """Per-team heaps of (open load, tiebreak, technician id) with lazy invalidation."""
+
+    def __init__(self):
+        self._heaps: dict[UUID, list[tuple[int, int, UUID]]] = {}
+        self._technicians: dict[UUID, tuple[UUID, int]] = {}  # technician id -> (team id, load)
+        self._counter = itertools.count()
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _push(self, technician_id: UUID) -> None:
+        team_id, load = self._technicians[technician_id]
+        heap = self._heaps.setdefault(team_id, [])
+        heapq.heappush(heap, (load, next(self._counter), technician_id))
+        # Stale entries pile up between pops; rebuild once they dominate the heap
+        if len(heap) > 4 * len(self._technicians) + 16:
+            self._heaps[team_id] = [entry for entry in heap if self._is_current(team_id, entry)]
+            heapq.heapify(self._heaps[team_id])
+
+    def _is_current(self, team_id: UUID, entry: tuple[int, int, UUID]) -> bool:
+        load, _, technician_id = entry
+        return self._technicians.get(technician_id) == (team_id, load)
+
+    def reconcile(self, db: Session) -> None:
+        """Rebuild the index from active technicians and their open assignments."""
+        rows = db.query(Technician.id, Technician.team_id, func.count(MaintenanceRequest.id)).outerjoin(
+            MaintenanceRequest, and_(
+                MaintenanceRequest.assigned_to == Technician.id,
+                MaintenanceRequest.stage.in_(OPEN_STAGES)
+            )
+        ).filter(Technician.is_active.is_(True)).group_by(Technician.id, Technician.team_id).all()
+        with self._lock:
+            self._heaps = {}
+            self._technicians = {technician_id: (team_id, load) for technician_id, team_id, load in rows}
+            for technician_id in self._technicians:
+                self._push(technician_id)
+            self._loaded = True
+
+    def pick(self, db: Session, team_id: UUID) -> UUID | None:
+        """Reserve the least loaded active technician of a team (None if it has none)."""
+        if not self._loaded:
+            self.reconcile(db)
+        with self._lock:
+            heap = self._heaps.get(team_id, [])
+            while heap and not self._is_current(team_id, heap[0]):
+                heapq.heappop(heap)
+            if not heap:
+                return None
+            technician_id = heap[0][2]
+            self._technicians[technician_id] = (team_id, self._technicians[technician_id][1] + 1)
+            self._push(technician_id)
+            return technician_id
+
+    def adjust(self, technician_id: UUID | None, delta: int) -> None:
+        """Change a technician's open load; unknown (inactive) technicians are ignored."""
+        if technician_id is None or delta == 0:
+            return
+        with self._lock:
+            if technician_id not in self._technicians:
+                return
+            team_id, load = self._technicians[technician_id]
+            self._technicians[technician_id] = (team_id, max(load + delta, 0))
+            self._push(technician_id)
+
+    def set_technician(
+        self, technician_id: UUID, team_id: UUID | None, is_active: bool = True, load: int | None = None
+    ) -> None:
+        """Add, move or (when inactive or team_id is None) remove a technician, keeping its load.
+
+        A technician the index does not know is only added when its load is given
+        (0 for a new technician); a reactivated one may still have open
+        assignments, so it waits for the next reconcile.
+        """
+        with self._lock:
+            current = self._technicians.pop(technician_id, None)
+            if team_id is None or not is_active:
+                return
+            if current is None and load is None:
+                return
+            self._technicians[technician_id] = (team_id, current[1] if current else load)
+            self._push(technician_id)
+
+    def start(self, session_factory: sessionmaker) -> None:
+        """Reconcile against the database every AUTO_ASSIGN_RECONCILE_SECONDS."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._reconcile_loop, args=(session_factory,), name="gearguard-load-index", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _reconcile_loop(self, session_factory: sessionmaker) -> None:
+        while not self._stop.is_set():
+            db = session_factory()
+            try:
+                self.reconcile(db)
+            except Exception:
+                logger.exception("Technician load index reconcile failed")
+            finally:
+                db.close()
+            self._stop.wait(settings.AUTO_ASSIGN_RECONCILE_SECONDS)
+
+
+load_index = TechnicianLoadIndex()
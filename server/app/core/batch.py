@@ -0,0 +1,49 @@
+"""
+Helpers for the GET /api/<resource>/batch?ids= endpoints.
+
+The ids are parsed and capped once, fetched with a single query, and answered
+in the order requested with a status per id, so one missing or forbidden
+record does not fail the whole batch.
+"""
+from collections.abc import Callable
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+
+def parse_batch_ids(ids: str) -> list[UUID]:
+    """Parse a comma-separated id list, rejecting malformed ids and oversized batches."""
+    raw_ids = [value.strip() for value in ids.split(",") if value.strip()]
+    if len(raw_ids) > settings.BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BATCH_MAX_IDS} ids can be fetched at once"
+        )
+    try:
+        return [UUID(value) for value in raw_ids]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be comma-separated UUIDs")
+
+
+def unique_ids(ids: list[UUID]) -> list[UUID]:
+    return list(dict.fromkeys(ids))
+
+
+def batch_items(
+    ids: list[UUID],
+    found: dict[UUID, object],
+    serialize: Callable,
+    allowed: Callable[[UUID], bool] | None = None
+) -> list[dict]:
+    """Answer each requested id in order: 200 with data, 403 if not allowed, or 404."""
+    items = []
+    for entity_id in ids:
+        if allowed is not None and not allowed(entity_id):
+            items.append({"id": entity_id, "status": status.HTTP_403_FORBIDDEN})
+        elif entity_id in found:
+            items.append({"id": entity_id, "status": status.HTTP_200_OK, "data": serialize(found[entity_id])})
+        else:
+            items.append({"id": entity_id, "status": status.HTTP_404_NOT_FOUND})
+    return items
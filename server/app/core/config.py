@@ -11,6 +11,76 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Observability
+    METRICS_ENABLED: bool = True
+    SQL_STATS_ENABLED: bool = True
+    SQL_QUERY_WARN_THRESHOLD: int = 20  # warn when one request issues more statements (0 disables)
+    SQL_STRICT_LOADING: bool = False  # raise on any lazy relationship load (tests/checks only)
+    
+    # Slow query log (opt-in)
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1  # fraction of slow SELECTs re-run under EXPLAIN ANALYZE
+    SLOW_QUERY_BUFFER_SIZE: int = 100
+    
+    # On-demand request profiling (admins only, triggered by PROFILE_HEADER)
+    PROFILING_ENABLED: bool = True
+    PROFILE_HEADER: str = "X-GearGuard-Profile"
+    PROFILE_SAMPLE_INTERVAL_MS: float = 5.0
+    PROFILE_TRACEMALLOC_FRAMES: int = 1
+    PROFILE_TOP_ALLOCATIONS: int = 25
+    PROFILE_STORE_DIR: str = "/tmp/gearguard-profiles"
+    PROFILE_STORE_MAX_ENTRIES: int = 50
+    
+    # Calendar
+    CALENDAR_MAX_RANGE_DAYS: int = 366  # widest start_date..end_date window accepted
+    CALENDAR_DAY_DETAIL_LIMIT: int = 200  # max requests returned for a single day
+    CALENDAR_CACHE_TTL_SECONDS: int = 300  # per-month aggregate cache (backstop if a cross-worker invalidation is missed)
+    
+    # Dashboard
+    DASHBOARD_CACHE_TTL_SECONDS: int = 15  # per-role summary cache
+    WARRANTY_EXPIRING_DAYS: int = 30  # window for the warranty-expiring count
+    
+    # Realtime request events (SSE / WebSocket)
+    REALTIME_ENABLED: bool = True
+    REALTIME_CHANNEL: str = "gearguard_request_events"  # Postgres NOTIFY channel
+    REALTIME_QUEUE_SIZE: int = 100  # per-subscriber backlog before a resync is sent
+    REALTIME_HEARTBEAT_SECONDS: float = 15.0
+    
+    # Batch fetch endpoints (GET /api/<resource>/batch?ids=)
+    BATCH_MAX_IDS: int = 200
+    
+    # Auto-assignment (technician load index)
+    AUTO_ASSIGN_RECONCILE_SECONDS: int = 300  # rebuild the per-worker index from the database this often
+    
+    # Preventive maintenance schedules
+    PM_HORIZON_DAYS: int = 90  # how far ahead the generator materializes occurrences
+    PM_GENERATE_BATCH_SIZE: int = 1000  # schedules per generator transaction
+    
+    # Reports
+    REPORT_MAX_RANGE_DAYS: int = 366  # widest start_date..end_date window accepted
+    WORKLOAD_DEFAULT_WEEKS: int = 12  # technician workload window when no dates are given
+    TRENDS_DEFAULT_DAYS: int = 365  # trend window when no dates are given
+    ANALYTICS_SETTLE_SECONDS: int = 60  # incremental jobs skip source rows newer than this (late commits)
+    ANALYTICS_BATCH_SIZE: int = 5000  # source rows per incremental job transaction
+    
+    # Background jobs (python -m app.worker)
+    JOB_WORKER_CONCURRENCY: int = 4  # jobs run at once per worker process
+    JOB_WORKER_MODE: str = "thread"  # "thread" or "process" pool
+    JOB_POLL_SECONDS: float = 2.0  # idle wait between claim attempts
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 10.0  # backoff doubles per attempt, with jitter
+    JOB_RETRY_MAX_SECONDS: float = 900.0
+    JOB_LEASE_SECONDS: int = 900  # a running job without progress this long is claimed again
+    
+    # Periodic tasks (in-app scheduler; each task runs on one node at a time, heavy ones are queued as jobs)
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TICK_SECONDS: float = 30.0  # how often each worker looks for due tasks
+    SCHEDULE_OVERDUE_FLAG_SECONDS: int = 300  # task intervals; 0 disables the task
+    SCHEDULE_RELIABILITY_REFRESH_SECONDS: int = 900
+    SCHEDULE_TRENDS_REFRESH_SECONDS: int = 900
+    SCHEDULE_PREVENTIVE_GENERATE_SECONDS: int = 3600
+    
     # CORS - can be a comma-separated string or a list
     CORS_ORIGINS: str | list[str] = "http://localhost:3000,http://localhost:5173"
     
@@ -0,0 +1,210 @@
+"""
+Realtime change events for maintenance requests.
+
+The crud mutations call publish_event() inside their transaction. On Postgres
+the event is sent with pg_notify, so it is only delivered if the transaction
+commits, and every worker receives it through a LISTEN connection running in a
+background thread. On other databases the event is held on the session and
+handed to the local broker after commit (single worker only).
+
+The same channel carries internal events such as "calendar.invalidate". Those
+are sent whether or not realtime is enabled and go to the handler registered
+for their type (add_handler) in every worker instead of to subscribers.
+
+The broker fans events out to subscriptions (one per SSE or WebSocket client),
+each with an optional team filter and a bounded queue. A subscriber that falls
+behind has its backlog dropped and receives a single "resync" event telling it
+to refetch, so one slow client cannot grow memory without bound.
+"""
+import asyncio
+import json
+import logging
+import select
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+
+logger = logging.getLogger("gearguard.events")
+
+RESYNC_EVENT = {"type": "resync"}
+_PENDING_KEY = "gearguard_pending_events"
+
+
+class Subscription:
+    """One client's bounded event queue, bound to the event loop serving it."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, team_ids: set[str] | None, max_queue: int):
+        self.loop = loop
+        self.team_ids = team_ids
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def matches(self, event_data: dict) -> bool:
+        return self.team_ids is None or event_data.get("team_id") in self.team_ids
+
+    def offer(self, event_data: dict) -> None:
+        """Queue an event; on overflow replace the backlog with a resync marker."""
+        try:
+            self.queue.put_nowait(event_data)
+        except asyncio.QueueFull:
+            self.dropped += self.queue.qsize() + 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self, timeout: float) -> dict | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBroker:
+    """In-process pub/sub plus the Postgres LISTEN thread feeding it."""
+
+    def __init__(self, channel: str, max_queue: int):
+        self.channel = channel
+        self.max_queue = max_queue
+        self._subscriptions: set[Subscription] = set()
+        self._handlers: dict[str, Callable[[dict], None]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, team_ids: set[str] | None = None) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), team_ids, self.max_queue)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+        if subscription.dropped:
+            logger.info("Subscriber dropped %d events while lagging", subscription.dropped)
+
+    def add_handler(self, event_type: str, handler: Callable[[dict], None]) -> None:
+        """Handle an internal event type in-process instead of sending it to subscribers."""
+        self._handlers[event_type] = handler
+
+    def dispatch(self, event_data: dict) -> None:
+        """Deliver an event to matching local subscribers (safe from any thread)."""
+        handler = self._handlers.get(event_data.get("type"))
+        if handler is not None:
+            try:
+                handler(event_data)
+            except Exception:
+                logger.exception("Handler for %s events failed", event_data.get("type"))
+            return
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if s.matches(event_data)]
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event_data)
+            except RuntimeError:
+                # The subscriber's event loop has shut down
+                self.unsubscribe(subscription)
+
+    def start(self, engine: Engine) -> None:
+        """Start listening for notifications from all workers (Postgres only)."""
+        if engine.dialect.name != "postgresql" or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, args=(engine,), name="gearguard-events", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _listen(self, engine: Engine) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            connection = None
+            try:
+                # A dedicated connection outside the pool, held for the worker's lifetime
+                cargs, cparams = engine.dialect.create_connect_args(engine.url)
+                connection = engine.dialect.connect(*cargs, **cparams)
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+                backoff = 1.0
+                while not self._stop.is_set():
+                    if select.select([connection], [], [], 1.0) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        notify = connection.notifies.pop(0)
+                        try:
+                            self.dispatch(json.loads(notify.payload))
+                        except ValueError:
+                            logger.warning("Ignoring malformed event payload on %s", self.channel)
+            except Exception:
+                logger.exception("Event listener connection failed; reconnecting in %.0fs", backoff)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                if connection is not None:
+                    connection.close()
+
+
+event_broker = EventBroker(settings.REALTIME_CHANNEL, settings.REALTIME_QUEUE_SIZE)
+
+
+def build_request_event(
+    event_type: str,
+    request_id: UUID,
+    team_id: UUID | None,
+    equipment_id: UUID,
+    stage: str | None
+) -> dict:
+    """Build the JSON payload of a request change event."""
+    return {
+        "type": event_type,
+        "request_id": str(request_id),
+        "team_id": str(team_id) if team_id else None,
+        "equipment_id": str(equipment_id),
+        "stage": stage,
+        "occurred_at": datetime.utcnow().isoformat()
+    }
+
+
+def publish_event(db: Session, event_data: dict) -> None:
+    """Publish an event when the session's current transaction commits."""
+    if settings.REALTIME_ENABLED:
+        broadcast_event(db, event_data)
+
+
+def broadcast_event(db: Session, event_data: dict) -> None:
+    """Send an event to every worker when the transaction commits, even with realtime disabled."""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_notify(:channel, :payload)"),
+                   {"channel": settings.REALTIME_CHANNEL, "payload": json.dumps(event_data)})
+    else:
+        db.info.setdefault(_PENDING_KEY, []).append(event_data)
+
+
+def _dispatch_pending(session: Session) -> None:
+    for event_data in session.info.pop(_PENDING_KEY, []):
+        event_broker.dispatch(event_data)
+
+
+def _discard_pending(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_event_hooks(session_factory: sessionmaker) -> None:
+    """Deliver locally held events after commit (non-Postgres databases)."""
+    event.listen(session_factory, "after_commit", _dispatch_pending)
+    event.listen(session_factory, "after_soft_rollback", _discard_pending)
@@ -1,12 +1,16 @@
 """
 Custom exceptions and error handlers for the GearGuard API.
 """
+import logging
+
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from pydantic import ValidationError
 
+logger = logging.getLogger(__name__)
+
 
 class GearGuardException(Exception):
     """Base exception for GearGuard API."""
@@ -110,8 +114,11 @@ async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
 
 async def general_exception_handler(request: Request, exc: Exception):
     """Handler for unexpected exceptions."""
-    # Log the exception here in production
-    print(f"Unexpected error: {type(exc).__name__}: {str(exc)}")
+    logger.error(
+        "Unexpected error on %s %s: %s: %s",
+        request.method, request.url.path, type(exc).__name__, exc,
+        exc_info=exc
+    )
     
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
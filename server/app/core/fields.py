@@ -0,0 +1,56 @@
+"""
+Sparse fieldsets (`fields=` query parameter) for list endpoints.
+
+Each endpoint whitelists the fields a client may ask for as FieldSpecs: the SQL
+expression producing the field and the outer joins it needs. A fieldset query
+selects only those expressions and joins only the tables they touch, and the
+endpoint returns the rows as plain JSON objects with just the requested keys.
+"""
+from dataclasses import dataclass, field
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """SQL expression for one selectable field plus the (target, onclause) joins it requires."""
+    expression: ColumnElement
+    joins: tuple = field(default=())
+
+
+def field_spec(expression: ColumnElement, *joins) -> FieldSpec:
+    return FieldSpec(expression, tuple(joins))
+
+
+def parse_fields(fields: str | None, allowed: dict[str, FieldSpec]) -> list[str] | None:
+    """Validate a comma-separated fields parameter against a whitelist; id is always included."""
+    if fields is None:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(allowed))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    return ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+
+
+def project(query: Query, allowed: dict[str, FieldSpec], fields: list[str]) -> Query:
+    """Narrow a query to the requested fields, adding only the joins they need."""
+    joined = set()
+    for name in fields:
+        for target, onclause in allowed[name].joins:
+            if target not in joined:
+                query = query.outerjoin(target, onclause)
+                joined.add(target)
+    return query.with_entities(*(allowed[name].expression.label(name) for name in fields))
+
+
+def fieldset_response(rows: list[dict]) -> JSONResponse:
+    """Return fieldset rows as-is, bypassing the endpoint's full response model."""
+    return JSONResponse(content=jsonable_encoder(rows))
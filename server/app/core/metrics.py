@@ -0,0 +1,217 @@
+"""
+Request and connection pool metrics for the GearGuard API.
+
+Metrics are kept per worker process and rendered in the Prometheus text
+exposition format by the /metrics endpoint. Each uvicorn worker keeps its own
+registry, so Prometheus should scrape every worker (or the pod) individually.
+"""
+import bisect
+import threading
+import time
+from collections import defaultdict
+
+from sqlalchemy.pool import Pool, QueuePool
+
+# Default Prometheus latency buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# Label used for requests that did not match any route, so arbitrary paths
+# cannot blow up the label cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Return (upper bound, cumulative count) pairs including +Inf."""
+        result = []
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+
+class MetricsRegistry:
+    """Thread-safe store for HTTP request metrics."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._requests: dict[tuple[str, str, str], int] = defaultdict(int)
+        self._latency: dict[tuple[str, str], Histogram] = {}
+        self._in_progress = 0
+        self._pool_wait = Histogram(buckets)
+
+    def request_started(self) -> None:
+        with self._lock:
+            self._in_progress += 1
+
+    def observe_request(self, method: str, route: str, status_code: int, duration: float) -> None:
+        """Record a finished request."""
+        with self._lock:
+            self._in_progress -= 1
+            self._requests[(method, route, str(status_code))] += 1
+            histogram = self._latency.get((method, route))
+            if histogram is None:
+                histogram = self._latency[(method, route)] = Histogram(self.buckets)
+            histogram.observe(duration)
+
+    def observe_pool_wait(self, duration: float) -> None:
+        """Record how long a connection checkout waited on the pool."""
+        with self._lock:
+            self._pool_wait.observe(duration)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._latency.clear()
+            self._in_progress = 0
+            self._pool_wait = Histogram(self.buckets)
+
+    def render(self, pool: Pool | None = None) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        with self._lock:
+            lines.append("# HELP gearguard_http_requests_total Total HTTP requests by route template and status.")
+            lines.append("# TYPE gearguard_http_requests_total counter")
+            for (method, route, status_code), count in sorted(self._requests.items()):
+                labels = _format_labels({"method": method, "route": route, "status": status_code})
+                lines.append(f"gearguard_http_requests_total{labels} {count}")
+
+            lines.append("# HELP gearguard_http_request_duration_seconds HTTP request latency by route template.")
+            lines.append("# TYPE gearguard_http_request_duration_seconds histogram")
+            for (method, route), histogram in sorted(self._latency.items()):
+                lines.extend(self._render_histogram(
+                    "gearguard_http_request_duration_seconds",
+                    {"method": method, "route": route},
+                    histogram
+                ))
+
+            lines.append("# HELP gearguard_http_requests_in_progress HTTP requests currently being served.")
+            lines.append("# TYPE gearguard_http_requests_in_progress gauge")
+            lines.append(f"gearguard_http_requests_in_progress {self._in_progress}")
+
+            lines.append("# HELP gearguard_db_pool_wait_seconds Time spent waiting for a pooled connection.")
+            lines.append("# TYPE gearguard_db_pool_wait_seconds histogram")
+            lines.extend(self._render_histogram("gearguard_db_pool_wait_seconds", {}, self._pool_wait))
+
+        if pool is not None:
+            lines.extend(self._render_pool(pool))
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(name: str, labels: dict[str, str], histogram: Histogram) -> list[str]:
+        lines = []
+        for bound, count in histogram.cumulative():
+            bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+            lines.append(f"{name}_bucket{bucket_labels} {count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {histogram.total!r}")
+        lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return lines
+
+    @staticmethod
+    def _render_pool(pool: Pool) -> list[str]:
+        gauges = {
+            "size": ("Configured size of the connection pool.", getattr(pool, "size", None)),
+            "checked_out": ("Connections currently checked out of the pool.", getattr(pool, "checkedout", None)),
+            "checked_in": ("Idle connections currently in the pool.", getattr(pool, "checkedin", None)),
+            "overflow": ("Connections opened beyond the pool size.", getattr(pool, "overflow", None)),
+        }
+        lines = []
+        for name, (help_text, getter) in gauges.items():
+            if getter is None:
+                continue
+            lines.append(f"# HELP gearguard_db_pool_{name} {help_text}")
+            lines.append(f"# TYPE gearguard_db_pool_{name} gauge")
+            value = getter()
+            if name == "overflow":
+                # QueuePool reports overflow as negative until the pool is full
+                value = max(value, 0)
+            lines.append(f"gearguard_db_pool_{name} {value}")
+        return lines
+
+
+registry = MetricsRegistry()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            registry.observe_pool_wait(time.perf_counter() - start)
+
+
+def get_route_template(scope: dict) -> str:
+    """Return the matched route template (e.g. /api/equipment/{equipment_id})."""
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return path_format or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """ASGI middleware that records request counts and latency per route template."""
+
+    def __init__(self, app, metrics: MetricsRegistry = registry):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+        self.metrics.request_started()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.observe_request(
+                scope["method"],
+                get_route_template(scope),
+                status_code,
+                time.perf_counter() - start
+            )
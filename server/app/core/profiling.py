@@ -0,0 +1,245 @@
+"""
+On-demand request profiling for admins.
+
+When an admin sends the PROFILE_HEADER with a request, that single request is
+run under a sampling profiler (a background thread sampling the serving
+thread's stack) and a tracemalloc snapshot. The folded stacks (flame graph
+input) and top allocation sites are written to a bounded on-disk store that
+the admin endpoints list and download.
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.metrics import get_route_template
+from app.core.security import decode_token
+from app.database import SessionLocal
+from app.models.user import User, UserRole
+
+logger = logging.getLogger("gearguard.profiling")
+
+# tracemalloc is process-wide, so only one request is profiled at a time
+_profile_lock = threading.Lock()
+
+
+class StackSampler:
+    """Periodically sample one thread's stack into folded flame graph lines."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="gearguard-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+    def folded(self) -> list[str]:
+        return [f"{stack} {count}" for stack, count in self.samples.most_common()]
+
+
+class ProfileStore:
+    """Bounded on-disk store of request profiles (one JSON file per profile)."""
+
+    def __init__(self, directory: str, max_entries: int):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+
+    def _path(self, profile_id: str) -> Path:
+        # Profile ids are generated hex UUIDs; reject anything else
+        if not profile_id.isalnum():
+            raise KeyError(profile_id)
+        return self.directory / f"{profile_id}.json"
+
+    def save(self, profile: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(profile["id"])
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(profile, default=str))
+        tmp_path.replace(path)
+        self._prune()
+
+    def _prune(self) -> None:
+        files = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in files[self.max_entries:]:
+            path.unlink(missing_ok=True)
+
+    def list(self) -> list[dict]:
+        """Return profile metadata, newest first."""
+        if not self.directory.exists():
+            return []
+        result = []
+        files = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in files:
+            try:
+                profile = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            result.append({key: profile[key] for key in (
+                "id", "method", "path", "route", "status", "duration_ms", "sample_count", "created_at"
+            )})
+        return result
+
+    def get(self, profile_id: str) -> dict | None:
+        try:
+            return json.loads(self._path(profile_id).read_text())
+        except (KeyError, OSError, ValueError):
+            return None
+
+    def delete(self, profile_id: str) -> bool:
+        try:
+            path = self._path(profile_id)
+        except KeyError:
+            return False
+        if not path.exists():
+            return False
+        path.unlink()
+        return True
+
+
+profile_store = ProfileStore(settings.PROFILE_STORE_DIR, settings.PROFILE_STORE_MAX_ENTRIES)
+
+
+def _is_admin_request(scope) -> bool:
+    """Check the bearer token of a request belongs to an admin user."""
+    headers = dict(scope.get("headers") or [])
+    authorization = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+
+    try:
+        user_id = decode_token(token).get("sub")
+    except HTTPException:
+        return False
+    if user_id is None:
+        return False
+
+    db = SessionLocal()
+    try:
+        role = db.query(User.role).filter(User.id == user_id).scalar()
+    except Exception:
+        return False
+    finally:
+        db.close()
+    return role == UserRole.admin
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles single requests on demand for admins."""
+
+    def __init__(self, app, header: str | None = None):
+        self.app = app
+        self.header = (header or settings.PROFILE_HEADER).lower().encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not _is_admin_request(scope) or not _profile_lock.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            _profile_lock.release()
+
+    def _wants_profile(self, scope) -> bool:
+        for name, value in scope.get("headers") or []:
+            if name == self.header:
+                return value.strip().lower() not in (b"", b"0", b"false")
+        return False
+
+    async def _profile(self, scope, receive, send):
+        profile_id = uuid.uuid4().hex
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-gearguard-profile-id", profile_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(settings.PROFILE_TRACEMALLOC_FRAMES)
+        sampler = StackSampler(threading.get_ident(), settings.PROFILE_SAMPLE_INTERVAL_MS / 1000)
+        sampler.start()
+        start = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            sampler.stop()
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            self._save(profile_id, scope, status_code, duration, sampler, snapshot)
+
+    def _save(self, profile_id, scope, status_code, duration, sampler, snapshot) -> None:
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        allocations = [
+            {
+                "location": str(stat.traceback[0]) if stat.traceback else "unknown",
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics("lineno")[:settings.PROFILE_TOP_ALLOCATIONS]
+        ]
+        profile = {
+            "id": profile_id,
+            "method": scope["method"],
+            "path": scope["path"],
+            "query_string": scope.get("query_string", b"").decode("latin-1"),
+            "route": get_route_template(scope),
+            "status": status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "sample_interval_ms": settings.PROFILE_SAMPLE_INTERVAL_MS,
+            "sample_count": sum(sampler.samples.values()),
+            "created_at": datetime.utcnow().isoformat(),
+            "folded_stacks": sampler.folded(),
+            "top_allocations": allocations,
+        }
+        try:
+            profile_store.save(profile)
+        except OSError:
+            logger.exception("Could not store request profile %s", profile_id)
+        else:
+            logger.info("Stored profile %s for %s %s", profile_id, scope["method"], scope["path"])
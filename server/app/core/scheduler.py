@@ -0,0 +1,183 @@
+"""
+In-app scheduler for periodic maintenance tasks.
+
+Every API worker runs the scheduler thread, started from the FastAPI lifespan.
+Each tick it reads periodic_task_runs and, for every task whose interval has
+passed since its last start, tries pg_try_advisory_lock on a key derived from
+the task name. Only the worker that gets the lock runs the task, so a task runs
+once per interval across all workers and nodes; the others skip it without
+waiting. Tasks are meant to be short: heavy work is queued as a background
+job for the worker processes (see app.jobs.periodic_tasks), so it does not
+compete with request handling. The lock is held on a dedicated autocommit connection and is released
+by Postgres if that worker dies. After locking, the run row is read again so a
+task another node finished a moment ago is not repeated.
+
+On other databases there is no advisory lock and the scheduler assumes a
+single worker.
+"""
+import hashlib
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.models.periodic_task_run import PeriodicTaskRun
+
+logger = logging.getLogger("gearguard.scheduler")
+
+
+@dataclass(frozen=True)
+class PeriodicTask:
+    name: str
+    interval_seconds: int
+    run: Callable[[Session], dict | None]
+
+
+def advisory_lock_key(name: str) -> int:
+    """Stable signed 64-bit advisory lock key for a task name."""
+    digest = hashlib.blake2b(f"gearguard.periodic:{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _is_due(run: PeriodicTaskRun | None, task: PeriodicTask, now: datetime) -> bool:
+    return run is None or run.last_started_at is None or \
+        run.last_started_at + timedelta(seconds=task.interval_seconds) <= now
+
+
+class PeriodicScheduler:
+    """Background thread running due periodic tasks under per-task advisory locks."""
+
+    def __init__(self):
+        self._tasks: list[PeriodicTask] = []
+        self._node = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @contextmanager
+    def _leader_lock(self, engine: Engine, name: str):
+        """Yield whether this worker holds the task's lock (always True off Postgres)."""
+        if engine.dialect.name != "postgresql":
+            yield True
+            return
+        key = advisory_lock_key(name)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            acquired = conn.execute(select(func.pg_try_advisory_lock(key))).scalar()
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    conn.execute(select(func.pg_advisory_unlock(key)))
+
+    def run_task(self, engine: Engine, session_factory: sessionmaker, task: PeriodicTask) -> bool:
+        """Run a task if it is due and no other worker is running it; True if it ran."""
+        with self._leader_lock(engine, task.name) as acquired:
+            if not acquired:
+                return False
+            db = session_factory()
+            try:
+                started_at = datetime.utcnow()
+                if not _is_due(db.get(PeriodicTaskRun, task.name), task, started_at):
+                    return False
+                started = time.perf_counter()
+                try:
+                    result, error = task.run(db), None
+                except Exception as exc:
+                    db.rollback()
+                    logger.exception("Periodic task %s failed", task.name)
+                    result, error = None, f"{type(exc).__name__}: {exc}"
+                duration_ms = (time.perf_counter() - started) * 1000
+
+                run = db.get(PeriodicTaskRun, task.name)
+                if run is None:
+                    run = PeriodicTaskRun(name=task.name, run_count=0, failure_count=0)
+                    db.add(run)
+                run.last_started_at = started_at
+                run.last_finished_at = datetime.utcnow()
+                run.last_duration_ms = duration_ms
+                run.last_result = result
+                run.last_error = error
+                run.last_node = self._node
+                run.run_count += 1
+                run.failure_count += error is not None
+                db.commit()
+                return True
+            finally:
+                db.close()
+
+    def tick(self, engine: Engine, session_factory: sessionmaker) -> list[str]:
+        """Run every due task once; returns the names of the tasks this worker ran."""
+        db = session_factory()
+        try:
+            runs = {run.name: run for run in db.query(PeriodicTaskRun)}
+        finally:
+            db.close()
+        now = datetime.utcnow()
+        ran = []
+        for task in self._tasks:
+            if self._stop.is_set():
+                break
+            if _is_due(runs.get(task.name), task, now) and self.run_task(engine, session_factory, task):
+                ran.append(task.name)
+        return ran
+
+    def status(self, db: Session) -> list[dict]:
+        """Configured tasks with their last recorded run and next due time."""
+        runs = {run.name: run for run in db.query(PeriodicTaskRun)}
+        result = []
+        for task in self._tasks:
+            run = runs.get(task.name)
+            last_started_at = run.last_started_at if run else None
+            result.append({
+                "name": task.name,
+                "interval_seconds": task.interval_seconds,
+                "last_started_at": last_started_at,
+                "last_finished_at": run.last_finished_at if run else None,
+                "last_duration_ms": run.last_duration_ms if run else None,
+                "last_result": run.last_result if run else None,
+                "last_error": run.last_error if run else None,
+                "last_node": run.last_node if run else None,
+                "run_count": run.run_count if run else 0,
+                "failure_count": run.failure_count if run else 0,
+                "next_run_at": last_started_at + timedelta(seconds=task.interval_seconds) if last_started_at else None,
+            })
+        return result
+
+    def configure(self, tasks: list[PeriodicTask]) -> None:
+        """Set the tasks to run; tasks with a zero interval are disabled."""
+        self._tasks = [task for task in tasks if task.interval_seconds > 0]
+
+    def start(self, engine: Engine, session_factory: sessionmaker) -> None:
+        """Look for due tasks every SCHEDULER_TICK_SECONDS."""
+        if self._thread is not None or not self._tasks:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, args=(engine, session_factory), name="gearguard-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _loop(self, engine: Engine, session_factory: sessionmaker) -> None:
+        while not self._stop.wait(settings.SCHEDULER_TICK_SECONDS):
+            try:
+                self.tick(engine, session_factory)
+            except Exception:
+                logger.exception("Periodic scheduler tick failed")
+
+
+periodic_scheduler = PeriodicScheduler()
@@ -0,0 +1,171 @@
+"""
+Opt-in slow query recorder.
+
+Statements slower than SLOW_QUERY_THRESHOLD_MS are logged with their
+normalized SQL, the shape of their bound parameters and the app.crud function
+that issued them. A sample of slow SELECT statements is re-run under
+EXPLAIN (ANALYZE, BUFFERS) inside a savepoint, and the plans are kept in a
+bounded in-memory ring buffer that admins can read through the API.
+"""
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger("gearguard.sql.slow")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_EXPLAIN_SAVEPOINT = "gearguard_slow_query_explain"
+# SELECTs that must not run twice: row locks, and functions whose effects a
+# savepoint rollback does not undo (notifications, advisory locks, sequences)
+_SIDE_EFFECTS = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+)?(?:UPDATE|SHARE)\b|\bFOR\s+KEY\s+SHARE\b"
+    r"|\b(?:pg_notify|pg_(?:try_)?advisory_\w+|nextval|setval|pg_cancel_backend|pg_terminate_backend)\s*\(",
+    re.IGNORECASE
+)
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse whitespace and replace inline literals with placeholders."""
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def parameter_shape(parameters) -> dict[str, str] | list[str] | None:
+    """Describe bound parameters by type only, never by value."""
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return [type(parameters).__name__]
+
+
+def find_caller(package: str = "app.crud") -> str | None:
+    """Return module.function of the innermost frame inside the given package."""
+    frame = sys._getframe(1)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(package + "."):
+            return f"{module}.{frame.f_code.co_name}"
+        if fallback is None and module.startswith("app.routers."):
+            fallback = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return fallback
+
+
+@dataclass
+class SlowQuery:
+    """A statement that exceeded the slow query threshold."""
+    statement: str
+    parameters: dict[str, str] | list[str] | None
+    duration_ms: float
+    caller: str | None
+    recorded_at: datetime = field(default_factory=datetime.utcnow)
+    plan: list[str] | None = None
+
+
+class SlowQueryLog:
+    """Thread-safe bounded ring buffer of slow queries."""
+
+    def __init__(self, maxlen: int):
+        self._entries: deque[SlowQuery] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def add(self, entry: SlowQuery) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self) -> list[dict]:
+        """Return recorded entries, newest first."""
+        with self._lock:
+            return [asdict(entry) for entry in reversed(self._entries)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_BUFFER_SIZE)
+
+
+def _explain(conn, cursor, statement: str, parameters) -> list[str] | None:
+    """Run EXPLAIN (ANALYZE, BUFFERS) for a SELECT inside a savepoint that is always rolled back."""
+    if conn.dialect.name != "postgresql":
+        return None
+    if not statement.lstrip().upper().startswith("SELECT") or _SIDE_EFFECTS.search(statement):
+        # ANALYZE executes the statement, so never explain writes, locks or side effects
+        return None
+
+    explain_cursor = cursor.connection.cursor()
+    try:
+        explain_cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        try:
+            explain_cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            plan = [row[0] for row in explain_cursor.fetchall()]
+        except Exception:
+            logger.debug("EXPLAIN failed for slow query", exc_info=True)
+            plan = None
+        finally:
+            # Undo whatever the re-run did, then drop the savepoint
+            explain_cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            explain_cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        return plan
+    except Exception:
+        logger.debug("Could not capture EXPLAIN for slow query", exc_info=True)
+        return None
+    finally:
+        explain_cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("slow_query_start_time")
+    if not start_times:
+        return
+    duration_ms = (time.perf_counter() - start_times.pop()) * 1000
+    if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    entry = SlowQuery(
+        statement=normalize_sql(statement),
+        parameters=None if executemany else parameter_shape(parameters),
+        duration_ms=round(duration_ms, 2),
+        caller=find_caller()
+    )
+    logger.warning(
+        "Slow query (%.1f ms) from %s: %s params=%s",
+        entry.duration_ms, entry.caller or "unknown", entry.statement, entry.parameters
+    )
+
+    if not executemany and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE:
+        entry.plan = _explain(conn, cursor, statement, parameters)
+
+    slow_query_log.add(entry)
+
+
+def register_slow_query_listeners(engine: Engine) -> None:
+    """Attach the slow query hooks to an engine when the recorder is enabled."""
+    if not settings.SLOW_QUERY_LOG_ENABLED:
+        return
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
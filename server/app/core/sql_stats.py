@@ -0,0 +1,176 @@
+"""
+Per-request SQL statement instrumentation.
+
+Cursor execution hooks on the engine count statements and accumulate database
+time into the QueryStats object of the current request. The middleware exposes
+the totals as a Server-Timing header and a structured log line, and warns when
+a single request issues more statements than the configured threshold (which
+usually means an N+1 lazy-load pattern).
+
+Strict loading mode (SQL_STRICT_LOADING, used by the query budget check)
+applies raiseload('*') to every ORM SELECT and rejects any lazy load that
+still reaches the database, so unplanned N+1 loads fail loudly.
+"""
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import ORMExecuteState, raiseload
+
+from app.core.config import settings
+from app.core.metrics import get_route_template
+
+logger = logging.getLogger("gearguard.sql")
+
+
+@dataclass
+class QueryStats:
+    """Statement count and database time collected for one unit of work."""
+    count: int = 0
+    duration: float = 0.0
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("gearguard_query_stats", default=None)
+
+
+def get_current_stats() -> QueryStats | None:
+    """Return the stats collector for the current request, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries():
+    """Collect statement counts for everything executed inside the block."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+
+
+def register_query_listeners(engine: Engine) -> None:
+    """Attach the statement counting hooks to an engine."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class UnplannedLazyLoadError(InvalidRequestError):
+    """Raised in strict loading mode when a relationship is lazy loaded."""
+
+
+_strict_loading: ContextVar[bool] = ContextVar("gearguard_strict_loading", default=settings.SQL_STRICT_LOADING)
+
+
+@contextmanager
+def strict_loading(enabled: bool = True):
+    """Enable or disable strict loading for everything executed inside the block."""
+    token = _strict_loading.set(enabled)
+    try:
+        yield
+    finally:
+        _strict_loading.reset(token)
+
+
+def _guard_lazy_loads(execute_state: ORMExecuteState) -> None:
+    if not _strict_loading.get():
+        return
+
+    if execute_state.lazy_loaded_from is not None:
+        raise UnplannedLazyLoadError(
+            f"Unplanned lazy load from {execute_state.lazy_loaded_from.class_.__name__} "
+            f"while strict loading is enabled: {execute_state.statement}"
+        )
+
+    if execute_state.is_select and not execute_state.is_relationship_load and not execute_state.is_column_load:
+        execute_state.statement = execute_state.statement.options(raiseload("*"))
+
+
+def register_strict_loading(session_factory) -> None:
+    """Attach the strict loading guard to a sessionmaker when enabled in settings."""
+    if not settings.SQL_STRICT_LOADING:
+        return
+    if not event.contains(session_factory, "do_orm_execute", _guard_lazy_loads):
+        event.listen(session_factory, "do_orm_execute", _guard_lazy_loads)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware that reports per-request SQL statement counts and time."""
+
+    def __init__(self, app, warn_threshold: int | None = None):
+        self.app = app
+        self.warn_threshold = warn_threshold if warn_threshold is not None else settings.SQL_QUERY_WARN_THRESHOLD
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - start) * 1000
+                server_timing = (
+                    f'db;dur={stats.duration_ms:.2f};desc="{stats.count} queries", '
+                    f"app;dur={total_ms:.2f}"
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", server_timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                self._report(scope, status_code, stats, time.perf_counter() - start)
+
+    def _report(self, scope, status_code: int, stats: QueryStats, elapsed: float) -> None:
+        route = get_route_template(scope)
+        fields = {
+            "method": scope["method"],
+            "route": route,
+            "status": status_code,
+            "queries": stats.count,
+            "db_ms": round(stats.duration_ms, 2),
+            "total_ms": round(elapsed * 1000, 2),
+        }
+        line = " ".join(f"{key}={value}" for key, value in fields.items())
+        logger.info("request_sql_stats %s", line, extra={"sql_stats": fields})
+
+        if self.warn_threshold and stats.count > self.warn_threshold:
+            logger.warning(
+                "Request %s %s issued %d SQL statements (threshold %d), possible N+1 query pattern",
+                scope["method"], route, stats.count, self.warn_threshold,
+                extra={"sql_stats": fields}
+            )
@@ -0,0 +1,155 @@
+import random
+from uuid import UUID
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_
+
+from app.core.config import settings
+from app.models.background_job import BackgroundJob, JobStatus
+
+
+def enqueue_job(
+    db: Session,
+    kind: str,
+    payload: dict,
+    created_by: UUID | None = None,
+    max_attempts: int | None = None
+) -> BackgroundJob:
+    """Queue a job for the workers."""
+    db_job = BackgroundJob(
+        kind=kind,
+        payload=payload,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        created_by=created_by
+    )
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+
+def enqueue_job_unless_pending(db: Session, kind: str, payload: dict) -> BackgroundJob | None:
+    """Queue a job unless one of the same kind is already queued or running; None when skipped."""
+    pending = db.query(BackgroundJob.id).filter(
+        BackgroundJob.kind == kind,
+        BackgroundJob.status.in_([JobStatus.queued, JobStatus.running])
+    ).first()
+    if pending:
+        return None
+    return enqueue_job(db, kind, payload)
+
+
+def get_job(db: Session, job_id: UUID) -> BackgroundJob | None:
+    """Get a job by ID."""
+    return db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+
+
+def get_jobs(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    status: JobStatus | None = None,
+    kind: str | None = None
+) -> list[BackgroundJob]:
+    """Get jobs with optional filters, newest first."""
+    query = db.query(BackgroundJob)
+
+    if status:
+        query = query.filter(BackgroundJob.status == status)
+
+    if kind:
+        query = query.filter(BackgroundJob.kind == kind)
+
+    return query.order_by(BackgroundJob.created_at.desc()).offset(skip).limit(limit).all()
+
+
+def claim_job(db: Session, worker_id: str, kinds: list[str]) -> BackgroundJob | None:
+    """Lock the oldest due job of the given kinds for a worker; None when nothing is due.
+
+    SKIP LOCKED makes concurrent claimers pass over rows another worker is
+    claiming instead of waiting for it. Running jobs whose lease expired are
+    claimed again, or failed once they are out of attempts.
+    """
+    while True:
+        now = datetime.utcnow()
+        job = db.query(BackgroundJob).filter(
+            BackgroundJob.kind.in_(kinds),
+            or_(
+                and_(BackgroundJob.status == JobStatus.queued, BackgroundJob.run_after <= now),
+                and_(BackgroundJob.status == JobStatus.running,
+                     BackgroundJob.locked_at < now - timedelta(seconds=settings.JOB_LEASE_SECONDS))
+            )
+        ).order_by(BackgroundJob.run_after).limit(1).with_for_update(skip_locked=True).first()
+        if job is None:
+            db.rollback()
+            return None
+
+        if job.status == JobStatus.running and job.attempts >= job.max_attempts:
+            job.status = JobStatus.failed
+            job.error = f"Lease expired on worker {job.locked_by}"
+            job.locked_by = job.locked_at = None
+            job.finished_at = now
+            db.commit()
+            continue
+
+        job.status = JobStatus.running
+        job.attempts += 1
+        job.locked_by = worker_id
+        job.locked_at = now
+        job.started_at = now
+        db.commit()
+        return job
+
+
+def _owned(db: Session, job_id: UUID, worker_id: str):
+    """Query for a job still running under the given worker's lease."""
+    return db.query(BackgroundJob).filter(
+        BackgroundJob.id == job_id,
+        BackgroundJob.status == JobStatus.running,
+        BackgroundJob.locked_by == worker_id
+    )
+
+
+def record_progress(db: Session, job_id: UUID, worker_id: str, done: int, total: int | None = None) -> bool:
+    """Store job progress and renew the lease; False if the worker no longer owns the job."""
+    values = {BackgroundJob.progress: done, BackgroundJob.locked_at: datetime.utcnow()}
+    if total is not None:
+        values[BackgroundJob.progress_total] = total
+    owned = _owned(db, job_id, worker_id).update(values, synchronize_session=False)
+    db.commit()
+    return owned > 0
+
+
+def complete_job(db: Session, job_id: UUID, worker_id: str, result: dict | None) -> None:
+    """Mark a job the worker owns as succeeded."""
+    _owned(db, job_id, worker_id).update({
+        BackgroundJob.status: JobStatus.succeeded,
+        BackgroundJob.result: result,
+        BackgroundJob.error: None,
+        BackgroundJob.locked_by: None,
+        BackgroundJob.locked_at: None,
+        BackgroundJob.finished_at: datetime.utcnow(),
+    }, synchronize_session=False)
+    db.commit()
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before the next attempt: exponential backoff with jitter over the upper half."""
+    delay = min(settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.JOB_RETRY_MAX_SECONDS)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def fail_job(db: Session, job_id: UUID, worker_id: str, attempts: int, max_attempts: int, error: str) -> JobStatus:
+    """Re-queue a failed attempt with backoff, or fail the job when out of attempts."""
+    now = datetime.utcnow()
+    values = {BackgroundJob.error: error, BackgroundJob.locked_by: None, BackgroundJob.locked_at: None}
+    if attempts < max_attempts:
+        status = JobStatus.queued
+        values[BackgroundJob.run_after] = now + timedelta(seconds=retry_delay(attempts))
+    else:
+        status = JobStatus.failed
+        values[BackgroundJob.finished_at] = now
+    values[BackgroundJob.status] = status
+    _owned(db, job_id, worker_id).update(values, synchronize_session=False)
+    db.commit()
+    return status
@@ -0,0 +1,16 @@
+from uuid import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy import any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+
+
+def get_by_ids(db: Session, model, ids: list[UUID], *options) -> dict[UUID, object]:
+    """Get rows of a model by primary key in one query, keyed by id."""
+    if not ids:
+        return {}
+    if db.get_bind().dialect.name == "postgresql":
+        # One array parameter (id = ANY(:ids)) keeps a single statement shape for any batch size
+        condition = model.id == any_(bindparam("ids", list(ids), type_=ARRAY(PG_UUID(as_uuid=True))))
+    else:
+        condition = model.id.in_(ids)
+    return {row.id: row for row in db.query(model).options(*options).filter(condition).all()}
@@ -0,0 +1,57 @@
+from uuid import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, literal, select, tuple_
+
+from app.models.change_log import ChangeLog, ChangeEntity, ChangeOperation
+from app.models.maintenance_request import MaintenanceRequest
+from app.models.time_log import TimeLog
+
+
+def record_change(db: Session, entity_type: ChangeEntity, entity_id: UUID, operation: ChangeOperation) -> None:
+    """Add a change log row to the current transaction."""
+    db.add(ChangeLog(entity_type=entity_type, entity_id=entity_id, operation=operation))
+
+
+def record_changes(db: Session, entity_type: ChangeEntity, entity_ids: list[UUID], operation: ChangeOperation) -> None:
+    """Add change log rows for many entities with one batched insert."""
+    if entity_ids:
+        db.execute(insert(ChangeLog), [
+            {"entity_type": entity_type, "entity_id": entity_id, "operation": operation} for entity_id in entity_ids
+        ])
+
+
+def _record_tombstones(db: Session, entity_type: ChangeEntity, ids) -> None:
+    """Insert delete tombstones for every id selected by a subquery."""
+    db.execute(insert(ChangeLog).from_select(
+        ["entity_type", "entity_id", "operation"],
+        select(literal(entity_type.value), ids.c.id, literal(ChangeOperation.delete.value))
+    ))
+
+
+def record_request_cascade_deletes(db: Session, request_ids) -> None:
+    """Add tombstones for the time logs deleted along with the given requests."""
+    _record_tombstones(db, ChangeEntity.time_log, select(TimeLog.id).where(
+        TimeLog.request_id.in_(request_ids)
+    ).subquery())
+
+
+def record_equipment_cascade_deletes(db: Session, equipment_id: UUID) -> None:
+    """Add tombstones for the requests and time logs deleted along with equipment."""
+    request_ids = select(MaintenanceRequest.id).where(MaintenanceRequest.equipment_id == equipment_id)
+    record_request_cascade_deletes(db, request_ids)
+    _record_tombstones(db, ChangeEntity.maintenance_request, request_ids.subquery())
+
+
+def get_changes(db: Session, after: tuple[int, int], limit: int) -> list[ChangeLog]:
+    """Get change log rows after a (txid, seq) position, in commit-safe order."""
+    if db.get_bind().dialect.name != "postgresql":
+        return db.query(ChangeLog).filter(ChangeLog.seq > after[1]).order_by(ChangeLog.seq).limit(limit).all()
+
+    # Sequence numbers are taken before commit, so a higher seq can become visible
+    # before a lower one. Rows are read in (txid, seq) order and only from
+    # transactions older than every one still running, so a transaction that
+    # commits later always sorts after the returned position.
+    return db.query(ChangeLog).filter(
+        tuple_(ChangeLog.txid, ChangeLog.seq) > after,
+        ChangeLog.txid < func.txid_snapshot_xmin(func.txid_current_snapshot())
+    ).order_by(ChangeLog.txid, ChangeLog.seq).limit(limit).all()
@@ -0,0 +1,48 @@
+from datetime import date
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_
+
+from app.models.maintenance_request import MaintenanceRequest, RequestStage
+from app.models.equipment import Equipment, EquipmentStatus
+from app.models.maintenance_team import MaintenanceTeam
+
+OPEN_STAGES = (RequestStage.new, RequestStage.in_progress)
+
+
+def get_summary_rows(db: Session, today: date, warranty_until: date):
+    """Get all dashboard counts in one statement (one row per grouping set)."""
+    # Grouping sets yield the overall totals, one row per stage and one row per team;
+    # the warranty count is a scalar subquery repeated on each row
+    is_open = MaintenanceRequest.stage.in_(OPEN_STAGES)
+    warranty_expiring = select(func.count(Equipment.id)).where(
+        Equipment.status == EquipmentStatus.active,
+        Equipment.warranty_expiry >= today,
+        Equipment.warranty_expiry <= warranty_until
+    ).scalar_subquery()
+
+    return db.query(
+        func.grouping(MaintenanceRequest.stage).label("stage_grouped"),
+        func.grouping(MaintenanceTeam.id).label("team_grouped"),
+        MaintenanceRequest.stage.label("stage"),
+        MaintenanceTeam.id.label("team_id"),
+        MaintenanceTeam.name.label("team_name"),
+        func.count(MaintenanceRequest.id).label("total"),
+        func.count(MaintenanceRequest.id).filter(is_open).label("open"),
+        func.count(MaintenanceRequest.id).filter(
+            is_open, MaintenanceRequest.scheduled_date < today
+        ).label("overdue"),
+        func.count(MaintenanceRequest.id).filter(
+            is_open, MaintenanceRequest.assigned_to.is_(None)
+        ).label("unassigned"),
+        warranty_expiring.label("warranty_expiring"),
+    ).join(
+        Equipment, MaintenanceRequest.equipment_id == Equipment.id
+    ).join(
+        MaintenanceTeam, Equipment.maintenance_team_id == MaintenanceTeam.id
+    ).group_by(
+        func.grouping_sets(
+            tuple_(),
+            tuple_(MaintenanceRequest.stage),
+            tuple_(MaintenanceTeam.id, MaintenanceTeam.name)
+        )
+    ).all()
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 
 from app.models.department import Department
 from app.schemas.department import DepartmentCreate, DepartmentUpdate
+from app.crud.returning import update_returning, delete_returning, commit_returning
 
 
 def get_department(db: Session, department_id: UUID) -> Department | None:
@@ -26,25 +27,12 @@ def create_department(db: Session, department: DepartmentCreate) -> Department:
 
 def update_department(db: Session, department_id: UUID, department: DepartmentUpdate) -> Department | None:
     """Update a department."""
-    db_department = get_department(db, department_id)
-    if not db_department:
-        return None
-    
-    update_data = department.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_department, field, value)
-    
-    db.commit()
-    db.refresh(db_department)
-    return db_department
+    db_department = update_returning(db, Department, department_id, department.model_dump(exclude_unset=True))
+    return commit_returning(db, db_department)
 
 
 def delete_department(db: Session, department_id: UUID) -> bool:
     """Delete a department."""
-    db_department = get_department(db, department_id)
-    if not db_department:
-        return False
-    
-    db.delete(db_department)
+    deleted = delete_returning(db, Department, department_id)
     db.commit()
-    return True
+    return deleted is not None
@@ -1,17 +1,56 @@
 from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, select
 
 from app.models.equipment import Equipment
 from app.models.maintenance_request import MaintenanceRequest, RequestStage
+from app.models.change_log import ChangeEntity, ChangeOperation
+from app.core.fields import field_spec, project
+from app.crud.maintenance_request import invalidate_calendar_months
+from app.crud.change_log import record_change, record_equipment_cascade_deletes
+from app.crud.batch import get_by_ids
+from app.crud.workload import remove_request_time_logs
+from app.crud.returning import update_returning, delete_returning, commit_returning
 from app.schemas.equipment import EquipmentCreate, EquipmentUpdate
 
 
+# Fields selectable with fields= on the equipment list (EquipmentDetailResponse keys)
+EQUIPMENT_FIELDS = {
+    "id": field_spec(Equipment.id),
+    "name": field_spec(Equipment.name),
+    "serial_number": field_spec(Equipment.serial_number),
+    "category": field_spec(Equipment.category),
+    "department_id": field_spec(Equipment.department_id),
+    "assigned_employee": field_spec(Equipment.assigned_employee),
+    "location": field_spec(Equipment.location),
+    "purchase_date": field_spec(Equipment.purchase_date),
+    "warranty_expiry": field_spec(Equipment.warranty_expiry),
+    "maintenance_team_id": field_spec(Equipment.maintenance_team_id),
+    "status": field_spec(Equipment.status),
+    "request_count": field_spec(
+        select(func.count(MaintenanceRequest.id)).where(
+            MaintenanceRequest.equipment_id == Equipment.id
+        ).scalar_subquery()
+    ),
+    "open_request_count": field_spec(
+        select(func.count(MaintenanceRequest.id)).where(
+            MaintenanceRequest.equipment_id == Equipment.id,
+            MaintenanceRequest.stage.in_([RequestStage.new, RequestStage.in_progress])
+        ).scalar_subquery()
+    ),
+}
+
+
 def get_equipment(db: Session, equipment_id: UUID) -> Equipment | None:
     """Get equipment by ID."""
     return db.query(Equipment).filter(Equipment.id == equipment_id).first()
 
 
+def get_equipment_by_ids(db: Session, equipment_ids: list[UUID]) -> dict[UUID, Equipment]:
+    """Get equipment by a list of IDs in one query."""
+    return get_by_ids(db, Equipment, equipment_ids)
+
+
 def get_equipment_with_details(db: Session, equipment_id: UUID):
     """Get equipment with department, team, and request counts."""
     equipment = db.query(Equipment).options(
@@ -35,6 +74,24 @@ def get_equipment_with_details(db: Session, equipment_id: UUID):
     return equipment, total_requests, open_requests
 
 
+def get_request_counts(db: Session, equipment_ids: list[UUID]) -> dict[UUID, tuple[int, int]]:
+    """Get (total, open) request counts for many equipment items in one query."""
+    if not equipment_ids:
+        return {}
+    
+    rows = db.query(
+        MaintenanceRequest.equipment_id,
+        func.count(MaintenanceRequest.id),
+        func.count(MaintenanceRequest.id).filter(
+            MaintenanceRequest.stage.in_([RequestStage.new, RequestStage.in_progress])
+        )
+    ).filter(
+        MaintenanceRequest.equipment_id.in_(equipment_ids)
+    ).group_by(MaintenanceRequest.equipment_id).all()
+    
+    return {equipment_id: (total, open_count) for equipment_id, total, open_count in rows}
+
+
 def get_equipment_list(
     db: Session,
     skip: int = 0,
@@ -42,13 +99,11 @@ def get_equipment_list(
     department_id: UUID | None = None,
     team_id: UUID | None = None,
     category: str | None = None,
-    search: str | None = None
-) -> list[Equipment]:
-    """Get all equipment with optional filters."""
-    query = db.query(Equipment).options(
-        joinedload(Equipment.department),
-        joinedload(Equipment.maintenance_team)
-    )
+    search: str | None = None,
+    fields: list[str] | None = None
+) -> list[Equipment] | list[dict]:
+    """Get all equipment with optional filters (only the given EQUIPMENT_FIELDS as dicts if fields is set)."""
+    query = db.query(Equipment)
     
     if department_id:
         query = query.filter(Equipment.department_id == department_id)
@@ -70,13 +125,20 @@ def get_equipment_list(
             )
         )
     
-    return query.offset(skip).limit(limit).all()
+    if fields:
+        return [row._asdict() for row in project(query, EQUIPMENT_FIELDS, fields).offset(skip).limit(limit)]
+    return query.options(
+        joinedload(Equipment.department),
+        joinedload(Equipment.maintenance_team)
+    ).offset(skip).limit(limit).all()
 
 
 def create_equipment(db: Session, equipment: EquipmentCreate) -> Equipment:
     """Create new equipment."""
     db_equipment = Equipment(**equipment.model_dump())
     db.add(db_equipment)
+    db.flush()
+    record_change(db, ChangeEntity.equipment, db_equipment.id, ChangeOperation.upsert)
     db.commit()
     db.refresh(db_equipment)
     return db_equipment
@@ -84,26 +146,32 @@ def create_equipment(db: Session, equipment: EquipmentCreate) -> Equipment:
 
 def update_equipment(db: Session, equipment_id: UUID, equipment: EquipmentUpdate) -> Equipment | None:
     """Update equipment."""
-    db_equipment = get_equipment(db, equipment_id)
+    db_equipment = update_returning(db, Equipment, equipment_id, equipment.model_dump(exclude_unset=True))
     if not db_equipment:
+        db.rollback()
         return None
     
-    update_data = equipment.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_equipment, field, value)
-    
-    db.commit()
-    db.refresh(db_equipment)
-    return db_equipment
+    record_change(db, ChangeEntity.equipment, equipment_id, ChangeOperation.upsert)
+    return commit_returning(db, db_equipment)
 
 
 def delete_equipment(db: Session, equipment_id: UUID) -> bool:
     """Delete equipment."""
-    db_equipment = get_equipment(db, equipment_id)
-    if not db_equipment:
+    # Requests are deleted with the equipment, so their calendar months go stale
+    scheduled_dates = [row[0] for row in db.query(MaintenanceRequest.scheduled_date).filter(
+        MaintenanceRequest.equipment_id == equipment_id,
+        MaintenanceRequest.scheduled_date.isnot(None)
+    ).distinct().all()]
+    
+    record_equipment_cascade_deletes(db, equipment_id)
+    remove_request_time_logs(db, select(MaintenanceRequest.id).where(MaintenanceRequest.equipment_id == equipment_id))
+    record_change(db, ChangeEntity.equipment, equipment_id, ChangeOperation.delete)
+    # Requests, their time logs and audit trail go with it through ON DELETE CASCADE
+    if not delete_returning(db, Equipment, equipment_id):
+        db.rollback()
         return False
     
-    db.delete(db_equipment)
+    invalidate_calendar_months(db, *scheduled_dates)
     db.commit()
     return True
 
@@ -1,28 +1,174 @@
 from uuid import UUID
-from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_, and_
+from datetime import datetime, date, timedelta
+from sqlalchemy.orm import Session, joinedload, selectinload, aliased
+from sqlalchemy import func, or_, and_, tuple_, case, update, insert, select, literal
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.events import build_request_event, publish_event, broadcast_event, event_broker
+from app.core.assignment import load_index, OPEN_STAGES
+from app.core.fields import field_spec, project
 from app.models.maintenance_request import MaintenanceRequest, RequestStage, RequestType
 from app.models.equipment import Equipment
+from app.models.maintenance_team import MaintenanceTeam
+from app.models.technician import Technician
+from app.models.user import User
 from app.models.request_audit_log import RequestAuditLog
+from app.models.time_log import TimeLog
+from app.models.change_log import ChangeEntity, ChangeOperation
+from app.crud.change_log import record_change, record_changes, record_request_cascade_deletes
+from app.crud.batch import get_by_ids
+from app.crud.workload import remove_request_time_logs
+from app.crud.returning import locked_old_values, delete_returning, commit_returning
 from app.schemas.maintenance_request import MaintenanceRequestCreate, MaintenanceRequestUpdate
 
 
+# Per-day calendar aggregates, keyed by (year, month) of scheduled_date
+calendar_month_cache = TTLCache(ttl_seconds=settings.CALENDAR_CACHE_TTL_SECONDS)
+CALENDAR_INVALIDATE_EVENT = "calendar.invalidate"
+
+
+def invalidate_calendar_months(db: Session, *scheduled_dates: date | None) -> None:
+    """Drop the calendar months containing any of the given dates, in every worker.
+
+    Call it before commit: this worker's cache is cleared now, and the other
+    workers' when the transaction commits and the invalidation event reaches
+    them (which clears this worker again, after the new rows are visible).
+    """
+    keys = sorted({(day.year, day.month) for day in scheduled_dates if day is not None})
+    if keys:
+        calendar_month_cache.invalidate(*keys)
+        broadcast_event(db, {"type": CALENDAR_INVALIDATE_EVENT, "months": keys})
+
+
+def _drop_calendar_months(event_data: dict) -> None:
+    calendar_month_cache.invalidate(*(tuple(month) for month in event_data["months"]))
+
+
+event_broker.add_handler(CALENDAR_INVALIDATE_EVENT, _drop_calendar_months)
+
+
+_detected_by_user = aliased(User)
+_assigned_user = aliased(User)
+_equipment_join = (Equipment, MaintenanceRequest.equipment_id == Equipment.id)
+
+# Fields selectable with fields= on the request list (MaintenanceRequestDetailResponse keys)
+REQUEST_FIELDS = {
+    "id": field_spec(MaintenanceRequest.id),
+    "subject": field_spec(MaintenanceRequest.subject),
+    "description": field_spec(MaintenanceRequest.description),
+    "request_type": field_spec(MaintenanceRequest.request_type),
+    "equipment_id": field_spec(MaintenanceRequest.equipment_id),
+    "equipment_name": field_spec(Equipment.name, _equipment_join),
+    "equipment_category": field_spec(Equipment.category, _equipment_join),
+    "equipment_location": field_spec(Equipment.location, _equipment_join),
+    "detected_by": field_spec(MaintenanceRequest.detected_by),
+    "detected_by_name": field_spec(
+        _detected_by_user.name, (_detected_by_user, MaintenanceRequest.detected_by == _detected_by_user.id)
+    ),
+    "assigned_to": field_spec(MaintenanceRequest.assigned_to),
+    "assigned_to_name": field_spec(
+        _assigned_user.name,
+        (Technician, MaintenanceRequest.assigned_to == Technician.id),
+        (_assigned_user, Technician.user_id == _assigned_user.id)
+    ),
+    "maintenance_team_id": field_spec(Equipment.maintenance_team_id, _equipment_join),
+    "maintenance_team_name": field_spec(
+        MaintenanceTeam.name, _equipment_join, (MaintenanceTeam, Equipment.maintenance_team_id == MaintenanceTeam.id)
+    ),
+    "stage": field_spec(MaintenanceRequest.stage),
+    "scheduled_date": field_spec(MaintenanceRequest.scheduled_date),
+    "created_at": field_spec(MaintenanceRequest.created_at),
+    "overdue": field_spec(MaintenanceRequest.overdue),
+    "is_overdue": field_spec(case(
+        (and_(
+            MaintenanceRequest.scheduled_date < func.current_date(),
+            MaintenanceRequest.stage.in_([RequestStage.new, RequestStage.in_progress])
+        ), True),
+        else_=False
+    )),
+}
+
+
+def _equipment_team_id(db: Session, equipment_id: UUID) -> UUID | None:
+    return db.query(Equipment.maintenance_team_id).filter(Equipment.id == equipment_id).scalar()
+
+
+def _open_assignee(db_request: MaintenanceRequest) -> UUID | None:
+    """The technician whose open workload includes this request, if any."""
+    return db_request.assigned_to if db_request.stage in OPEN_STAGES else None
+
+
+def _publish_request_event(
+    db: Session,
+    event_type: str,
+    db_request: MaintenanceRequest,
+    team_id: UUID | None = None
+) -> None:
+    """Queue a realtime event for a request change, delivered when the transaction commits."""
+    team_id = team_id or _equipment_team_id(db, db_request.equipment_id)
+    publish_event(db, build_request_event(
+        event_type, db_request.id, team_id, db_request.equipment_id, db_request.stage.value
+    ))
+
+
+def _detail_load_options():
+    """Eager loads for everything MaintenanceRequestDetailResponse reads."""
+    return (
+        joinedload(MaintenanceRequest.equipment).joinedload(Equipment.maintenance_team),
+        joinedload(MaintenanceRequest.detected_by_user),
+        joinedload(MaintenanceRequest.assigned_technician).joinedload(Technician.user)
+    )
+
+
 def get_request(db: Session, request_id: UUID) -> MaintenanceRequest | None:
     """Get maintenance request by ID."""
     return db.query(MaintenanceRequest).filter(MaintenanceRequest.id == request_id).first()
 
 
+def get_requests_by_ids(db: Session, request_ids: list[UUID]) -> dict[UUID, MaintenanceRequest]:
+    """Get maintenance requests with related data by a list of IDs in one query."""
+    return get_by_ids(db, MaintenanceRequest, request_ids, *_detail_load_options())
+
+
 def get_request_with_details(db: Session, request_id: UUID):
     """Get maintenance request with all related data."""
     return db.query(MaintenanceRequest).options(
-        joinedload(MaintenanceRequest.equipment).joinedload(Equipment.maintenance_team),
-        joinedload(MaintenanceRequest.detected_by_user),
-        joinedload(MaintenanceRequest.assigned_technician)
+        *_detail_load_options()
     ).filter(MaintenanceRequest.id == request_id).first()
 
 
+# Related data that GET /{request_id}?include= can add to the detail response
+REQUEST_INCLUDES = ("time_logs", "audit_logs", "hours_total")
+
+
+def get_request_with_includes(
+    db: Session,
+    request_id: UUID,
+    include: set[str]
+) -> tuple[MaintenanceRequest, float | None] | None:
+    """Get maintenance request with all related data, the included children and its total logged hours."""
+    options = list(_detail_load_options())
+    if "time_logs" in include:
+        options.append(selectinload(MaintenanceRequest.time_logs).joinedload(TimeLog.technician).joinedload(Technician.user))
+    if "audit_logs" in include:
+        options.append(selectinload(MaintenanceRequest.audit_logs).joinedload(RequestAuditLog.changed_by_user))
+
+    query = db.query(MaintenanceRequest).options(*options).filter(MaintenanceRequest.id == request_id)
+    if "hours_total" not in include:
+        request = query.first()
+        return (request, None) if request else None
+
+    hours_total = (
+        db.query(func.coalesce(func.sum(TimeLog.hours_spent), 0))
+        .filter(TimeLog.request_id == MaintenanceRequest.id)
+        .correlate(MaintenanceRequest)
+        .scalar_subquery()
+    )
+    row = query.add_columns(hours_total.label("hours_total")).first()
+    return (row[0], float(row[1])) if row else None
+
+
 def get_requests(
     db: Session,
     skip: int = 0,
@@ -31,14 +177,11 @@ def get_requests(
     assigned_to: UUID | None = None,
     stage: RequestStage | None = None,
     request_type: RequestType | None = None,
-    search: str | None = None
-) -> list[MaintenanceRequest]:
-    """Get maintenance requests with optional filters."""
-    query = db.query(MaintenanceRequest).options(
-        joinedload(MaintenanceRequest.equipment),
-        joinedload(MaintenanceRequest.detected_by_user),
-        joinedload(MaintenanceRequest.assigned_technician)
-    )
+    search: str | None = None,
+    fields: list[str] | None = None
+) -> list[MaintenanceRequest] | list[dict]:
+    """Get maintenance requests with optional filters (only the given REQUEST_FIELDS as dicts if fields is set)."""
+    query = db.query(MaintenanceRequest)
     
     if equipment_id:
         query = query.filter(MaintenanceRequest.equipment_id == equipment_id)
@@ -61,7 +204,82 @@ def get_requests(
             )
         )
     
-    return query.order_by(MaintenanceRequest.created_at.desc()).offset(skip).limit(limit).all()
+    query = query.order_by(MaintenanceRequest.created_at.desc())
+    if fields:
+        return [row._asdict() for row in project(query, REQUEST_FIELDS, fields).offset(skip).limit(limit)]
+    return query.options(*_detail_load_options()).offset(skip).limit(limit).all()
+
+
+def _board_filters(
+    equipment_id: UUID | None = None,
+    assigned_to: UUID | None = None,
+    request_type: RequestType | None = None
+) -> list:
+    """Filter clauses shared by the board and its column pages."""
+    filters = []
+    if equipment_id:
+        filters.append(MaintenanceRequest.equipment_id == equipment_id)
+    if assigned_to:
+        filters.append(MaintenanceRequest.assigned_to == assigned_to)
+    if request_type:
+        filters.append(MaintenanceRequest.request_type == request_type)
+    return filters
+
+
+def get_board(
+    db: Session,
+    per_column: int = 20,
+    equipment_id: UUID | None = None,
+    assigned_to: UUID | None = None,
+    request_type: RequestType | None = None
+) -> dict[RequestStage, tuple[int, list[MaintenanceRequest]]]:
+    """Get the first cards and total count of every stage column in one windowed query."""
+    window = db.query(
+        MaintenanceRequest.id.label("id"),
+        func.row_number().over(
+            partition_by=MaintenanceRequest.stage,
+            order_by=(MaintenanceRequest.created_at.desc(), MaintenanceRequest.id.desc())
+        ).label("position"),
+        func.count().over(partition_by=MaintenanceRequest.stage).label("total")
+    ).filter(*_board_filters(equipment_id, assigned_to, request_type)).subquery()
+
+    rows = db.query(MaintenanceRequest, window.c.total).options(
+        *_detail_load_options()
+    ).join(
+        window, window.c.id == MaintenanceRequest.id
+    ).filter(
+        window.c.position <= per_column
+    ).order_by(
+        MaintenanceRequest.stage, window.c.position
+    ).all()
+
+    totals = {stage: 0 for stage in RequestStage}
+    cards = {stage: [] for stage in RequestStage}
+    for request, total in rows:
+        totals[request.stage] = total
+        cards[request.stage].append(request)
+    return {stage: (totals[stage], cards[stage]) for stage in RequestStage}
+
+
+def get_board_column(
+    db: Session,
+    stage: RequestStage,
+    after: tuple[datetime, UUID] | None = None,
+    limit: int = 20,
+    equipment_id: UUID | None = None,
+    assigned_to: UUID | None = None,
+    request_type: RequestType | None = None
+) -> list[MaintenanceRequest]:
+    """Get the next cards of one board column after a (created_at, id) keyset cursor."""
+    query = db.query(MaintenanceRequest).options(*_detail_load_options()).filter(
+        MaintenanceRequest.stage == stage,
+        *_board_filters(equipment_id, assigned_to, request_type)
+    )
+    if after:
+        query = query.filter(tuple_(MaintenanceRequest.created_at, MaintenanceRequest.id) < after)
+    return query.order_by(
+        MaintenanceRequest.created_at.desc(), MaintenanceRequest.id.desc()
+    ).limit(limit).all()
 
 
 def get_equipment_auto_fill_data(db: Session, equipment_id: UUID):
@@ -82,91 +300,218 @@ def get_equipment_auto_fill_data(db: Session, equipment_id: UUID):
 
 
 def create_request(db: Session, request: MaintenanceRequestCreate, detected_by: UUID) -> MaintenanceRequest:
-    """Create a new maintenance request."""
-    db_request = MaintenanceRequest(
-        **request.model_dump(exclude={'scheduled_date'}),
-        detected_by=detected_by,
-        scheduled_date=request.scheduled_date
-    )
-    db.add(db_request)
-    db.flush()
-    
-    # Create audit log for initial creation
-    audit_log = RequestAuditLog(
-        request_id=db_request.id,
-        changed_by=detected_by,
-        old_stage=None,
-        new_stage=RequestStage.new
-    )
-    db.add(audit_log)
-    
-    db.commit()
+    """Create a new maintenance request, optionally assigned to the least loaded technician of its team."""
+    team_id = _equipment_team_id(db, request.equipment_id)
+    assigned_to = load_index.pick(db, team_id) if request.auto_assign and team_id else None
+    try:
+        db_request = MaintenanceRequest(
+            **request.model_dump(exclude={'scheduled_date', 'auto_assign'}),
+            detected_by=detected_by,
+            scheduled_date=request.scheduled_date,
+            assigned_to=assigned_to
+        )
+        db.add(db_request)
+        db.flush()
+        
+        # Create audit log for initial creation
+        audit_log = RequestAuditLog(
+            request_id=db_request.id,
+            changed_by=detected_by,
+            old_stage=None,
+            new_stage=RequestStage.new
+        )
+        db.add(audit_log)
+        record_change(db, ChangeEntity.maintenance_request, db_request.id, ChangeOperation.upsert)
+        _publish_request_event(db, "request.created", db_request, team_id)
+        invalidate_calendar_months(db, db_request.scheduled_date)
+        
+        db.commit()
+    except Exception:
+        # The request was never created: release the load pick() reserved
+        load_index.adjust(assigned_to, -1)
+        raise
     db.refresh(db_request)
     return db_request
 
 
+def _update_request_with_audit(db: Session, request_id: UUID, values: dict, changed_by: UUID):
+    """Update a request, insert its stage change audit row and read its team in one statement.
+
+    Returns (request, old stage, old scheduled date, old assignee, team id) or None.
+    """
+    if not values:
+        return db.execute(
+            select(
+                MaintenanceRequest, MaintenanceRequest.stage, MaintenanceRequest.scheduled_date,
+                MaintenanceRequest.assigned_to, Equipment.maintenance_team_id
+            ).join(*_equipment_join).where(MaintenanceRequest.id == request_id)
+        ).first()
+    old = locked_old_values(
+        MaintenanceRequest, request_id,
+        (MaintenanceRequest.stage, MaintenanceRequest.scheduled_date, MaintenanceRequest.assigned_to)
+    )
+    updated = update(MaintenanceRequest.__table__).where(
+        MaintenanceRequest.id == old.c.id,
+        Equipment.id == MaintenanceRequest.equipment_id
+    ).values(values).returning(
+        *MaintenanceRequest.__table__.c,
+        old.c.stage.label("old_stage"),
+        old.c.scheduled_date.label("old_scheduled_date"),
+        old.c.assigned_to.label("old_assigned_to"),
+        Equipment.maintenance_team_id.label("team_id")
+    ).cte("updated")
+    audit = insert(RequestAuditLog).from_select(
+        ["id", "request_id", "old_stage", "new_stage", "changed_by", "changed_at"],
+        select(
+            func.uuid_generate_v4(), updated.c.id, updated.c.old_stage, updated.c.stage,
+            literal(changed_by, RequestAuditLog.changed_by.type), literal(datetime.utcnow())
+        ).where(updated.c.stage != updated.c.old_stage)
+    ).cte("audit")
+    return db.execute(
+        select(
+            aliased(MaintenanceRequest, updated),
+            updated.c.old_stage, updated.c.old_scheduled_date, updated.c.old_assigned_to, updated.c.team_id
+        ).add_cte(audit).execution_options(populate_existing=True)
+    ).first()
+
+
 def update_request(
     db: Session,
     request_id: UUID,
     request: MaintenanceRequestUpdate,
     changed_by: UUID
 ) -> MaintenanceRequest | None:
-    """Update a maintenance request."""
-    db_request = get_request(db, request_id)
-    if not db_request:
+    """Update a maintenance request, auditing stage changes."""
+    row = _update_request_with_audit(db, request_id, request.model_dump(exclude_unset=True), changed_by)
+    if not row:
+        db.rollback()
         return None
     
-    old_stage = db_request.stage
-    update_data = request.model_dump(exclude_unset=True)
+    db_request, old_stage, old_scheduled_date, old_assigned_to, team_id = row
+    old_assignee = old_assigned_to if old_stage in OPEN_STAGES else None
+    record_change(db, ChangeEntity.maintenance_request, request_id, ChangeOperation.upsert)
+    _publish_request_event(db, "request.updated", db_request, team_id)
+    invalidate_calendar_months(db, old_scheduled_date, db_request.scheduled_date)
     
-    # Handle stage transitions
-    new_stage = update_data.get('stage')
-    if new_stage and new_stage != old_stage:
-        # Create audit log for stage change
-        audit_log = RequestAuditLog(
-            request_id=request_id,
-            changed_by=changed_by,
-            old_stage=old_stage,
-            new_stage=new_stage
-        )
-        db.add(audit_log)
-    
-    # Apply updates
-    for field, value in update_data.items():
-        setattr(db_request, field, value)
-    
-    db.commit()
-    db.refresh(db_request)
+    commit_returning(db, db_request)
+    new_assignee = _open_assignee(db_request)
+    if new_assignee != old_assignee:
+        load_index.adjust(old_assignee, -1)
+        load_index.adjust(new_assignee, 1)
     return db_request
 
 
 def delete_request(db: Session, request_id: UUID) -> bool:
-    """Delete a maintenance request."""
-    db_request = get_request(db, request_id)
-    if not db_request:
+    """Delete a maintenance request (its time logs and audit trail go through ON DELETE CASCADE)."""
+    record_request_cascade_deletes(db, [request_id])
+    remove_request_time_logs(db, [request_id])
+    deleted = delete_returning(
+        db, MaintenanceRequest, request_id,
+        MaintenanceRequest.equipment_id, MaintenanceRequest.stage,
+        MaintenanceRequest.scheduled_date, MaintenanceRequest.assigned_to
+    )
+    if not deleted:
+        db.rollback()
         return False
     
-    db.delete(db_request)
+    _, equipment_id, stage, scheduled_date, assigned_to = deleted
+    record_change(db, ChangeEntity.maintenance_request, request_id, ChangeOperation.delete)
+    publish_event(db, build_request_event(
+        "request.deleted", request_id, _equipment_team_id(db, equipment_id), equipment_id, stage.value
+    ))
+    invalidate_calendar_months(db, scheduled_date)
     db.commit()
+    load_index.adjust(assigned_to if stage in OPEN_STAGES else None, -1)
     return True
 
 
 def get_calendar_requests(db: Session, start_date: datetime, end_date: datetime) -> list[MaintenanceRequest]:
     """Get all requests scheduled within a date range (for calendar view)."""
     return db.query(MaintenanceRequest).options(
-        joinedload(MaintenanceRequest.equipment),
-        joinedload(MaintenanceRequest.assigned_technician)
+        *_detail_load_options()
     ).filter(
         MaintenanceRequest.scheduled_date.between(start_date, end_date)
     ).all()
 
 
+def get_calendar_day_requests(db: Session, day: date, limit: int) -> list[MaintenanceRequest]:
+    """Get the requests scheduled on a single day, capped at limit."""
+    return db.query(MaintenanceRequest).options(
+        *_detail_load_options()
+    ).filter(
+        MaintenanceRequest.scheduled_date == day
+    ).order_by(MaintenanceRequest.created_at, MaintenanceRequest.id).limit(limit).all()
+
+
+def _load_calendar_month(db: Session, year: int, month: int) -> list[dict]:
+    """Count one month's requests per day, stage and type in a single GROUP BY."""
+    month_start = date(year, month, 1)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    rows = db.query(
+        MaintenanceRequest.scheduled_date,
+        MaintenanceRequest.stage,
+        MaintenanceRequest.request_type,
+        func.count(MaintenanceRequest.id)
+    ).filter(
+        MaintenanceRequest.scheduled_date >= month_start,
+        MaintenanceRequest.scheduled_date < next_month
+    ).group_by(
+        MaintenanceRequest.scheduled_date,
+        MaintenanceRequest.stage,
+        MaintenanceRequest.request_type
+    ).all()
+
+    days: dict[date, dict] = {}
+    for scheduled_date, stage, request_type, count in rows:
+        day = days.setdefault(scheduled_date, {"date": scheduled_date, "total": 0, "by_stage": {}, "by_type": {}})
+        day["total"] += count
+        day["by_stage"][stage] = day["by_stage"].get(stage, 0) + count
+        day["by_type"][request_type] = day["by_type"].get(request_type, 0) + count
+    return [days[day] for day in sorted(days)]
+
+
+def get_calendar_day_counts(db: Session, start_date: date, end_date: date) -> list[dict]:
+    """Get per-day request counts by stage and type, served from cached month buckets."""
+    result = []
+    month_start = start_date.replace(day=1)
+    while month_start <= end_date:
+        month_days = calendar_month_cache.get_or_load(
+            (month_start.year, month_start.month),
+            lambda: _load_calendar_month(db, month_start.year, month_start.month)
+        )
+        result.extend(day for day in month_days if start_date <= day["date"] <= end_date)
+        month_start = (month_start + timedelta(days=32)).replace(day=1)
+    return result
+
+
 def get_overdue_requests(db: Session) -> list[MaintenanceRequest]:
     """Get all overdue maintenance requests."""
     now = datetime.utcnow()
-    return db.query(MaintenanceRequest).filter(
+    return db.query(MaintenanceRequest).options(
+        *_detail_load_options()
+    ).filter(
         and_(
             MaintenanceRequest.scheduled_date < now,
             MaintenanceRequest.stage.in_([RequestStage.new, RequestStage.in_progress])
         )
     ).all()
+
+
+def flag_overdue_requests(db: Session) -> int:
+    """Bring the stored overdue flag in line with scheduled dates and stages; returns requests changed."""
+    today = datetime.utcnow().date()
+    is_overdue = and_(MaintenanceRequest.scheduled_date < today, MaintenanceRequest.stage.in_(OPEN_STAGES))
+    flagged = db.execute(
+        update(MaintenanceRequest).where(
+            MaintenanceRequest.overdue.is_(False), is_overdue
+        ).values(overdue=True).returning(MaintenanceRequest.id)
+    ).scalars().all()
+    cleared = db.execute(
+        update(MaintenanceRequest).where(
+            MaintenanceRequest.overdue.is_(True),
+            or_(MaintenanceRequest.scheduled_date.is_(None), ~is_overdue)
+        ).values(overdue=False).returning(MaintenanceRequest.id)
+    ).scalars().all()
+    record_changes(db, ChangeEntity.maintenance_request, [*flagged, *cleared], ChangeOperation.upsert)
+    db.commit()
+    return len(flagged) + len(cleared)
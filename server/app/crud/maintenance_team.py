@@ -3,6 +3,8 @@ from sqlalchemy.orm import Session
 
 from app.models.maintenance_team import MaintenanceTeam
 from app.schemas.maintenance_team import MaintenanceTeamCreate, MaintenanceTeamUpdate
+from app.crud.batch import get_by_ids
+from app.crud.returning import update_returning, delete_returning, commit_returning
 
 
 def get_team(db: Session, team_id: UUID) -> MaintenanceTeam | None:
@@ -10,6 +12,11 @@ def get_team(db: Session, team_id: UUID) -> MaintenanceTeam | None:
     return db.query(MaintenanceTeam).filter(MaintenanceTeam.id == team_id).first()
 
 
+def get_teams_by_ids(db: Session, team_ids: list[UUID]) -> dict[UUID, MaintenanceTeam]:
+    """Get maintenance teams by a list of IDs in one query."""
+    return get_by_ids(db, MaintenanceTeam, team_ids)
+
+
 def get_teams(db: Session, skip: int = 0, limit: int = 100) -> list[MaintenanceTeam]:
     """Get all maintenance teams."""
     return db.query(MaintenanceTeam).offset(skip).limit(limit).all()
@@ -26,25 +33,12 @@ def create_team(db: Session, team: MaintenanceTeamCreate) -> MaintenanceTeam:
 
 def update_team(db: Session, team_id: UUID, team: MaintenanceTeamUpdate) -> MaintenanceTeam | None:
     """Update a maintenance team."""
-    db_team = get_team(db, team_id)
-    if not db_team:
-        return None
-    
-    update_data = team.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_team, field, value)
-    
-    db.commit()
-    db.refresh(db_team)
-    return db_team
+    db_team = update_returning(db, MaintenanceTeam, team_id, team.model_dump(exclude_unset=True))
+    return commit_returning(db, db_team)
 
 
 def delete_team(db: Session, team_id: UUID) -> bool:
     """Delete a maintenance team."""
-    db_team = get_team(db, team_id)
-    if not db_team:
-        return False
-    
-    db.delete(db_team)
+    deleted = delete_returning(db, MaintenanceTeam, team_id)
     db.commit()
-    return True
+    return deleted is not None
@@ -0,0 +1,226 @@
+import calendar
+from collections.abc import Callable
+from uuid import UUID
+from datetime import datetime, date, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, and_, select, literal, cast, union_all, bindparam, Date
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert
+
+from app.core.config import settings
+from app.models.preventive_schedule import PreventiveSchedule, ScheduleUnit
+from app.models.maintenance_request import MaintenanceRequest, RequestStage, RequestType
+from app.models.equipment import Equipment, EquipmentStatus
+from app.models.request_audit_log import RequestAuditLog
+from app.models.change_log import ChangeLog, ChangeEntity, ChangeOperation
+from app.crud.maintenance_request import invalidate_calendar_months
+from app.crud.returning import update_returning, delete_returning, commit_returning
+from app.schemas.preventive_schedule import PreventiveScheduleCreate, PreventiveScheduleUpdate
+
+# Changing any of these re-plans the schedule from today
+_RULE_FIELDS = {"interval_unit", "interval_count", "start_date", "end_date"}
+
+
+def get_schedule(db: Session, schedule_id: UUID) -> PreventiveSchedule | None:
+    """Get a preventive schedule by ID."""
+    return db.query(PreventiveSchedule).filter(PreventiveSchedule.id == schedule_id).first()
+
+
+def get_schedules(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    equipment_id: UUID | None = None,
+    category: str | None = None,
+    is_active: bool | None = None
+) -> list[PreventiveSchedule]:
+    """Get preventive schedules with optional filters."""
+    query = db.query(PreventiveSchedule)
+
+    if equipment_id:
+        query = query.filter(PreventiveSchedule.equipment_id == equipment_id)
+
+    if category:
+        query = query.filter(PreventiveSchedule.category == category)
+
+    if is_active is not None:
+        query = query.filter(PreventiveSchedule.is_active == is_active)
+
+    return query.order_by(PreventiveSchedule.created_at).offset(skip).limit(limit).all()
+
+
+def create_schedule(db: Session, schedule: PreventiveScheduleCreate, created_by: UUID) -> PreventiveSchedule:
+    """Create a new preventive schedule."""
+    db_schedule = PreventiveSchedule(**schedule.model_dump(), created_by=created_by)
+    db.add(db_schedule)
+    db.commit()
+    db.refresh(db_schedule)
+    return db_schedule
+
+
+def update_schedule(db: Session, schedule_id: UUID, schedule: PreventiveScheduleUpdate) -> PreventiveSchedule | None:
+    """Update a preventive schedule."""
+    update_data = schedule.model_dump(exclude_unset=True)
+    if _RULE_FIELDS & update_data.keys():
+        # Already generated requests stay; the next run plans the new rule from today
+        update_data["generated_through"] = None
+
+    db_schedule = update_returning(db, PreventiveSchedule, schedule_id, update_data)
+    return commit_returning(db, db_schedule)
+
+
+def delete_schedule(db: Session, schedule_id: UUID) -> bool:
+    """Delete a preventive schedule (its generated requests are kept)."""
+    deleted = delete_returning(db, PreventiveSchedule, schedule_id)
+    db.commit()
+    return deleted is not None
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def schedule_occurrences(schedule: PreventiveSchedule, first: date, last: date) -> list[date]:
+    """Occurrence dates of a schedule between two dates (inclusive)."""
+    last = min(last, schedule.end_date) if schedule.end_date else last
+    first = max(first, schedule.start_date)
+    if first > last:
+        return []
+
+    if schedule.interval_unit == ScheduleUnit.month:
+        # Whole months from the anchor, backed off one step in case of day clamping
+        months = (first.year - schedule.start_date.year) * 12 + first.month - schedule.start_date.month
+        step = max(months // schedule.interval_count - 1, 0)
+        occurrences = []
+        while (day := _add_months(schedule.start_date, step * schedule.interval_count)) <= last:
+            if day >= first:
+                occurrences.append(day)
+            step += 1
+        return occurrences
+
+    step_days = schedule.interval_count * (7 if schedule.interval_unit == ScheduleUnit.week else 1)
+    offset = -(-(first - schedule.start_date).days // step_days) * step_days
+    day = schedule.start_date + timedelta(days=offset)
+    occurrences = []
+    while day <= last:
+        occurrences.append(day)
+        day += timedelta(days=step_days)
+    return occurrences
+
+
+def _occurrence_table(pairs: list[tuple[UUID, date]]):
+    """(schedule_id, scheduled_date) rows for the pairs, as one array unnest."""
+    return func.unnest(
+        bindparam("schedule_ids", [schedule_id for schedule_id, _ in pairs], type_=ARRAY(PG_UUID(as_uuid=True))),
+        bindparam("scheduled_dates", [day for _, day in pairs], type_=ARRAY(Date))
+    ).table_valued("schedule_id", "scheduled_date").render_derived(name="occurrence")
+
+
+def _insert_occurrences(db: Session, occurrence, run_at: datetime) -> list:
+    """Insert one preventive request per occurrence and target asset, skipping existing ones.
+
+    The creation audit rows and change log rows are inserted from the new
+    requests in the same statement. Returns (scheduled_date, count) per date.
+    """
+    def requests_for(target_match):
+        return select(
+            func.uuid_generate_v4(),
+            PreventiveSchedule.subject,
+            PreventiveSchedule.description,
+            # Typed casts: inside UNION ALL a bare string literal would resolve to text
+            cast(literal(RequestType.preventive.value), MaintenanceRequest.request_type.type),
+            Equipment.id,
+            PreventiveSchedule.created_by,
+            occurrence.c.scheduled_date,
+            cast(literal(RequestStage.new.value), MaintenanceRequest.stage.type),
+            literal(False),
+            literal(run_at),
+            PreventiveSchedule.id
+        ).select_from(occurrence).join(
+            PreventiveSchedule, PreventiveSchedule.id == occurrence.c.schedule_id
+        ).join(
+            Equipment, target_match
+        ).where(Equipment.status == EquipmentStatus.active)
+
+    inserted = insert(MaintenanceRequest).from_select(
+        ["id", "subject", "description", "request_type", "equipment_id", "detected_by",
+         "scheduled_date", "stage", "overdue", "created_at", "schedule_id"],
+        union_all(
+            requests_for(Equipment.id == PreventiveSchedule.equipment_id),
+            requests_for(and_(PreventiveSchedule.equipment_id.is_(None), Equipment.category == PreventiveSchedule.category))
+        )
+    ).on_conflict_do_nothing(
+        index_elements=[MaintenanceRequest.schedule_id, MaintenanceRequest.equipment_id, MaintenanceRequest.scheduled_date]
+    ).returning(MaintenanceRequest.id, MaintenanceRequest.detected_by, MaintenanceRequest.scheduled_date).cte("inserted")
+    audit = insert(RequestAuditLog).from_select(
+        ["id", "request_id", "new_stage", "changed_by", "changed_at"],
+        select(
+            func.uuid_generate_v4(), inserted.c.id, literal(RequestStage.new, RequestAuditLog.new_stage.type),
+            inserted.c.detected_by, literal(run_at)
+        )
+    ).cte("audit")
+    changes = insert(ChangeLog).from_select(
+        ["entity_type", "entity_id", "operation"],
+        select(
+            literal(ChangeEntity.maintenance_request, ChangeLog.entity_type.type), inserted.c.id,
+            literal(ChangeOperation.upsert, ChangeLog.operation.type)
+        )
+    ).cte("changes")
+    return db.execute(
+        select(inserted.c.scheduled_date, func.count()).group_by(inserted.c.scheduled_date).add_cte(audit, changes)
+    ).all()
+
+
+def generate_preventive_requests(
+    db: Session,
+    horizon_days: int | None = None,
+    progress: Callable[[int], None] | None = None
+) -> dict:
+    """Materialize preventive requests for active schedules up to the horizon; safe to re-run.
+
+    progress, if given, is called with the number of schedules done after each batch.
+    """
+    today = datetime.utcnow().date()
+    horizon_end = today + timedelta(days=horizon_days or settings.PM_HORIZON_DAYS)
+    schedules_done = 0
+    created = 0
+
+    last_id = None
+    while True:
+        query = db.query(PreventiveSchedule).filter(
+            PreventiveSchedule.is_active.is_(True),
+            or_(PreventiveSchedule.end_date.is_(None), PreventiveSchedule.end_date >= today),
+            or_(PreventiveSchedule.generated_through.is_(None), PreventiveSchedule.generated_through < horizon_end)
+        )
+        if last_id is not None:
+            query = query.filter(PreventiveSchedule.id > last_id)
+        schedules = query.order_by(PreventiveSchedule.id).limit(settings.PM_GENERATE_BATCH_SIZE).all()
+        if not schedules:
+            break
+        last_id = schedules[-1].id
+
+        # Only days after generated_through, so requests deleted by hand are not recreated
+        pairs = [
+            (schedule.id, day)
+            for schedule in schedules
+            for day in schedule_occurrences(
+                schedule,
+                max(today, schedule.generated_through + timedelta(days=1)) if schedule.generated_through else today,
+                horizon_end
+            )
+        ]
+        run_at = datetime.utcnow()
+        dates = _insert_occurrences(db, _occurrence_table(pairs), run_at) if pairs else []
+        db.query(PreventiveSchedule).filter(
+            PreventiveSchedule.id.in_([schedule.id for schedule in schedules])
+        ).update({PreventiveSchedule.generated_through: horizon_end}, synchronize_session=False)
+        invalidate_calendar_months(db, *(day for day, _ in dates))
+        db.commit()
+
+        schedules_done += len(schedules)
+        created += sum(count for _, count in dates)
+        if progress:
+            progress(schedules_done)
+
+    return {"schedules": schedules_done, "created": created, "generated_through": horizon_end}
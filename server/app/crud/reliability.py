@@ -0,0 +1,149 @@
+from collections.abc import Callable
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, or_, func, cast, exists, tuple_, Float
+
+from app.models.request_audit_log import RequestAuditLog
+from app.models.maintenance_request import MaintenanceRequest, RequestStage, RequestType
+from app.models.equipment import Equipment
+from app.models.equipment_reliability import EquipmentReliabilityStats
+from app.crud.rollup import upsert, run_incremental
+
+RELIABILITY_WATERMARK = "equipment_reliability"
+
+_STATS_COLUMNS = ("repair_count", "repair_seconds", "failure_count", "first_failure_at", "last_failure_at")
+
+
+def _empty_stats(equipment_id) -> dict:
+    return {"equipment_id": equipment_id, "repair_count": 0, "repair_seconds": 0,
+            "failure_count": 0, "first_failure_at": None, "last_failure_at": None}
+
+
+def _apply_batch(db: Session, rows) -> None:
+    """Fold one batch of audit rows into the per-equipment totals."""
+    equipment_ids = {row.equipment_id for row in rows}
+    stats = {
+        existing.equipment_id: {column: getattr(existing, column) for column in ("equipment_id", *_STATS_COLUMNS)}
+        for existing in db.query(EquipmentReliabilityStats).filter(
+            EquipmentReliabilityStats.equipment_id.in_(equipment_ids)
+        )
+    }
+
+    for row in rows:
+        entry = stats.setdefault(row.equipment_id, _empty_stats(row.equipment_id))
+        if row.old_stage is None:
+            # Corrective request opened: a failure. Rows arrive in time order.
+            entry["failure_count"] += 1
+            entry["first_failure_at"] = entry["first_failure_at"] or row.changed_at
+            entry["last_failure_at"] = row.changed_at
+        else:
+            entry["repair_count"] += 1
+            entry["repair_seconds"] += max(int((row.changed_at - row.created_at).total_seconds()), 0)
+
+    # The watermark lock makes this job the only writer, so whole rows can be replaced
+    upsert(
+        db, EquipmentReliabilityStats, list(stats.values()), [EquipmentReliabilityStats.equipment_id],
+        lambda excluded: {column: getattr(excluded, column) for column in _STATS_COLUMNS}
+    )
+
+
+def _reliability_source(db: Session):
+    """Audit rows that open a corrective request (a failure) or first mark it repaired.
+
+    A reopened request that is repaired again is one repair, timed to its first
+    repair, so later moves into repaired are skipped.
+    """
+    earlier = aliased(RequestAuditLog)
+    earlier_repair = exists().where(
+        earlier.request_id == RequestAuditLog.request_id,
+        earlier.new_stage == RequestStage.repaired,
+        tuple_(earlier.changed_at, earlier.id) < tuple_(RequestAuditLog.changed_at, RequestAuditLog.id)
+    )
+    return db.query(
+        RequestAuditLog.id,
+        RequestAuditLog.changed_at,
+        RequestAuditLog.old_stage,
+        MaintenanceRequest.equipment_id,
+        MaintenanceRequest.created_at
+    ).join(
+        MaintenanceRequest, RequestAuditLog.request_id == MaintenanceRequest.id
+    ).filter(
+        MaintenanceRequest.request_type == RequestType.corrective,
+        or_(
+            RequestAuditLog.old_stage.is_(None),
+            and_(RequestAuditLog.new_stage == RequestStage.repaired,
+                 RequestAuditLog.old_stage != RequestStage.repaired,
+                 ~earlier_repair)
+        )
+    )
+
+
+def refresh_reliability_stats(db: Session, progress: Callable[[int], None] | None = None) -> int:
+    """Apply audit rows past the watermark to the reliability stats; returns rows processed."""
+    return run_incremental(
+        db, RELIABILITY_WATERMARK, lambda: _reliability_source(db),
+        RequestAuditLog.changed_at, RequestAuditLog.id, lambda rows: _apply_batch(db, rows), progress
+    )
+
+
+def _mttr_hours(repair_seconds, repair_count):
+    return repair_seconds / repair_count / 3600 if repair_count else None
+
+
+def _mtbf_hours(span_seconds, intervals):
+    return span_seconds / intervals / 3600 if intervals else None
+
+
+def get_equipment_reliability(db: Session, category: str | None = None, limit: int = 100) -> list[dict]:
+    """Get MTTR and MTBF per equipment, least reliable (shortest MTBF) first."""
+    stats = EquipmentReliabilityStats
+    mttr_hours = cast(stats.repair_seconds, Float) / func.nullif(stats.repair_count, 0) / 3600
+    mtbf_hours = (
+        func.extract("epoch", stats.last_failure_at - stats.first_failure_at)
+        / func.nullif(stats.failure_count - 1, 0) / 3600
+    )
+    query = db.query(
+        Equipment.id.label("equipment_id"),
+        Equipment.name.label("equipment_name"),
+        Equipment.category,
+        stats.repair_count,
+        mttr_hours.label("mttr_hours"),
+        stats.failure_count,
+        mtbf_hours.label("mtbf_hours")
+    ).join(stats, stats.equipment_id == Equipment.id)
+
+    if category:
+        query = query.filter(Equipment.category == category)
+
+    rows = query.order_by(mtbf_hours.asc().nulls_last(), Equipment.name).limit(limit).all()
+    return [row._asdict() for row in rows]
+
+
+def get_category_reliability(db: Session) -> list[dict]:
+    """Get MTTR and MTBF per equipment category from the per-equipment totals."""
+    totals = {}
+    for category, stats in db.query(Equipment.category, EquipmentReliabilityStats).join(
+        EquipmentReliabilityStats, EquipmentReliabilityStats.equipment_id == Equipment.id
+    ):
+        entry = totals.setdefault(category, {
+            "category": category, "equipment_count": 0, "repair_count": 0, "repair_seconds": 0,
+            "failure_count": 0, "span_seconds": 0.0, "intervals": 0
+        })
+        entry["equipment_count"] += 1
+        entry["repair_count"] += stats.repair_count
+        entry["repair_seconds"] += stats.repair_seconds
+        entry["failure_count"] += stats.failure_count
+        if stats.failure_count > 1:
+            entry["span_seconds"] += (stats.last_failure_at - stats.first_failure_at).total_seconds()
+            entry["intervals"] += stats.failure_count - 1
+
+    return [
+        {
+            "category": entry["category"],
+            "equipment_count": entry["equipment_count"],
+            "repair_count": entry["repair_count"],
+            "mttr_hours": _mttr_hours(entry["repair_seconds"], entry["repair_count"]),
+            "failure_count": entry["failure_count"],
+            "mtbf_hours": _mtbf_hours(entry["span_seconds"], entry["intervals"]),
+        }
+        for entry in sorted(totals.values(), key=lambda entry: entry["category"] or "")
+    ]
@@ -0,0 +1,61 @@
+"""
+Single-statement writes for the crud update_* and delete_* functions.
+
+update_returning() runs UPDATE ... WHERE id = :id RETURNING <row> and
+delete_returning() runs DELETE ... WHERE id = :id RETURNING id, so a write is
+one round trip instead of a SELECT, the write and a refresh SELECT. A missing
+row comes back as None. Deletes rely on the ON DELETE rules in init.sql for
+child rows instead of loading them through ORM cascades.
+
+Writes that also need the row's values from before the update (rollup deltas,
+cache invalidation, load index changes) use update_returning_old(). The old
+values come from a FOR UPDATE subquery joined into the same UPDATE, so the
+statement still sees the latest committed row.
+"""
+from uuid import UUID
+
+from sqlalchemy import update, delete, select
+from sqlalchemy.orm import Session
+
+
+def locked_old_values(model, entity_id: UUID, old_columns):
+    """FOR UPDATE subquery of the row's current values, to join into an UPDATE."""
+    return select(model.id, *old_columns).where(model.id == entity_id).with_for_update().subquery("old")
+
+
+def update_returning(db: Session, model, entity_id: UUID, values: dict):
+    """Update one row by id; returns the updated entity, or None if it does not exist."""
+    if not values:
+        return db.get(model, entity_id)
+    return db.execute(update(model).where(model.id == entity_id).values(values).returning(model)).scalar_one_or_none()
+
+
+def update_returning_old(db: Session, model, entity_id: UUID, values: dict, *old_columns) -> tuple | None:
+    """Update one row by id; returns (entity, *values of old_columns before the update), or None."""
+    if not values:
+        row = db.execute(select(model, *old_columns).where(model.id == entity_id)).first()
+    else:
+        old = locked_old_values(model, entity_id, old_columns)
+        row = db.execute(
+            update(model).where(model.id == old.c.id).values(values).returning(
+                model, *(old.c[column.key] for column in old_columns)
+            )
+        ).first()
+    return tuple(row) if row is not None else None
+
+
+def delete_returning(db: Session, model, entity_id: UUID, *columns):
+    """Delete one row by id; returns its id and columns, or None if it did not exist."""
+    return db.execute(delete(model).where(model.id == entity_id).returning(model.id, *columns)).first()
+
+
+def commit_returning(db: Session, entity):
+    """Commit and return entity with its RETURNING values still loaded.
+
+    The entity is detached first: commit would expire it, and reading it to
+    build the response would then SELECT the row again.
+    """
+    if entity is not None and entity in db:
+        db.expunge(entity)
+    db.commit()
+    return entity
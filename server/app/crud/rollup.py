@@ -0,0 +1,83 @@
+"""
+Shared plumbing for the report rollup tables.
+
+Rollups are written with a single multi-row upsert. Incremental jobs read their
+source in (timestamp, id) order past a stored watermark, locking the watermark
+row so two workers never apply the same rows twice. Rows newer than
+ANALYTICS_SETTLE_SECONDS are left for the next run: a transaction can commit
+a row whose timestamp is older than rows already visible, and the settle
+window keeps the watermark from moving past it.
+"""
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy.orm import Session, Query
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.models.analytics_watermark import AnalyticsWatermark
+
+# Sorts after every id, so (cutoff, MAX_UUID) means "everything up to cutoff"
+MAX_UUID = UUID("ffffffff-ffff-ffff-ffff-ffffffffffff")
+
+
+def upsert(db: Session, model, rows: list[dict], index_elements: list, update: Callable) -> None:
+    """Insert rows, resolving key conflicts with update(excluded) -> column values."""
+    if not rows:
+        return
+    stmt = insert(model).values(rows)
+    db.execute(stmt.on_conflict_do_update(index_elements=index_elements, set_=update(stmt.excluded)))
+
+
+def lock_watermark(db: Session, name: str) -> AnalyticsWatermark:
+    """Get a job's watermark row, creating it on first use, locked until the transaction ends."""
+    db.execute(insert(AnalyticsWatermark).values(name=name).on_conflict_do_nothing(index_elements=["name"]))
+    return db.query(AnalyticsWatermark).filter(AnalyticsWatermark.name == name).with_for_update().one()
+
+
+def settled_cutoff() -> datetime:
+    """Latest source timestamp an incremental job may read this run."""
+    return datetime.utcnow() - timedelta(seconds=settings.ANALYTICS_SETTLE_SECONDS)
+
+
+def run_incremental(
+    db: Session,
+    name: str,
+    source: Callable[[], Query],
+    timestamp_column,
+    id_column,
+    apply_batch: Callable[[list], None],
+    progress: Callable[[int], None] | None = None
+) -> int:
+    """Feed settled source rows past the watermark to apply_batch, one committed batch at a time.
+
+    source() builds the query of source rows; it must select timestamp_column and
+    id_column. progress, if given, is called with the rows processed so far after
+    each committed batch. Returns the number of rows processed.
+    """
+    cutoff = settled_cutoff()
+    processed = 0
+    while True:
+        watermark = lock_watermark(db, name)
+        query = source().filter(timestamp_column <= cutoff)
+        if watermark.position_at is not None:
+            query = query.filter(tuple_(timestamp_column, id_column) > (watermark.position_at, watermark.position_id))
+        rows = query.order_by(timestamp_column, id_column).limit(settings.ANALYTICS_BATCH_SIZE).all()
+
+        apply_batch(rows)
+        processed += len(rows)
+        done = len(rows) < settings.ANALYTICS_BATCH_SIZE
+        if done:
+            watermark.position_at, watermark.position_id = cutoff, MAX_UUID
+        else:
+            last = rows[-1]
+            watermark.position_at = getattr(last, timestamp_column.key)
+            watermark.position_id = getattr(last, id_column.key)
+        watermark.refreshed_at = datetime.utcnow()
+        db.commit()
+        if progress:
+            progress(processed)
+        if done:
+            return processed
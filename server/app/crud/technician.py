@@ -2,30 +2,56 @@ from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.technician import Technician
+from app.core.fields import field_spec, project
+from app.core.assignment import load_index
+from app.crud.batch import get_by_ids
+from app.crud.returning import update_returning, delete_returning, commit_returning
 from app.schemas.technician import TechnicianCreate, TechnicianUpdate
 
 
+# Fields selectable with fields= on the technician list (TechnicianDetailResponse keys)
+TECHNICIAN_FIELDS = {
+    "id": field_spec(Technician.id),
+    "user_id": field_spec(Technician.user_id),
+    "team_id": field_spec(Technician.team_id),
+    "is_active": field_spec(Technician.is_active),
+}
+
+
 def get_technician(db: Session, technician_id: UUID) -> Technician | None:
     """Get a technician by ID."""
     return db.query(Technician).filter(Technician.id == technician_id).first()
 
 
+def get_technicians_by_ids(db: Session, technician_ids: list[UUID]) -> dict[UUID, Technician]:
+    """Get technicians by a list of IDs in one query."""
+    return get_by_ids(db, Technician, technician_ids)
+
+
 def get_technician_by_user_id(db: Session, user_id: UUID) -> Technician | None:
     """Get a technician by user ID."""
     return db.query(Technician).filter(Technician.user_id == user_id).first()
 
 
-def get_technicians(db: Session, skip: int = 0, limit: int = 100, team_id: UUID | None = None) -> list[Technician]:
-    """Get all technicians with optional team filter."""
-    query = db.query(Technician).options(
-        joinedload(Technician.user),
-        joinedload(Technician.team)
-    )
+def get_technicians(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    team_id: UUID | None = None,
+    fields: list[str] | None = None
+) -> list[Technician] | list[dict]:
+    """Get all technicians with optional team filter (only the given TECHNICIAN_FIELDS as dicts if fields is set)."""
+    query = db.query(Technician)
     
     if team_id:
         query = query.filter(Technician.team_id == team_id)
     
-    return query.offset(skip).limit(limit).all()
+    if fields:
+        return [row._asdict() for row in project(query, TECHNICIAN_FIELDS, fields).offset(skip).limit(limit)]
+    return query.options(
+        joinedload(Technician.user),
+        joinedload(Technician.team)
+    ).offset(skip).limit(limit).all()
 
 
 def create_technician(db: Session, technician: TechnicianCreate) -> Technician:
@@ -34,30 +60,28 @@ def create_technician(db: Session, technician: TechnicianCreate) -> Technician:
     db.add(db_technician)
     db.commit()
     db.refresh(db_technician)
+    load_index.set_technician(db_technician.id, db_technician.team_id, db_technician.is_active, load=0)
     return db_technician
 
 
 def update_technician(db: Session, technician_id: UUID, technician: TechnicianUpdate) -> Technician | None:
     """Update a technician."""
-    db_technician = get_technician(db, technician_id)
+    db_technician = update_returning(db, Technician, technician_id, technician.model_dump(exclude_unset=True))
     if not db_technician:
+        db.rollback()
         return None
     
-    update_data = technician.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_technician, field, value)
-    
-    db.commit()
-    db.refresh(db_technician)
+    commit_returning(db, db_technician)
+    load_index.set_technician(db_technician.id, db_technician.team_id, db_technician.is_active)
     return db_technician
 
 
 def delete_technician(db: Session, technician_id: UUID) -> bool:
     """Delete a technician."""
-    db_technician = get_technician(db, technician_id)
-    if not db_technician:
+    deleted = delete_returning(db, Technician, technician_id)
+    db.commit()
+    if not deleted:
         return False
     
-    db.delete(db_technician)
-    db.commit()
+    load_index.set_technician(technician_id, None)
     return True
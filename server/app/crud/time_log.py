@@ -2,26 +2,58 @@ from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.time_log import TimeLog
+from app.models.technician import Technician
+from app.models.maintenance_request import MaintenanceRequest
+from app.models.user import User
+from app.core.fields import field_spec, project
+from app.models.change_log import ChangeEntity, ChangeOperation
+from app.crud.change_log import record_change
+from app.crud.workload import record_time_log_change
+from app.crud.returning import update_returning_old, delete_returning, commit_returning
 from app.schemas.time_log import TimeLogCreate, TimeLogUpdate
 
 
+# Fields selectable with fields= on the time log list (TimeLogDetailResponse keys)
+TIME_LOG_FIELDS = {
+    "id": field_spec(TimeLog.id),
+    "request_id": field_spec(TimeLog.request_id),
+    "request_subject": field_spec(
+        MaintenanceRequest.subject, (MaintenanceRequest, TimeLog.request_id == MaintenanceRequest.id)
+    ),
+    "technician_id": field_spec(TimeLog.technician_id),
+    "technician_name": field_spec(
+        User.name,
+        (Technician, TimeLog.technician_id == Technician.id),
+        (User, Technician.user_id == User.id)
+    ),
+    "hours_spent": field_spec(TimeLog.hours_spent),
+    "logged_at": field_spec(TimeLog.logged_at),
+}
+
+
 def get_time_log(db: Session, time_log_id: UUID) -> TimeLog | None:
     """Get time log by ID."""
     return db.query(TimeLog).filter(TimeLog.id == time_log_id).first()
 
 
+def get_time_log_with_details(db: Session, time_log_id: UUID) -> TimeLog | None:
+    """Get time log by ID with request and technician user loaded."""
+    return db.query(TimeLog).options(
+        joinedload(TimeLog.request),
+        joinedload(TimeLog.technician).joinedload(Technician.user)
+    ).filter(TimeLog.id == time_log_id).first()
+
+
 def get_time_logs(
     db: Session,
     skip: int = 0,
     limit: int = 100,
     request_id: UUID | None = None,
-    technician_id: UUID | None = None
-) -> list[TimeLog]:
-    """Get time logs with optional filters."""
-    query = db.query(TimeLog).options(
-        joinedload(TimeLog.request),
-        joinedload(TimeLog.technician)
-    )
+    technician_id: UUID | None = None,
+    fields: list[str] | None = None
+) -> list[TimeLog] | list[dict]:
+    """Get time logs with optional filters (only the given TIME_LOG_FIELDS as dicts if fields is set)."""
+    query = db.query(TimeLog)
     
     if request_id:
         query = query.filter(TimeLog.request_id == request_id)
@@ -29,13 +61,27 @@ def get_time_logs(
     if technician_id:
         query = query.filter(TimeLog.technician_id == technician_id)
     
-    return query.order_by(TimeLog.logged_at.desc()).offset(skip).limit(limit).all()
+    query = query.order_by(TimeLog.logged_at.desc())
+    if fields:
+        return [row._asdict() for row in project(query, TIME_LOG_FIELDS, fields).offset(skip).limit(limit)]
+    return query.options(
+        joinedload(TimeLog.request),
+        joinedload(TimeLog.technician).joinedload(Technician.user)
+    ).offset(skip).limit(limit).all()
+
+
+def _workload_entry(db_time_log: TimeLog) -> tuple:
+    """The time log's contribution to the technician weekly workload rollup."""
+    return db_time_log.technician_id, db_time_log.logged_at, db_time_log.hours_spent
 
 
 def create_time_log(db: Session, time_log: TimeLogCreate) -> TimeLog:
     """Create a new time log."""
     db_time_log = TimeLog(**time_log.model_dump())
     db.add(db_time_log)
+    db.flush()
+    record_change(db, ChangeEntity.time_log, db_time_log.id, ChangeOperation.upsert)
+    record_time_log_change(db, None, _workload_entry(db_time_log))
     db.commit()
     db.refresh(db_time_log)
     return db_time_log
@@ -43,25 +89,28 @@ def create_time_log(db: Session, time_log: TimeLogCreate) -> TimeLog:
 
 def update_time_log(db: Session, time_log_id: UUID, time_log: TimeLogUpdate) -> TimeLog | None:
     """Update a time log."""
-    db_time_log = get_time_log(db, time_log_id)
-    if not db_time_log:
+    row = update_returning_old(
+        db, TimeLog, time_log_id, time_log.model_dump(exclude_unset=True),
+        TimeLog.technician_id, TimeLog.logged_at, TimeLog.hours_spent
+    )
+    if not row:
+        db.rollback()
         return None
     
-    update_data = time_log.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_time_log, field, value)
-    
-    db.commit()
-    db.refresh(db_time_log)
-    return db_time_log
+    db_time_log, *old_entry = row
+    record_change(db, ChangeEntity.time_log, time_log_id, ChangeOperation.upsert)
+    record_time_log_change(db, tuple(old_entry), _workload_entry(db_time_log))
+    return commit_returning(db, db_time_log)
 
 
 def delete_time_log(db: Session, time_log_id: UUID) -> bool:
     """Delete a time log."""
-    db_time_log = get_time_log(db, time_log_id)
-    if not db_time_log:
+    deleted = delete_returning(db, TimeLog, time_log_id, TimeLog.technician_id, TimeLog.logged_at, TimeLog.hours_spent)
+    if not deleted:
+        db.rollback()
         return False
     
-    db.delete(db_time_log)
+    record_change(db, ChangeEntity.time_log, time_log_id, ChangeOperation.delete)
+    record_time_log_change(db, tuple(deleted[1:]), None)
     db.commit()
     return True
@@ -0,0 +1,118 @@
+from collections.abc import Callable
+from datetime import date, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import func, and_, or_
+
+from app.models.request_audit_log import RequestAuditLog
+from app.models.maintenance_request import MaintenanceRequest, RequestStage
+from app.models.equipment import Equipment
+from app.models.maintenance_team import MaintenanceTeam
+from app.models.request_trend import RequestDailyTrend
+from app.crud.rollup import upsert, run_incremental
+from app.crud.workload import iso_week_start
+
+TRENDS_WATERMARK = "request_daily_trends"
+
+CLOSED_STAGES = (RequestStage.repaired, RequestStage.scrap)
+
+# Columns each trends dimension groups by (None: one series for everything)
+TREND_DIMENSIONS = {
+    "none": None,
+    "team": RequestDailyTrend.team_id,
+    "category": RequestDailyTrend.category,
+    "type": RequestDailyTrend.request_type,
+}
+
+
+def _trends_source(db: Session):
+    """Audit rows that open a request or first move it to a closed stage, with its team and category."""
+    return db.query(
+        RequestAuditLog.id,
+        RequestAuditLog.changed_at,
+        RequestAuditLog.old_stage,
+        MaintenanceRequest.request_type,
+        Equipment.maintenance_team_id,
+        Equipment.category
+    ).join(
+        MaintenanceRequest, RequestAuditLog.request_id == MaintenanceRequest.id
+    ).join(
+        Equipment, MaintenanceRequest.equipment_id == Equipment.id
+    ).filter(
+        or_(
+            RequestAuditLog.old_stage.is_(None),
+            and_(RequestAuditLog.new_stage.in_(CLOSED_STAGES), RequestAuditLog.old_stage.notin_(CLOSED_STAGES))
+        )
+    )
+
+
+def _apply_batch(db: Session, rows) -> None:
+    """Add one batch of audit rows to the daily buckets with a single upsert."""
+    buckets = {}
+    for row in rows:
+        key = (row.changed_at.date(), row.maintenance_team_id, row.category or "", row.request_type)
+        opened, closed = buckets.get(key, (0, 0))
+        buckets[key] = (opened + 1, closed) if row.old_stage is None else (opened, closed + 1)
+
+    upsert(
+        db, RequestDailyTrend,
+        [
+            {"day": day, "team_id": team_id, "category": category, "request_type": request_type,
+             "opened": opened, "closed": closed}
+            for (day, team_id, category, request_type), (opened, closed) in buckets.items()
+        ],
+        [RequestDailyTrend.day, RequestDailyTrend.team_id, RequestDailyTrend.category, RequestDailyTrend.request_type],
+        lambda excluded: {
+            "opened": RequestDailyTrend.opened + excluded.opened,
+            "closed": RequestDailyTrend.closed + excluded.closed,
+        }
+    )
+
+
+def refresh_request_trends(db: Session, progress: Callable[[int], None] | None = None) -> int:
+    """Apply audit rows past the watermark to the daily trend buckets; returns rows processed."""
+    return run_incremental(
+        db, TRENDS_WATERMARK, lambda: _trends_source(db),
+        RequestAuditLog.changed_at, RequestAuditLog.id, lambda rows: _apply_batch(db, rows), progress
+    )
+
+
+def bucket_start(day: date, bucket: str) -> date:
+    """First day of the day / week (ISO, Monday) / month bucket containing day."""
+    if bucket == "week":
+        return iso_week_start(day)
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(start: date, bucket: str) -> date:
+    """First day of the bucket after the one starting at start."""
+    if bucket == "week":
+        return start + timedelta(days=7)
+    if bucket == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def get_trend_rows(db: Session, start_date: date, end_date: date, dimension: str):
+    """Get daily opened/closed totals per dimension value between two dates (inclusive)."""
+    column = TREND_DIMENSIONS[dimension]
+    columns = [RequestDailyTrend.day]
+    if column is not None:
+        columns.append(column.label("key"))
+    if dimension == "team":
+        columns.append(MaintenanceTeam.name.label("label"))
+
+    query = db.query(
+        *columns,
+        func.sum(RequestDailyTrend.opened).label("opened"),
+        func.sum(RequestDailyTrend.closed).label("closed")
+    ).filter(
+        RequestDailyTrend.day >= start_date,
+        RequestDailyTrend.day <= end_date
+    )
+
+    if dimension == "team":
+        query = query.outerjoin(MaintenanceTeam, RequestDailyTrend.team_id == MaintenanceTeam.id)
+
+    return query.group_by(*columns).order_by(RequestDailyTrend.day).all()
@@ -5,6 +5,8 @@ from sqlalchemy import or_
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import get_password_hash
+from app.crud.batch import get_by_ids
+from app.crud.returning import update_returning, delete_returning, commit_returning
 
 
 def get_user(db: Session, user_id: UUID) -> User | None:
@@ -12,6 +14,11 @@ def get_user(db: Session, user_id: UUID) -> User | None:
     return db.query(User).filter(User.id == user_id).first()
 
 
+def get_users_by_ids(db: Session, user_ids: list[UUID]) -> dict[UUID, User]:
+    """Get users by a list of IDs in one query."""
+    return get_by_ids(db, User, user_ids)
+
+
 def get_user_by_email(db: Session, email: str) -> User | None:
     """Get a user by email."""
     return db.query(User).filter(User.email == email).first()
@@ -50,30 +57,18 @@ def create_user(db: Session, user: UserCreate) -> User:
 
 def update_user(db: Session, user_id: UUID, user: UserUpdate) -> User | None:
     """Update a user."""
-    db_user = get_user(db, user_id)
-    if not db_user:
-        return None
-    
     update_data = user.model_dump(exclude_unset=True)
     
     # Hash password if provided
     if "password" in update_data:
         update_data["password_hash"] = get_password_hash(update_data.pop("password"))
     
-    for field, value in update_data.items():
-        setattr(db_user, field, value)
-    
-    db.commit()
-    db.refresh(db_user)
-    return db_user
+    db_user = update_returning(db, User, user_id, update_data)
+    return commit_returning(db, db_user)
 
 
 def delete_user(db: Session, user_id: UUID) -> bool:
-    """Delete a user."""
-    db_user = get_user(db, user_id)
-    if not db_user:
-        return False
-    
-    db.delete(db_user)
+    """Delete a user (their technician record goes with it through ON DELETE CASCADE)."""
+    deleted = delete_returning(db, User, user_id)
     db.commit()
-    return True
+    return deleted is not None
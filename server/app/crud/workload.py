@@ -0,0 +1,125 @@
+from uuid import UUID
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case, and_, cast, select, Date
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.technician_workload import TechnicianWeeklyWorkload
+from app.models.technician import Technician
+from app.models.time_log import TimeLog
+from app.models.maintenance_request import MaintenanceRequest, RequestStage
+from app.models.maintenance_team import MaintenanceTeam
+from app.models.user import User
+from app.crud.rollup import upsert
+
+
+def iso_week_start(moment: datetime | date) -> date:
+    """Monday of the ISO week containing the given date or timestamp."""
+    day = moment.date() if isinstance(moment, datetime) else moment
+    return day - timedelta(days=day.weekday())
+
+
+def _apply_deltas(db: Session, deltas: dict[tuple[UUID, date], tuple[Decimal, int]]) -> None:
+    """Add (hours, count) deltas to their weekly buckets with a single upsert."""
+    rows = [
+        {"technician_id": technician_id, "week_start": week_start, "hours_logged": hours, "log_count": count}
+        for (technician_id, week_start), (hours, count) in deltas.items()
+        if hours or count
+    ]
+    upsert(
+        db, TechnicianWeeklyWorkload, rows,
+        [TechnicianWeeklyWorkload.technician_id, TechnicianWeeklyWorkload.week_start],
+        lambda excluded: {
+            "hours_logged": TechnicianWeeklyWorkload.hours_logged + excluded.hours_logged,
+            "log_count": TechnicianWeeklyWorkload.log_count + excluded.log_count,
+        }
+    )
+
+
+def _add(deltas: dict, technician_id: UUID, logged_at: datetime, hours, sign: int) -> None:
+    key = (technician_id, iso_week_start(logged_at))
+    total, count = deltas.get(key, (Decimal(0), 0))
+    deltas[key] = (total + sign * Decimal(str(hours)), count + sign)
+
+
+def record_time_log_change(db: Session, old: tuple | None, new: tuple | None) -> None:
+    """Move a time log's (technician_id, logged_at, hours_spent) contribution from old to new."""
+    deltas = {}
+    if old is not None:
+        _add(deltas, *old, sign=-1)
+    if new is not None:
+        _add(deltas, *new, sign=1)
+    _apply_deltas(db, deltas)
+
+
+def remove_request_time_logs(db: Session, request_ids) -> None:
+    """Subtract the time logs that will be deleted along with the given requests.
+
+    request_ids is a list or a subquery of ids; the deltas are summed per week
+    and applied in one INSERT ... SELECT ... ON CONFLICT, so no rows are fetched.
+    """
+    week_start = cast(func.date_trunc("week", TimeLog.logged_at), Date)
+    removed = select(
+        TimeLog.technician_id, week_start, -func.sum(TimeLog.hours_spent), -func.count()
+    ).where(TimeLog.request_id.in_(request_ids)).group_by(TimeLog.technician_id, week_start)
+    stmt = insert(TechnicianWeeklyWorkload).from_select(
+        ["technician_id", "week_start", "hours_logged", "log_count"], removed
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[TechnicianWeeklyWorkload.technician_id, TechnicianWeeklyWorkload.week_start],
+        set_={
+            "hours_logged": TechnicianWeeklyWorkload.hours_logged + stmt.excluded.hours_logged,
+            "log_count": TechnicianWeeklyWorkload.log_count + stmt.excluded.log_count,
+        }
+    ))
+
+
+def get_weekly_workload(db: Session, start_week: date, end_week: date, team_id: UUID | None = None):
+    """Get weekly rollup rows per technician between two week starts (inclusive)."""
+    query = db.query(
+        TechnicianWeeklyWorkload.technician_id,
+        TechnicianWeeklyWorkload.week_start,
+        TechnicianWeeklyWorkload.hours_logged,
+        TechnicianWeeklyWorkload.log_count
+    ).filter(
+        TechnicianWeeklyWorkload.week_start >= start_week,
+        TechnicianWeeklyWorkload.week_start <= end_week,
+        TechnicianWeeklyWorkload.log_count > 0
+    )
+
+    if team_id:
+        query = query.join(Technician, TechnicianWeeklyWorkload.technician_id == Technician.id).filter(
+            Technician.team_id == team_id
+        )
+
+    return query.order_by(TechnicianWeeklyWorkload.technician_id, TechnicianWeeklyWorkload.week_start).all()
+
+
+def get_technician_queues(db: Session, team_id: UUID | None = None):
+    """Get each technician with their current new and in-progress assignment counts."""
+    query = db.query(
+        Technician.id.label("technician_id"),
+        User.name.label("technician_name"),
+        Technician.team_id.label("team_id"),
+        MaintenanceTeam.name.label("team_name"),
+        Technician.is_active.label("is_active"),
+        func.sum(case((MaintenanceRequest.stage == RequestStage.new, 1), else_=0)).label("open_requests"),
+        func.sum(case((MaintenanceRequest.stage == RequestStage.in_progress, 1), else_=0)).label("in_progress_requests"),
+    ).join(
+        User, Technician.user_id == User.id
+    ).join(
+        MaintenanceTeam, Technician.team_id == MaintenanceTeam.id
+    ).outerjoin(
+        MaintenanceRequest, and_(
+            MaintenanceRequest.assigned_to == Technician.id,
+            MaintenanceRequest.stage.in_([RequestStage.new, RequestStage.in_progress])
+        )
+    )
+
+    if team_id:
+        query = query.filter(Technician.team_id == team_id)
+
+    return query.group_by(
+        Technician.id, User.name, Technician.team_id, MaintenanceTeam.name, Technician.is_active
+    ).order_by(User.name).all()
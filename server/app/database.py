@@ -3,12 +3,20 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import settings
+from app.core.metrics import TimedQueuePool
+from app.core.sql_stats import register_query_listeners, register_strict_loading
+from app.core.slow_queries import register_slow_query_listeners
+from app.core.events import register_event_hooks
 
 # Create database engine
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True, poolclass=TimedQueuePool)
+register_query_listeners(engine)
+register_slow_query_listeners(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+register_strict_loading(SessionLocal)
+register_event_hooks(SessionLocal)
 
 # Base class for models
 Base = declarative_base()
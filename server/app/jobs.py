@@ -0,0 +1,126 @@
+"""
+Job kinds the background workers can run.
+
+Each kind has a payload schema, checked when the job is enqueued, the roles
+allowed to enqueue it through the API, and a handler
+called with its own session, the validated payload and a JobProgress. Handlers
+return a JSON-serializable result (or None). An exception fails the attempt and
+the job is retried with backoff, so handlers must be safe to run again.
+"""
+from collections.abc import Callable
+from dataclasses import dataclass
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.scheduler import PeriodicTask
+from app.schemas.job import EmptyJobPayload, PreventiveGenerationPayload
+from app.crud import background_job as crud_job
+from app.crud.maintenance_request import flag_overdue_requests
+from app.crud.reliability import refresh_reliability_stats
+from app.crud.trends import refresh_request_trends
+from app.crud.preventive_schedule import generate_preventive_requests
+
+
+class JobLeaseLost(Exception):
+    """The job was claimed by another worker after this worker's lease expired."""
+
+
+class JobProgress:
+    """Progress reporter handed to handlers; each report also renews the job's lease."""
+
+    def __init__(self, session_factory: sessionmaker, job_id: UUID, worker_id: str):
+        self._session_factory = session_factory
+        self.job_id = job_id
+        self.worker_id = worker_id
+
+    def __call__(self, done: int, total: int | None = None) -> None:
+        db = self._session_factory()
+        try:
+            owned = crud_job.record_progress(db, self.job_id, self.worker_id, done, total)
+        finally:
+            db.close()
+        if not owned:
+            raise JobLeaseLost(f"Job {self.job_id} is no longer owned by {self.worker_id}")
+
+
+@dataclass(frozen=True)
+class JobKind:
+    description: str
+    payload_schema: type[BaseModel]
+    handler: Callable[[Session, BaseModel, JobProgress], dict | None]
+    roles: tuple[str, ...] = ("admin", "manager")
+
+
+def _generate_preventive(db: Session, payload: PreventiveGenerationPayload, progress: JobProgress) -> dict:
+    result = generate_preventive_requests(db, payload.horizon_days, progress)
+    return {**result, "generated_through": result["generated_through"].isoformat()}
+
+
+JOB_KINDS: dict[str, JobKind] = {
+    "overdue_flag": JobKind(
+        "Set the stored overdue flag of requests past their scheduled date",
+        EmptyJobPayload,
+        lambda db, payload, progress: {"changed": flag_overdue_requests(db)}
+    ),
+    "reliability_refresh": JobKind(
+        "Apply new audit trail rows to the reliability statistics",
+        EmptyJobPayload,
+        lambda db, payload, progress: {"processed": refresh_reliability_stats(db, progress)},
+        roles=("admin",)
+    ),
+    "trends_refresh": JobKind(
+        "Apply new audit trail rows to the daily request trends",
+        EmptyJobPayload,
+        lambda db, payload, progress: {"processed": refresh_request_trends(db, progress)},
+        roles=("admin",)
+    ),
+    "preventive_generate": JobKind(
+        "Create the preventive requests due within the horizon",
+        PreventiveGenerationPayload,
+        _generate_preventive
+    ),
+}
+
+# Job kinds the in-app scheduler starts on a cadence, with the interval setting of each
+PERIODIC_JOBS = {
+    "overdue_flag": "SCHEDULE_OVERDUE_FLAG_SECONDS",
+    "reliability_refresh": "SCHEDULE_RELIABILITY_REFRESH_SECONDS",
+    "trends_refresh": "SCHEDULE_TRENDS_REFRESH_SECONDS",
+    "preventive_generate": "SCHEDULE_PREVENTIVE_GENERATE_SECONDS",
+}
+
+
+# Cheap enough to run on the scheduler thread of an API worker; the other
+# periodic kinds are queued for the job workers
+INLINE_PERIODIC_JOBS = {"overdue_flag"}
+
+
+def _run_inline(kind: str) -> Callable[[Session], dict | None]:
+    """Run a job kind's handler in the calling thread with its default payload."""
+    job_kind = JOB_KINDS[kind]
+    return lambda db: job_kind.handler(db, job_kind.payload_schema(), lambda done, total=None: None)
+
+
+def _enqueue(kind: str) -> Callable[[Session], dict | None]:
+    """Queue a job of the kind with its default payload, unless one is already queued or running."""
+    payload = JOB_KINDS[kind].payload_schema().model_dump(mode="json")
+
+    def enqueue(db: Session) -> dict:
+        job = crud_job.enqueue_job_unless_pending(db, kind, payload)
+        if job is None:
+            return {"skipped": "a job of this kind is already queued or running"}
+        return {"enqueued_job_id": str(job.id)}
+    return enqueue
+
+
+def periodic_tasks() -> list[PeriodicTask]:
+    """The scheduler's tasks, with intervals from settings."""
+    return [
+        PeriodicTask(
+            kind, getattr(settings, setting), _run_inline(kind) if kind in INLINE_PERIODIC_JOBS else _enqueue(kind)
+        )
+        for kind, setting in PERIODIC_JOBS.items()
+    ]
@@ -1,7 +1,18 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, registry as metrics_registry
+from app.core.sql_stats import QueryStatsMiddleware
+from app.core.profiling import ProfilingMiddleware
+from app.core.events import event_broker
+from app.core.assignment import load_index
+from app.core.scheduler import periodic_scheduler
+from app.jobs import periodic_tasks
+from app.database import engine, SessionLocal
 from app.routers import (
     auth,
     users,
@@ -11,9 +22,31 @@ from app.routers import (
     equipment,
     maintenance_requests,
     time_logs,
-    reports
+    preventive_schedules,
+    reports,
+    dashboard,
+    events,
+    sync,
+    jobs,
+    admin
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop per-worker background services."""
+    # Always listen: besides realtime events the channel carries cache invalidations
+    event_broker.start(engine)
+    load_index.start(SessionLocal)
+    periodic_scheduler.configure(periodic_tasks())
+    if settings.SCHEDULER_ENABLED:
+        periodic_scheduler.start(engine, SessionLocal)
+    yield
+    periodic_scheduler.stop()
+    load_index.stop()
+    event_broker.stop()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="GearGuard API",
@@ -21,7 +54,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -33,6 +67,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Profile single requests on demand for admins
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Report per-request SQL statement counts (Server-Timing header + log line)
+if settings.SQL_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
+# Record per-route request metrics
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Register routers
 app.include_router(auth.router)
 app.include_router(users.router)
@@ -42,7 +88,13 @@ app.include_router(technicians.router)
 app.include_router(equipment.router)
 app.include_router(maintenance_requests.router)
 app.include_router(time_logs.router)
+app.include_router(preventive_schedules.router)
 app.include_router(reports.router)
+app.include_router(dashboard.router)
+app.include_router(events.router)
+app.include_router(sync.router)
+app.include_router(jobs.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -59,3 +111,12 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    return PlainTextResponse(
+        metrics_registry.render(engine.pool),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
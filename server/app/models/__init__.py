@@ -6,6 +6,14 @@ from app.models.equipment import Equipment
 from app.models.maintenance_request import MaintenanceRequest
 from app.models.time_log import TimeLog
 from app.models.request_audit_log import RequestAuditLog
+from app.models.change_log import ChangeLog
+from app.models.technician_workload import TechnicianWeeklyWorkload
+from app.models.analytics_watermark import AnalyticsWatermark
+from app.models.equipment_reliability import EquipmentReliabilityStats
+from app.models.request_trend import RequestDailyTrend
+from app.models.preventive_schedule import PreventiveSchedule
+from app.models.background_job import BackgroundJob
+from app.models.periodic_task_run import PeriodicTaskRun
 
 __all__ = [
     "User",
@@ -16,4 +24,12 @@ __all__ = [
     "MaintenanceRequest",
     "TimeLog",
     "RequestAuditLog",
+    "ChangeLog",
+    "TechnicianWeeklyWorkload",
+    "AnalyticsWatermark",
+    "EquipmentReliabilityStats",
+    "RequestDailyTrend",
+    "PreventiveSchedule",
+    "BackgroundJob",
+    "PeriodicTaskRun",
 ]
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class AnalyticsWatermark(Base):
+    """How far an incremental analytics job has read its source, as a (timestamp, id) position."""
+    __tablename__ = "analytics_watermarks"
+
+    name = Column(String(50), primary_key=True)
+    position_at = Column(DateTime)
+    position_id = Column(UUID(as_uuid=True))
+    refreshed_at = Column(DateTime)
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, JSON, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+import enum
+import uuid
+from datetime import datetime
+
+from app.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class BackgroundJob(Base):
+    """A unit of work for the job workers (python -m app.worker)."""
+    __tablename__ = "background_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String, nullable=False)
+    payload = Column(JSON().with_variant(JSONB, "postgresql"), nullable=False, default=dict)
+    status = Column(SQLEnum(JobStatus, name="job_status"), nullable=False, default=JobStatus.queued)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)  # not claimed before (retry backoff)
+    # Claiming worker and its lease; a running job whose lease expired is claimed again
+    locked_by = Column(String)
+    locked_at = Column(DateTime)
+    progress = Column(Integer, nullable=False, default=0)
+    progress_total = Column(Integer)
+    result = Column(JSON().with_variant(JSONB, "postgresql"))
+    error = Column(Text)  # last failure, kept while the job is retried
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, DateTime, BigInteger, Integer, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+from datetime import datetime
+
+from app.database import Base
+
+
+class ChangeEntity(str, enum.Enum):
+    maintenance_request = "maintenance_request"
+    time_log = "time_log"
+    equipment = "equipment"
+
+
+class ChangeOperation(str, enum.Enum):
+    upsert = "upsert"
+    delete = "delete"
+
+
+class ChangeLog(Base):
+    __tablename__ = "change_log"
+
+    seq = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    entity_type = Column(SQLEnum(ChangeEntity, name="change_entity"), nullable=False)
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    operation = Column(SQLEnum(ChangeOperation, name="change_operation"), nullable=False)
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Writing transaction id (DEFAULT txid_current() in init.sql); readers only
+    # return rows whose transaction is older than every in-flight one
+    txid = Column(BigInteger)
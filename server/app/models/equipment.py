@@ -30,4 +30,6 @@ class Equipment(Base):
     # Relationships
     department = relationship("Department", back_populates="equipment")
     maintenance_team = relationship("MaintenanceTeam", back_populates="equipment")
-    maintenance_requests = relationship("MaintenanceRequest", back_populates="equipment", cascade="all, delete-orphan")
+    maintenance_requests = relationship(
+        "MaintenanceRequest", back_populates="equipment", cascade="all, delete-orphan", passive_deletes=True
+    )
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, Integer, BigInteger, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class EquipmentReliabilityStats(Base):
+    """Running repair and failure totals per equipment, fed from request_audit_logs."""
+    __tablename__ = "equipment_reliability_stats"
+
+    equipment_id = Column(UUID(as_uuid=True), ForeignKey("equipment.id", ondelete="CASCADE"), primary_key=True)
+    repair_count = Column(Integer, nullable=False, default=0)
+    repair_seconds = Column(BigInteger, nullable=False, default=0)  # sum of creation -> repaired durations
+    failure_count = Column(Integer, nullable=False, default=0)  # corrective requests opened
+    first_failure_at = Column(DateTime)
+    last_failure_at = Column(DateTime)
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Column, String, Text, Date, DateTime, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, Date, DateTime, Boolean, ForeignKey, UniqueConstraint, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -30,14 +30,22 @@ class MaintenanceRequest(Base):
     equipment_id = Column(UUID(as_uuid=True), ForeignKey("equipment.id", ondelete="CASCADE"), nullable=False, index=True)
     detected_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
     assigned_to = Column(UUID(as_uuid=True), ForeignKey("technicians.id", ondelete="SET NULL"), index=True)
-    scheduled_date = Column(Date)
+    scheduled_date = Column(Date, index=True)
     stage = Column(SQLEnum(RequestStage, name="request_stage"), nullable=False, default=RequestStage.new, index=True)
     overdue = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Set on requests generated from a preventive schedule; one request per occurrence
+    schedule_id = Column(UUID(as_uuid=True), ForeignKey("preventive_schedules.id", ondelete="SET NULL"))
+
+    __table_args__ = (
+        UniqueConstraint("schedule_id", "equipment_id", "scheduled_date", name="uq_request_schedule_occurrence"),
+    )
 
     # Relationships
     equipment = relationship("Equipment", back_populates="maintenance_requests")
     detected_by_user = relationship("User", back_populates="detected_requests", foreign_keys=[detected_by])
     assigned_technician = relationship("Technician", back_populates="assigned_requests", foreign_keys=[assigned_to])
-    time_logs = relationship("TimeLog", back_populates="request", cascade="all, delete-orphan")
-    audit_logs = relationship("RequestAuditLog", back_populates="request", cascade="all, delete-orphan")
+    time_logs = relationship("TimeLog", back_populates="request", cascade="all, delete-orphan", passive_deletes=True)
+    audit_logs = relationship(
+        "RequestAuditLog", back_populates="request", cascade="all, delete-orphan", passive_deletes=True
+    )
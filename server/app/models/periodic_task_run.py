@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, Text, DateTime, Integer, Float, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.database import Base
+
+
+class PeriodicTaskRun(Base):
+    """Last run of each periodic task, written by whichever node ran it."""
+    __tablename__ = "periodic_task_runs"
+
+    name = Column(String, primary_key=True)
+    last_started_at = Column(DateTime)
+    last_finished_at = Column(DateTime)
+    last_duration_ms = Column(Float)
+    last_result = Column(JSON().with_variant(JSONB, "postgresql"))
+    last_error = Column(Text)  # None when the last run succeeded
+    last_node = Column(String)  # host:pid that ran it
+    run_count = Column(Integer, nullable=False, default=0)
+    failure_count = Column(Integer, nullable=False, default=0)
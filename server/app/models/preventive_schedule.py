@@ -0,0 +1,35 @@
+import enum
+from sqlalchemy import Column, String, Text, Date, DateTime, Integer, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from datetime import datetime
+
+from app.database import Base
+
+
+class ScheduleUnit(str, enum.Enum):
+    day = "day"
+    week = "week"
+    month = "month"
+
+
+class PreventiveSchedule(Base):
+    """Recurring preventive maintenance for one piece of equipment or every active asset of a category."""
+    __tablename__ = "preventive_schedules"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name = Column(String, nullable=False)
+    subject = Column(String, nullable=False)  # subject of the generated requests
+    description = Column(Text)
+    equipment_id = Column(UUID(as_uuid=True), ForeignKey("equipment.id", ondelete="CASCADE"), index=True)
+    category = Column(String, index=True)
+    # Occurrences fall on start_date + k * interval_count units; monthly ones keep
+    # start_date's day of month, clamped to the month's last day
+    interval_unit = Column(SQLEnum(ScheduleUnit, name="schedule_unit"), nullable=False)
+    interval_count = Column(Integer, nullable=False, default=1)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date)
+    is_active = Column(Boolean, nullable=False, default=True)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    generated_through = Column(Date)  # last day already materialized into requests
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Date, Integer, String, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+from app.models.maintenance_request import RequestType
+
+
+class RequestDailyTrend(Base):
+    """Requests opened and closed per day, team, equipment category and request type."""
+    __tablename__ = "request_daily_trends"
+
+    day = Column(Date, primary_key=True)
+    team_id = Column(UUID(as_uuid=True), primary_key=True)  # equipment's team when the event happened
+    category = Column(String(100), primary_key=True)  # '' when the equipment has no category
+    request_type = Column(SQLEnum(RequestType, name="request_type"), primary_key=True)
+    opened = Column(Integer, nullable=False, default=0)
+    closed = Column(Integer, nullable=False, default=0)  # moved to repaired or scrap
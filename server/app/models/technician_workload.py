@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Date, Integer, Numeric, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class TechnicianWeeklyWorkload(Base):
+    """Hours logged per technician per ISO week, kept in step with time_logs by the time log crud."""
+    __tablename__ = "technician_weekly_workload"
+
+    technician_id = Column(UUID(as_uuid=True), ForeignKey("technicians.id", ondelete="CASCADE"), primary_key=True)
+    week_start = Column(Date, primary_key=True)  # Monday of the ISO week
+    hours_logged = Column(Numeric(10, 2), nullable=False, default=0)
+    log_count = Column(Integer, nullable=False, default=0)
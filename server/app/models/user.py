@@ -27,5 +27,7 @@ class User(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Relationships
-    technician = relationship("Technician", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    technician = relationship(
+        "Technician", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True
+    )
     detected_requests = relationship("MaintenanceRequest", back_populates="detected_by_user", foreign_keys="MaintenanceRequest.detected_by")
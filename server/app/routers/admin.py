@@ -0,0 +1,88 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.admin import SlowQueryResponse, ProfileSummaryResponse, ProfileDetailResponse, PeriodicTaskStatus
+from app.core.security import require_role
+from app.core.scheduler import periodic_scheduler
+from app.core.slow_queries import slow_query_log
+from app.core.profiling import profile_store
+from app.models.user import User
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"])
+
+
+@router.get("/slow-queries", response_model=list[SlowQueryResponse])
+async def list_slow_queries(
+    current_user: User = Depends(require_role("admin"))
+):
+    """List recently recorded slow queries, newest first (admin only)."""
+    return [SlowQueryResponse(**entry) for entry in slow_query_log.entries()]
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries(
+    current_user: User = Depends(require_role("admin"))
+):
+    """Clear the slow query buffer (admin only)."""
+    slow_query_log.clear()
+    return None
+
+
+@router.get("/profiles", response_model=list[ProfileSummaryResponse])
+async def list_profiles(
+    current_user: User = Depends(require_role("admin"))
+):
+    """List stored request profiles, newest first (admin only)."""
+    return [ProfileSummaryResponse(**profile) for profile in profile_store.list()]
+
+
+@router.get("/profiles/{profile_id}", response_model=ProfileDetailResponse)
+async def get_profile(
+    profile_id: str,
+    current_user: User = Depends(require_role("admin"))
+):
+    """Get a stored request profile with stacks and top allocations (admin only)."""
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    
+    return ProfileDetailResponse(**profile)
+
+
+@router.get("/profiles/{profile_id}/folded", response_class=PlainTextResponse)
+async def download_profile_stacks(
+    profile_id: str,
+    current_user: User = Depends(require_role("admin"))
+):
+    """Download folded stacks for flamegraph.pl / speedscope (admin only)."""
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    
+    return PlainTextResponse(
+        "\n".join(profile["folded_stacks"]) + "\n",
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.folded"'}
+    )
+
+
+@router.delete("/profiles/{profile_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_profile(
+    profile_id: str,
+    current_user: User = Depends(require_role("admin"))
+):
+    """Delete a stored request profile (admin only)."""
+    if not profile_store.delete(profile_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    
+    return None
+
+
+@router.get("/periodic-tasks", response_model=list[PeriodicTaskStatus])
+async def list_periodic_tasks(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin"))
+):
+    """List periodic tasks with their last run, duration and next due time (admin only)."""
+    return [PeriodicTaskStatus(**task) for task in periodic_scheduler.status(db)]
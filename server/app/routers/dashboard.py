@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.dashboard import DashboardSummaryResponse, DashboardTeamCount
+from app.crud import dashboard as crud_dashboard
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import get_current_user
+from app.models.maintenance_request import RequestStage
+from app.models.user import User, UserRole
+
+router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
+
+# Rendered summaries keyed by role; short TTL since nothing invalidates them
+summary_cache = TTLCache(ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS)
+
+
+def build_summary(db: Session, role: UserRole) -> DashboardSummaryResponse:
+    """Compute the dashboard summary visible to a role."""
+    now = datetime.utcnow()
+    today = now.date()
+    rows = crud_dashboard.get_summary_rows(
+        db, today, today + timedelta(days=settings.WARRANTY_EXPIRING_DAYS)
+    )
+    
+    totals = None
+    by_stage = {stage: 0 for stage in RequestStage}
+    by_team = []
+    for row in rows:
+        if row.stage_grouped and row.team_grouped:
+            totals = row
+        elif not row.stage_grouped:
+            by_stage[row.stage] = row.total
+        else:
+            by_team.append(DashboardTeamCount(
+                team_id=row.team_id,
+                team_name=row.team_name,
+                total_requests=row.total,
+                open_requests=row.open,
+                overdue_requests=row.overdue
+            ))
+    
+    can_see_teams = role in (UserRole.admin, UserRole.manager)
+    return DashboardSummaryResponse(
+        total_requests=totals.total if totals else 0,
+        open_requests=totals.open if totals else 0,
+        overdue_requests=totals.overdue if totals else 0,
+        unassigned_requests=totals.unassigned if totals else 0,
+        by_stage=by_stage,
+        by_team=sorted(by_team, key=lambda team: team.team_name) if can_see_teams else None,
+        warranty_expiring=(totals.warranty_expiring if totals else 0) if can_see_teams else None,
+        generated_at=now
+    )
+
+
+@router.get("/summary", response_model=DashboardSummaryResponse)
+async def get_summary(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the headline counts for the dashboard home page in one call."""
+    return summary_cache.get_or_load(current_user.role, lambda: build_summary(db, current_user.role))
@@ -5,12 +5,34 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.equipment import EquipmentCreate, EquipmentUpdate, EquipmentResponse, EquipmentDetailResponse
 from app.crud import equipment as crud_equipment
+from app.core.fields import parse_fields, fieldset_response
+from app.core.batch import parse_batch_ids, unique_ids, batch_items
+from app.schemas.batch import BatchItem
 from app.core.security import get_current_user, require_role
 from app.models.user import User
 
 router = APIRouter(prefix="/api/equipment", tags=["Equipment"])
 
 
+def build_equipment_detail(eq, total_requests: int | None, open_requests: int | None) -> EquipmentDetailResponse:
+    """Build the detailed equipment response with its request counts."""
+    return EquipmentDetailResponse(
+        id=eq.id,
+        name=eq.name,
+        serial_number=eq.serial_number,
+        category=eq.category,
+        department_id=eq.department_id,
+        assigned_employee=eq.assigned_employee,
+        location=eq.location,
+        purchase_date=eq.purchase_date,
+        warranty_expiry=eq.warranty_expiry,
+        maintenance_team_id=eq.maintenance_team_id,
+        status=eq.status,
+        request_count=total_requests or 0,
+        open_request_count=open_requests or 0
+    )
+
+
 @router.get("/", response_model=list[EquipmentDetailResponse])
 async def list_equipment(
     skip: int = Query(0, ge=0),
@@ -19,10 +41,12 @@ async def list_equipment(
     team_id: UUID | None = None,
     category: str | None = None,
     search: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated fields to return (id is always included)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all equipment with filters."""
+    selected_fields = parse_fields(fields, crud_equipment.EQUIPMENT_FIELDS)
     equipment_list = crud_equipment.get_equipment_list(
         db,
         skip=skip,
@@ -30,30 +54,15 @@ async def list_equipment(
         department_id=department_id,
         team_id=team_id,
         category=category,
-        search=search
+        search=search,
+        fields=selected_fields
     )
+    if selected_fields:
+        return fieldset_response(equipment_list)
     
-    equipment_list_with_counts = []
-    for eq in equipment_list:
-        eq_data, total_requests, open_requests = crud_equipment.get_equipment_with_details(db, eq.id)
-        eq_dict = {
-            "id": eq.id,
-            "name": eq.name,
-            "serial_number": eq.serial_number,
-            "category": eq.category,
-            "department_id": eq.department_id,
-            "assigned_employee": eq.assigned_employee,
-            "location": eq.location,
-            "purchase_date": eq.purchase_date,
-            "warranty_expiry": eq.warranty_expiry,
-            "maintenance_team_id": eq.maintenance_team_id,
-            "status": eq.status,
-            "request_count": total_requests or 0,
-            "open_request_count": open_requests or 0
-        }
-        equipment_list_with_counts.append(EquipmentDetailResponse(**eq_dict))
+    request_counts = crud_equipment.get_request_counts(db, [eq.id for eq in equipment_list])
     
-    return equipment_list_with_counts
+    return [build_equipment_detail(eq, *request_counts.get(eq.id, (0, 0))) for eq in equipment_list]
 
 
 @router.get("/categories", response_model=list[str])
@@ -65,6 +74,22 @@ async def list_categories(
     return crud_equipment.get_equipment_categories(db)
 
 
+@router.get("/batch", response_model=list[BatchItem[EquipmentDetailResponse]])
+async def get_equipment_batch(
+    ids: str = Query(..., description="Comma-separated equipment ids"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get several equipment records by id, in the requested order."""
+    equipment_ids = parse_batch_ids(ids)
+    found = crud_equipment.get_equipment_by_ids(db, unique_ids(equipment_ids))
+    request_counts = crud_equipment.get_request_counts(db, list(found))
+    
+    return batch_items(
+        equipment_ids, found, lambda eq: build_equipment_detail(eq, *request_counts.get(eq.id, (0, 0)))
+    )
+
+
 @router.get("/{equipment_id}", response_model=EquipmentDetailResponse)
 async def get_equipment(
     equipment_id: UUID,
@@ -77,23 +102,7 @@ async def get_equipment(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Equipment not found")
     
     equipment, total_requests, open_requests = result
-    
-    eq_dict = {
-        "id": equipment.id,
-        "name": equipment.name,
-        "serial_number": equipment.serial_number,
-        "category": equipment.category,
-        "department_id": equipment.department_id,
-        "assigned_employee": equipment.assigned_employee,
-        "location": equipment.location,
-        "purchase_date": equipment.purchase_date,
-        "warranty_expiry": equipment.warranty_expiry,
-        "maintenance_team_id": equipment.maintenance_team_id,
-        "status": equipment.status,
-        "request_count": total_requests or 0,
-        "open_request_count": open_requests or 0
-    }
-    return EquipmentDetailResponse(**eq_dict)
+    return build_equipment_detail(equipment, total_requests, open_requests)
 
 
 @router.get("/{equipment_id}/maintenance-count", response_model=dict)
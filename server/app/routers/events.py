@@ -0,0 +1,89 @@
+import json
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db, SessionLocal
+from app.core.config import settings
+from app.core.events import event_broker, Subscription
+from app.core.security import get_current_user, decode_token
+from app.models.user import User
+
+router = APIRouter(prefix="/api/events", tags=["Events"])
+
+
+def _team_filter(team_ids: list[UUID] | None) -> set[str] | None:
+    return {str(team_id) for team_id in team_ids} if team_ids else None
+
+
+async def _sse_stream(request: Request, subscription: Subscription):
+    try:
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            event_data = await subscription.get(timeout=settings.REALTIME_HEARTBEAT_SECONDS)
+            if event_data is None:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": heartbeat\n\n"
+                continue
+            yield f"event: {event_data['type']}\ndata: {json.dumps(event_data)}\n\n"
+    finally:
+        event_broker.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    team_id: list[UUID] | None = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream maintenance request changes as Server-Sent Events, optionally for some teams only."""
+    # Release the pooled connection now; the stream can stay open for hours
+    db.close()
+
+    subscription = event_broker.subscribe(_team_filter(team_id))
+    return StreamingResponse(
+        _sse_stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _websocket_user(token: str) -> User | None:
+    """Resolve the user of a WebSocket access token (browsers cannot send headers)."""
+    try:
+        user_id = decode_token(token).get("sub")
+    except HTTPException:
+        return None
+    if user_id is None:
+        return None
+
+    db = SessionLocal()
+    try:
+        return db.query(User).filter(User.id == user_id).first()
+    finally:
+        db.close()
+
+
+@router.websocket("/ws")
+async def websocket_events(
+    websocket: WebSocket,
+    token: str = Query(...),
+    team_id: list[UUID] | None = Query(None)
+):
+    """Push maintenance request changes over a WebSocket, optionally for some teams only."""
+    if _websocket_user(token) is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscription = event_broker.subscribe(_team_filter(team_id))
+    try:
+        while True:
+            event_data = await subscription.get(timeout=settings.REALTIME_HEARTBEAT_SECONDS)
+            await websocket.send_json(event_data if event_data is not None else {"type": "heartbeat"})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        event_broker.unsubscribe(subscription)
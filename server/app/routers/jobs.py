@@ -0,0 +1,82 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.job import JobCreate, JobResponse
+from app.crud import background_job as crud_job
+from app.jobs import JOB_KINDS
+from app.models.background_job import JobStatus
+from app.core.security import require_role
+from app.models.user import User
+
+router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
+
+
+@router.get("/", response_model=list[JobResponse])
+async def list_jobs(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    status: JobStatus | None = None,
+    kind: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """List background jobs, newest first (admin/manager only)."""
+    jobs = crud_job.get_jobs(db, skip=skip, limit=limit, status=status, kind=kind)
+    return [JobResponse.model_validate(job) for job in jobs]
+
+
+@router.get("/kinds", response_model=dict[str, str])
+async def list_job_kinds(
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """List the job kinds workers can run, with descriptions (admin/manager only)."""
+    return {kind: job_kind.description for kind, job_kind in JOB_KINDS.items()}
+
+
+@router.post("/", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def enqueue_job(
+    job: JobCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """Queue a job and return at once; poll GET /api/jobs/{job_id} for progress (admin/manager only)."""
+    job_kind = JOB_KINDS.get(job.kind)
+    if not job_kind:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown job kind. Valid kinds: {', '.join(sorted(JOB_KINDS))}"
+        )
+    if current_user.role not in job_kind.roles:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Access denied. Required role: {', '.join(job_kind.roles)}"
+        )
+    try:
+        payload = job_kind.payload_schema.model_validate(job.payload)
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=exc.errors(include_url=False, include_context=False, include_input=False)
+        )
+    
+    new_job = crud_job.enqueue_job(
+        db, job.kind, payload.model_dump(mode="json"), created_by=current_user.id, max_attempts=job.max_attempts
+    )
+    return JobResponse.model_validate(new_job)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """Get a job's status, progress and result (admin/manager only)."""
+    job = crud_job.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    
+    return JobResponse.model_validate(job)
@@ -1,5 +1,8 @@
+import base64
+import binascii
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, date
+from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
@@ -9,16 +12,143 @@ from app.schemas.maintenance_request import (
     MaintenanceRequestUpdate,
     MaintenanceRequestResponse,
     MaintenanceRequestDetailResponse,
-    MaintenanceRequestAutoFill
+    MaintenanceRequestCompoundResponse,
+    MaintenanceRequestAutoFill,
+    CalendarDayResponse,
+    BoardColumnPage,
+    BoardColumnResponse,
+    BoardResponse
 )
+from app.schemas.time_log import TimeLogDetailResponse
+from app.schemas.request_audit_log import RequestAuditLogDetailResponse
 from app.crud import maintenance_request as crud_request
-from app.models.maintenance_request import RequestStage, RequestType
+from app.models.maintenance_request import MaintenanceRequest, RequestStage, RequestType
+from app.core.config import settings
+from app.core.fields import parse_fields, fieldset_response
+from app.core.batch import parse_batch_ids, unique_ids, batch_items
+from app.schemas.batch import BatchItem
 from app.core.security import get_current_user, require_role
 from app.models.user import User
 
 router = APIRouter(prefix="/api/maintenance-requests", tags=["Maintenance Requests"])
 
 
+def request_is_overdue(req: MaintenanceRequest, today: date) -> bool:
+    """Check if a request is past its scheduled date and still open."""
+    return (
+        req.scheduled_date is not None and
+        req.scheduled_date < today and
+        req.stage in [RequestStage.new, RequestStage.in_progress]
+    )
+
+
+def build_detail_response(req: MaintenanceRequest, is_overdue: bool) -> MaintenanceRequestDetailResponse:
+    """Build the detailed response from a request with its relationships loaded."""
+    return MaintenanceRequestDetailResponse(
+        id=req.id,
+        subject=req.subject,
+        description=req.description,
+        request_type=req.request_type,
+        equipment_id=req.equipment_id,
+        equipment_name=req.equipment.name,
+        equipment_category=req.equipment.category,
+        equipment_location=req.equipment.location,
+        detected_by=req.detected_by,
+        detected_by_name=req.detected_by_user.name,
+        assigned_to=req.assigned_to,
+        assigned_to_name=req.assigned_technician.user.name if req.assigned_technician else None,
+        maintenance_team_id=req.equipment.maintenance_team_id,
+        maintenance_team_name=req.equipment.maintenance_team.name,
+        stage=req.stage,
+        scheduled_date=req.scheduled_date,
+        created_at=req.created_at,
+        overdue=req.overdue,
+        is_overdue=is_overdue
+    )
+
+
+def parse_include(include: str | None) -> set[str]:
+    """Validate a comma-separated include parameter against crud_request.REQUEST_INCLUDES."""
+    if include is None:
+        return set()
+    requested = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = sorted(requested - set(crud_request.REQUEST_INCLUDES))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {', '.join(unknown)}. Allowed: {', '.join(crud_request.REQUEST_INCLUDES)}"
+        )
+    return requested
+
+
+def build_compound_response(
+    req: MaintenanceRequest,
+    is_overdue: bool,
+    include: set[str],
+    hours_total: float | None
+) -> MaintenanceRequestCompoundResponse:
+    """Build the detail response plus the included related data."""
+    extra = {}
+    if "time_logs" in include:
+        extra["time_logs"] = [
+            TimeLogDetailResponse(
+                id=log.id,
+                request_id=log.request_id,
+                request_subject=req.subject,
+                technician_id=log.technician_id,
+                technician_name=log.technician.user.name,
+                hours_spent=float(log.hours_spent),
+                logged_at=log.logged_at
+            )
+            for log in sorted(req.time_logs, key=lambda log: log.logged_at, reverse=True)
+        ]
+    if "audit_logs" in include:
+        extra["audit_logs"] = [
+            RequestAuditLogDetailResponse(
+                id=entry.id,
+                request_id=entry.request_id,
+                request_subject=req.subject,
+                changed_by=entry.changed_by,
+                changed_by_name=entry.changed_by_user.name,
+                old_stage=entry.old_stage,
+                new_stage=entry.new_stage,
+                notes=None,
+                changed_at=entry.changed_at
+            )
+            for entry in sorted(req.audit_logs, key=lambda entry: entry.changed_at)
+        ]
+    if "hours_total" in include:
+        extra["hours_total"] = hours_total
+
+    detail = build_detail_response(req, is_overdue)
+    return MaintenanceRequestCompoundResponse(**detail.model_dump(), **extra)
+
+
+def encode_board_cursor(req: MaintenanceRequest) -> str:
+    """Encode the (created_at, id) position of a board card as an opaque cursor."""
+    raw = f"{req.created_at.isoformat()}|{req.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_board_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a board cursor, raising 400 if it was not produced by encode_board_cursor."""
+    try:
+        created_at, request_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(request_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def build_board_page(stage: RequestStage, cards: list[MaintenanceRequest], has_more: bool) -> dict:
+    """Build the fields shared by board columns and column pages."""
+    today = datetime.utcnow().date()
+    return {
+        "stage": stage,
+        "cards": [build_detail_response(req, request_is_overdue(req, today)) for req in cards],
+        "next_cursor": encode_board_cursor(cards[-1]) if has_more and cards else None
+    }
+
+
 @router.get("/", response_model=list[MaintenanceRequestDetailResponse])
 async def list_requests(
     skip: int = Query(0, ge=0),
@@ -28,10 +158,12 @@ async def list_requests(
     stage: RequestStage | None = None,
     request_type: RequestType | None = None,
     search: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated fields to return (id is always included)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all maintenance requests with filters."""
+    selected_fields = parse_fields(fields, crud_request.REQUEST_FIELDS)
     requests = crud_request.get_requests(
         db,
         skip=skip,
@@ -40,79 +172,101 @@ async def list_requests(
         assigned_to=assigned_to,
         stage=stage,
         request_type=request_type,
-        search=search
+        search=search,
+        fields=selected_fields
     )
+    if selected_fields:
+        return fieldset_response(requests)
     
-    # Build detailed response
-    result = []
-    now = datetime.utcnow().date()
-    for req in requests:
-        is_overdue = (
-            req.scheduled_date is not None and
-            req.scheduled_date < now and
-            req.stage in [RequestStage.new, RequestStage.in_progress]
-        )
-        
-        result.append(MaintenanceRequestDetailResponse(
-            id=req.id,
-            subject=req.subject,
-            description=req.description,
-            request_type=req.request_type,
-            equipment_id=req.equipment_id,
-            equipment_name=req.equipment.name,
-            equipment_category=req.equipment.category,
-            equipment_location=req.equipment.location,
-            detected_by=req.detected_by,
-            detected_by_name=req.detected_by_user.name,
-            assigned_to=req.assigned_to,
-            assigned_to_name=req.assigned_technician.user.name if req.assigned_technician else None,
-            maintenance_team_id=req.equipment.maintenance_team_id,
-            maintenance_team_name=req.equipment.maintenance_team.name,
-            stage=req.stage,
-            scheduled_date=req.scheduled_date,
-            created_at=req.created_at,
-            overdue=req.overdue,
-            is_overdue=is_overdue
-        ))
-    
-    return result
+    today = datetime.utcnow().date()
+    return [build_detail_response(req, request_is_overdue(req, today)) for req in requests]
 
 
-@router.get("/calendar", response_model=list[MaintenanceRequestDetailResponse])
+@router.get("/calendar", response_model=list[MaintenanceRequestDetailResponse] | list[CalendarDayResponse])
 async def get_calendar_requests(
     start_date: datetime,
     end_date: datetime,
+    granularity: Literal["request", "day"] = "request",
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get maintenance requests scheduled within a date range (for calendar view)."""
+    """Get requests scheduled within a date range (for calendar view), or per-day counts with granularity=day."""
+    if end_date < start_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end_date must not be before start_date")
+    if (end_date - start_date).days > settings.CALENDAR_MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range cannot exceed {settings.CALENDAR_MAX_RANGE_DAYS} days"
+        )
+    
+    if granularity == "day":
+        days = crud_request.get_calendar_day_counts(db, start_date.date(), end_date.date())
+        return [CalendarDayResponse(**day) for day in days]
+    
     requests = crud_request.get_calendar_requests(db, start_date, end_date)
+    return [build_detail_response(req, False) for req in requests]
+
+
+@router.get("/calendar/day/{day}", response_model=list[MaintenanceRequestDetailResponse])
+async def get_calendar_day_requests(
+    day: date,
+    limit: int = Query(settings.CALENDAR_DAY_DETAIL_LIMIT, ge=1, le=settings.CALENDAR_DAY_DETAIL_LIMIT),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the maintenance requests scheduled on a single day (capped)."""
+    requests = crud_request.get_calendar_day_requests(db, day, limit)
+    today = datetime.utcnow().date()
+    return [build_detail_response(req, request_is_overdue(req, today)) for req in requests]
+
+
+@router.get("/board", response_model=BoardResponse)
+async def get_board(
+    per_column: int = Query(20, ge=1, le=100),
+    equipment_id: UUID | None = None,
+    assigned_to: UUID | None = None,
+    request_type: RequestType | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the kanban board: total count and first cards of every stage column."""
+    board = crud_request.get_board(
+        db,
+        per_column=per_column,
+        equipment_id=equipment_id,
+        assigned_to=assigned_to,
+        request_type=request_type
+    )
     
-    result = []
-    for req in requests:
-        result.append(MaintenanceRequestDetailResponse(
-            id=req.id,
-            subject=req.subject,
-            description=req.description,
-            request_type=req.request_type,
-            equipment_id=req.equipment_id,
-            equipment_name=req.equipment.name,
-            equipment_category=req.equipment.category,
-            equipment_location=req.equipment.location,
-            detected_by=req.detected_by,
-            detected_by_name=req.detected_by_user.name,
-            assigned_to=req.assigned_to,
-            assigned_to_name=req.assigned_technician.user.name if req.assigned_technician else None,
-            maintenance_team_id=req.equipment.maintenance_team_id,
-            maintenance_team_name=req.equipment.maintenance_team.name,
-            stage=req.stage,
-            scheduled_date=req.scheduled_date,
-            created_at=req.created_at,
-            overdue=req.overdue,
-            is_overdue=False
-        ))
+    return BoardResponse(columns=[
+        BoardColumnResponse(total=total, **build_board_page(stage, cards, total > len(cards)))
+        for stage, (total, cards) in board.items()
+    ])
+
+
+@router.get("/board/{stage}", response_model=BoardColumnPage)
+async def get_board_column(
+    stage: RequestStage,
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    equipment_id: UUID | None = None,
+    assigned_to: UUID | None = None,
+    request_type: RequestType | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Load more cards of one kanban column after a cursor."""
+    cards = crud_request.get_board_column(
+        db,
+        stage,
+        after=decode_board_cursor(cursor) if cursor else None,
+        limit=limit + 1,
+        equipment_id=equipment_id,
+        assigned_to=assigned_to,
+        request_type=request_type
+    )
     
-    return result
+    return BoardColumnPage(**build_board_page(stage, cards[:limit], len(cards) > limit))
 
 
 @router.get("/overdue", response_model=list[MaintenanceRequestDetailResponse])
@@ -122,32 +276,7 @@ async def get_overdue_requests(
 ):
     """Get all overdue maintenance requests."""
     requests = crud_request.get_overdue_requests(db)
-    
-    result = []
-    for req in requests:
-        result.append(MaintenanceRequestDetailResponse(
-            id=req.id,
-            subject=req.subject,
-            description=req.description,
-            request_type=req.request_type,
-            equipment_id=req.equipment_id,
-            equipment_name=req.equipment.name,
-            equipment_category=req.equipment.category,
-            equipment_location=req.equipment.location,
-            detected_by=req.detected_by,
-            detected_by_name=req.detected_by_user.name,
-            assigned_to=req.assigned_to,
-            assigned_to_name=req.assigned_technician.user.name if req.assigned_technician else None,
-            maintenance_team_id=req.equipment.maintenance_team_id,
-            maintenance_team_name=req.equipment.maintenance_team.name,
-            stage=req.stage,
-            scheduled_date=req.scheduled_date,
-            created_at=req.created_at,
-            overdue=req.overdue,
-            is_overdue=True
-        ))
-    
-    return result
+    return [build_detail_response(req, True) for req in requests]
 
 
 @router.get("/equipment/{equipment_id}/auto-fill", response_model=MaintenanceRequestAutoFill)
@@ -164,45 +293,35 @@ async def get_auto_fill_data(
     return MaintenanceRequestAutoFill(**auto_fill_data)
 
 
-@router.get("/{request_id}", response_model=MaintenanceRequestDetailResponse)
+@router.get("/batch", response_model=list[BatchItem[MaintenanceRequestDetailResponse]])
+async def get_requests_batch(
+    ids: str = Query(..., description="Comma-separated maintenance request ids"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get several maintenance requests by id, in the requested order."""
+    request_ids = parse_batch_ids(ids)
+    found = crud_request.get_requests_by_ids(db, unique_ids(request_ids))
+    
+    today = datetime.utcnow().date()
+    return batch_items(request_ids, found, lambda req: build_detail_response(req, request_is_overdue(req, today)))
+
+
+@router.get("/{request_id}", response_model=MaintenanceRequestCompoundResponse, response_model_exclude_unset=True)
 async def get_request(
     request_id: UUID,
+    include: str | None = Query(None, description="Comma-separated: time_logs, audit_logs, hours_total"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get a specific maintenance request with details."""
-    request = crud_request.get_request_with_details(db, request_id)
-    if not request:
+    """Get a specific maintenance request with details, plus any included related data."""
+    include_set = parse_include(include)
+    result = crud_request.get_request_with_includes(db, request_id, include_set)
+    if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Maintenance request not found")
     
-    now = datetime.utcnow().date()
-    is_overdue = (
-        request.scheduled_date is not None and
-        request.scheduled_date < now and
-        request.stage in [RequestStage.new, RequestStage.in_progress]
-    )
-    
-    return MaintenanceRequestDetailResponse(
-        id=request.id,
-        subject=request.subject,
-        description=request.description,
-        request_type=request.request_type,
-        equipment_id=request.equipment_id,
-        equipment_name=request.equipment.name,
-        equipment_category=request.equipment.category,
-        equipment_location=request.equipment.location,
-        detected_by=request.detected_by,
-        detected_by_name=request.detected_by_user.name,
-        assigned_to=request.assigned_to,
-        assigned_to_name=request.assigned_technician.user.name if request.assigned_technician else None,
-        maintenance_team_id=request.equipment.maintenance_team_id,
-        maintenance_team_name=request.equipment.maintenance_team.name,
-        stage=request.stage,
-        scheduled_date=request.scheduled_date,
-        created_at=request.created_at,
-        overdue=request.overdue,
-        is_overdue=is_overdue
-    )
+    request, hours_total = result
+    return build_compound_response(request, request_is_overdue(request, datetime.utcnow().date()), include_set, hours_total)
 
 
 @router.post("/", response_model=MaintenanceRequestResponse, status_code=status.HTTP_201_CREATED)
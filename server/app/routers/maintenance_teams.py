@@ -5,6 +5,8 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.maintenance_team import MaintenanceTeamCreate, MaintenanceTeamUpdate, MaintenanceTeamResponse
 from app.crud import maintenance_team as crud_team
+from app.core.batch import parse_batch_ids, unique_ids, batch_items
+from app.schemas.batch import BatchItem
 from app.core.security import get_current_user, require_role
 from app.models.user import User
 
@@ -23,6 +25,18 @@ async def list_teams(
     return [MaintenanceTeamResponse.model_validate(team) for team in teams]
 
 
+@router.get("/batch", response_model=list[BatchItem[MaintenanceTeamResponse]])
+async def get_teams_batch(
+    ids: str = Query(..., description="Comma-separated maintenance team ids"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get several maintenance teams by id, in the requested order."""
+    team_ids = parse_batch_ids(ids)
+    found = crud_team.get_teams_by_ids(db, unique_ids(team_ids))
+    return batch_items(team_ids, found, MaintenanceTeamResponse.model_validate)
+
+
 @router.get("/{team_id}", response_model=MaintenanceTeamResponse)
 async def get_team(
     team_id: UUID,
@@ -0,0 +1,113 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.preventive_schedule import (
+    PreventiveScheduleCreate,
+    PreventiveScheduleUpdate,
+    PreventiveScheduleResponse
+)
+from app.schemas.job import JobResponse, PreventiveGenerationPayload
+from app.crud import preventive_schedule as crud_schedule
+from app.crud import background_job as crud_job
+from app.crud import equipment as crud_equipment
+from app.core.security import get_current_user, require_role
+from app.models.user import User
+
+router = APIRouter(prefix="/api/preventive-schedules", tags=["Preventive Schedules"])
+
+
+@router.get("/", response_model=list[PreventiveScheduleResponse])
+async def list_schedules(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    equipment_id: UUID | None = None,
+    category: str | None = None,
+    is_active: bool | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """List preventive maintenance schedules."""
+    schedules = crud_schedule.get_schedules(
+        db, skip=skip, limit=limit, equipment_id=equipment_id, category=category, is_active=is_active
+    )
+    return [PreventiveScheduleResponse.model_validate(schedule) for schedule in schedules]
+
+
+@router.post("/generate", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def generate_requests(
+    horizon_days: int | None = Query(None, ge=1, le=366, description="Days ahead to generate (default PM_HORIZON_DAYS)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """Queue a job creating the preventive requests due within the horizon; safe to repeat (admin/manager only)."""
+    payload = PreventiveGenerationPayload(horizon_days=horizon_days)
+    job = crud_job.enqueue_job(db, "preventive_generate", payload.model_dump(mode="json"), created_by=current_user.id)
+    return JobResponse.model_validate(job)
+
+
+@router.get("/{schedule_id}", response_model=PreventiveScheduleResponse)
+async def get_schedule(
+    schedule_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get a specific preventive schedule."""
+    schedule = crud_schedule.get_schedule(db, schedule_id)
+    if not schedule:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Preventive schedule not found")
+    
+    return PreventiveScheduleResponse.model_validate(schedule)
+
+
+@router.post("/", response_model=PreventiveScheduleResponse, status_code=status.HTTP_201_CREATED)
+async def create_schedule(
+    schedule: PreventiveScheduleCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """Create a new preventive schedule (admin/manager only)."""
+    if schedule.equipment_id and not crud_equipment.get_equipment(db, schedule.equipment_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Equipment not found")
+    
+    new_schedule = crud_schedule.create_schedule(db, schedule, current_user.id)
+    return PreventiveScheduleResponse.model_validate(new_schedule)
+
+
+@router.patch("/{schedule_id}", response_model=PreventiveScheduleResponse)
+async def update_schedule(
+    schedule_id: UUID,
+    schedule: PreventiveScheduleUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """Update a preventive schedule (admin/manager only)."""
+    existing = crud_schedule.get_schedule(db, schedule_id)
+    if not existing:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Preventive schedule not found")
+    
+    start_date = schedule.start_date or existing.start_date
+    end_date = schedule.end_date if "end_date" in schedule.model_fields_set else existing.end_date
+    if end_date is not None and end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date"
+        )
+    
+    updated_schedule = crud_schedule.update_schedule(db, schedule_id, schedule)
+    return PreventiveScheduleResponse.model_validate(updated_schedule)
+
+
+@router.delete("/{schedule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_schedule(
+    schedule_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin"))
+):
+    """Delete a preventive schedule; requests it generated are kept (admin only)."""
+    success = crud_schedule.delete_schedule(db, schedule_id)
+    if not success:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Preventive schedule not found")
+    
+    return None
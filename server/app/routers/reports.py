@@ -1,9 +1,29 @@
-from fastapi import APIRouter, Depends
+from uuid import UUID
+from datetime import date, datetime, timedelta
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.schemas.report import RequestCountByTeam, RequestCountByCategory, RequestCountByStage
+from app.schemas.report import (
+    RequestCountByTeam,
+    RequestCountByCategory,
+    RequestCountByStage,
+    TechnicianWeekWorkload,
+    TechnicianWorkload,
+    EquipmentReliability,
+    CategoryReliability,
+    TrendPoint,
+    TrendSeries,
+    TrendsResponse
+)
 from app.crud import report as crud_report
+from app.crud import workload as crud_workload
+from app.crud import reliability as crud_reliability
+from app.crud import trends as crud_trends
+from app.crud import background_job as crud_job
+from app.schemas.job import JobResponse
+from app.core.config import settings
 from app.core.security import get_current_user, require_role
 from app.models.user import User
 
@@ -67,3 +87,156 @@ async def get_requests_by_stage(
         )
         for row in results
     ]
+
+
+def report_range(start_date: date | None, end_date: date | None, default_days: int) -> tuple[date, date]:
+    """Resolve an optional start_date..end_date window, raising 400 if it is reversed or too wide."""
+    end_date = end_date or datetime.utcnow().date()
+    start_date = start_date or end_date - timedelta(days=default_days)
+    if start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date must not be after end_date")
+    if (end_date - start_date).days > settings.REPORT_MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range cannot exceed {settings.REPORT_MAX_RANGE_DAYS} days"
+        )
+    return start_date, end_date
+
+
+@router.get("/technician-workload", response_model=list[TechnicianWorkload])
+async def get_technician_workload(
+    team_id: UUID | None = Query(None),
+    start_date: date | None = Query(None, description="Defaults to WORKLOAD_DEFAULT_WEEKS before end_date"),
+    end_date: date | None = Query(None, description="Defaults to today"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """Get hours logged per ISO week and current queue depth per technician (admin/manager only)."""
+    start_date, end_date = report_range(start_date, end_date, settings.WORKLOAD_DEFAULT_WEEKS * 7)
+    weekly_rows = crud_workload.get_weekly_workload(
+        db, crud_workload.iso_week_start(start_date), crud_workload.iso_week_start(end_date), team_id
+    )
+    
+    weeks_by_technician: dict[UUID, list[TechnicianWeekWorkload]] = {}
+    for row in weekly_rows:
+        year, week, _ = row.week_start.isocalendar()
+        weeks_by_technician.setdefault(row.technician_id, []).append(TechnicianWeekWorkload(
+            week_start=row.week_start,
+            iso_week=f"{year}-W{week:02d}",
+            hours_logged=float(row.hours_logged),
+            log_count=row.log_count
+        ))
+    
+    return [
+        TechnicianWorkload(
+            technician_id=row.technician_id,
+            technician_name=row.technician_name,
+            team_id=row.team_id,
+            team_name=row.team_name,
+            is_active=row.is_active,
+            open_requests=row.open_requests or 0,
+            in_progress_requests=row.in_progress_requests or 0,
+            hours_logged=sum(week.hours_logged for week in weeks_by_technician.get(row.technician_id, [])),
+            weeks=weeks_by_technician.get(row.technician_id, [])
+        )
+        for row in crud_workload.get_technician_queues(db, team_id)
+    ]
+
+
+@router.get("/reliability/equipment", response_model=list[EquipmentReliability])
+async def get_equipment_reliability(
+    category: str | None = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """Get mean time to repair and between failures per equipment, shortest MTBF first (admin/manager only)."""
+    return [EquipmentReliability(**row) for row in crud_reliability.get_equipment_reliability(db, category, limit)]
+
+
+@router.get("/reliability/categories", response_model=list[CategoryReliability])
+async def get_category_reliability(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """Get mean time to repair and between failures per equipment category (admin/manager only)."""
+    return [CategoryReliability(**row) for row in crud_reliability.get_category_reliability(db)]
+
+
+@router.post("/reliability/refresh", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def refresh_reliability(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin"))
+):
+    """Queue a job applying new audit trail rows to the reliability statistics (admin only)."""
+    job = crud_job.enqueue_job(db, "reliability_refresh", {}, created_by=current_user.id)
+    return JobResponse.model_validate(job)
+
+
+def _trend_series_key(dimension: str, row) -> tuple[str, str | None]:
+    """Series key and display label of a trend row."""
+    if dimension == "none":
+        return "all", None
+    if dimension == "team":
+        return str(row.key), row.label
+    if dimension == "category":
+        return row.key, row.key or None
+    return row.key.value, row.key.value
+
+
+@router.get("/trends", response_model=TrendsResponse)
+async def get_trends(
+    start_date: date | None = Query(None, description="Defaults to TRENDS_DEFAULT_DAYS before end_date"),
+    end_date: date | None = Query(None, description="Defaults to today"),
+    bucket: Literal["day", "week", "month"] = Query("day"),
+    dimension: Literal["none", "team", "category", "type"] = Query("none"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin", "manager"))
+):
+    """Get requests opened and closed per day, week or month, split by a dimension (admin/manager only)."""
+    start_date, end_date = report_range(start_date, end_date, settings.TRENDS_DEFAULT_DAYS)
+    
+    periods = []
+    period = crud_trends.bucket_start(start_date, bucket)
+    while period <= end_date:
+        periods.append(period)
+        period = crud_trends.next_bucket(period, bucket)
+    
+    series: dict[str, dict] = {}
+    for row in crud_trends.get_trend_rows(db, start_date, end_date, dimension):
+        key, label = _trend_series_key(dimension, row)
+        entry = series.setdefault(key, {"label": label, "counts": {}})
+        period = crud_trends.bucket_start(row.day, bucket)
+        opened, closed = entry["counts"].get(period, (0, 0))
+        entry["counts"][period] = (opened + (row.opened or 0), closed + (row.closed or 0))
+    
+    return TrendsResponse(
+        bucket=bucket,
+        dimension=dimension,
+        start_date=start_date,
+        end_date=end_date,
+        series=[
+            TrendSeries(
+                key=key,
+                label=entry["label"],
+                opened=sum(opened for opened, _ in entry["counts"].values()),
+                closed=sum(closed for _, closed in entry["counts"].values()),
+                points=[
+                    TrendPoint(period_start=period, opened=entry["counts"].get(period, (0, 0))[0],
+                               closed=entry["counts"].get(period, (0, 0))[1])
+                    for period in periods
+                ]
+            )
+            for key, entry in sorted(series.items(), key=lambda item: item[1]["label"] or item[0])
+        ]
+    )
+
+
+@router.post("/trends/refresh", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def refresh_trends(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin"))
+):
+    """Queue a job applying new audit trail rows to the daily trend rollup (admin only)."""
+    job = crud_job.enqueue_job(db, "trends_refresh", {}, created_by=current_user.id)
+    return JobResponse.model_validate(job)
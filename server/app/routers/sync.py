@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.equipment import EquipmentResponse
+from app.schemas.maintenance_request import MaintenanceRequestResponse
+from app.schemas.time_log import TimeLogResponse
+from app.schemas.sync import SyncChangesResponse, MaintenanceRequestChanges, TimeLogChanges, EquipmentChanges
+from app.crud import change_log as crud_change_log
+from app.core.security import get_current_user
+from app.models.change_log import ChangeEntity, ChangeOperation
+from app.models.equipment import Equipment
+from app.models.maintenance_request import MaintenanceRequest
+from app.models.time_log import TimeLog
+from app.models.user import User
+
+router = APIRouter(prefix="/api/sync", tags=["Sync"])
+
+SYNC_MODELS = {
+    ChangeEntity.maintenance_request: (MaintenanceRequest, MaintenanceRequestResponse),
+    ChangeEntity.time_log: (TimeLog, TimeLogResponse),
+    ChangeEntity.equipment: (Equipment, EquipmentResponse),
+}
+
+
+def encode_sync_cursor(txid: int | None, seq: int) -> str:
+    return f"{txid or 0}-{seq}"
+
+
+def decode_sync_cursor(cursor: str) -> tuple[int, int]:
+    """Parse a cursor from a previous sync page; "0" starts from the beginning."""
+    if cursor == "0":
+        return 0, 0
+    try:
+        txid, seq = cursor.split("-")
+        return int(txid), int(seq)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("/changes", response_model=SyncChangesResponse)
+async def get_changes(
+    since: str = "0",
+    limit: int = Query(500, ge=1, le=5000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get maintenance requests, time logs and equipment changed since a sync cursor."""
+    changes = crud_change_log.get_changes(db, decode_sync_cursor(since), limit)
+    
+    # Keep only the latest operation per entity within this page
+    latest: dict[ChangeEntity, dict] = {entity_type: {} for entity_type in SYNC_MODELS}
+    for change in changes:
+        latest[change.entity_type][change.entity_id] = change.operation
+    
+    result = {}
+    for entity_type, (model, schema) in SYNC_MODELS.items():
+        operations = latest[entity_type]
+        upserted_ids = [entity_id for entity_id, op in operations.items() if op == ChangeOperation.upsert]
+        rows = db.query(model).filter(model.id.in_(upserted_ids)).all() if upserted_ids else []
+        result[entity_type] = {
+            # Rows deleted after this page are missing here; their tombstones come next page
+            "upserted": [schema.model_validate(row) for row in rows],
+            "deleted": [entity_id for entity_id, op in operations.items() if op == ChangeOperation.delete]
+        }
+    
+    last = changes[-1] if changes else None
+    return SyncChangesResponse(
+        cursor=encode_sync_cursor(last.txid, last.seq) if last else since,
+        has_more=len(changes) == limit,
+        maintenance_requests=MaintenanceRequestChanges(**result[ChangeEntity.maintenance_request]),
+        time_logs=TimeLogChanges(**result[ChangeEntity.time_log]),
+        equipment=EquipmentChanges(**result[ChangeEntity.equipment])
+    )
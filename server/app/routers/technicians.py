@@ -5,6 +5,9 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.technician import TechnicianCreate, TechnicianUpdate, TechnicianResponse, TechnicianDetailResponse
 from app.crud import technician as crud_technician
+from app.core.fields import parse_fields, fieldset_response
+from app.core.batch import parse_batch_ids, unique_ids, batch_items
+from app.schemas.batch import BatchItem
 from app.core.security import get_current_user, require_role
 from app.models.user import User
 
@@ -16,15 +19,33 @@ async def list_technicians(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     team_id: UUID | None = None,
+    fields: str | None = Query(None, description="Comma-separated fields to return (id is always included)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all technicians."""
-    technicians = crud_technician.get_technicians(db, skip=skip, limit=limit, team_id=team_id)
+    selected_fields = parse_fields(fields, crud_technician.TECHNICIAN_FIELDS)
+    technicians = crud_technician.get_technicians(
+        db, skip=skip, limit=limit, team_id=team_id, fields=selected_fields
+    )
+    if selected_fields:
+        return fieldset_response(technicians)
     
     return [TechnicianDetailResponse.model_validate(tech) for tech in technicians]
 
 
+@router.get("/batch", response_model=list[BatchItem[TechnicianDetailResponse]])
+async def get_technicians_batch(
+    ids: str = Query(..., description="Comma-separated technician ids"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get several technicians by id, in the requested order."""
+    technician_ids = parse_batch_ids(ids)
+    found = crud_technician.get_technicians_by_ids(db, unique_ids(technician_ids))
+    return batch_items(technician_ids, found, TechnicianDetailResponse.model_validate)
+
+
 @router.get("/{technician_id}", response_model=TechnicianDetailResponse)
 async def get_technician(
     technician_id: UUID,
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.time_log import TimeLogCreate, TimeLogUpdate, TimeLogResponse, TimeLogDetailResponse
 from app.crud import time_log as crud_time_log
+from app.core.fields import parse_fields, fieldset_response
 from app.core.security import get_current_user, require_role
 from app.models.user import User
 
@@ -17,17 +18,22 @@ async def list_time_logs(
     limit: int = Query(100, ge=1, le=100),
     request_id: UUID | None = None,
     technician_id: UUID | None = None,
+    fields: str | None = Query(None, description="Comma-separated fields to return (id is always included)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all time logs with filters."""
+    selected_fields = parse_fields(fields, crud_time_log.TIME_LOG_FIELDS)
     time_logs = crud_time_log.get_time_logs(
         db,
         skip=skip,
         limit=limit,
         request_id=request_id,
-        technician_id=technician_id
+        technician_id=technician_id,
+        fields=selected_fields
     )
+    if selected_fields:
+        return fieldset_response(time_logs)
     
     result = []
     for log in time_logs:
@@ -51,7 +57,7 @@ async def get_time_log(
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific time log."""
-    time_log = crud_time_log.get_time_log(db, time_log_id)
+    time_log = crud_time_log.get_time_log_with_details(db, time_log_id)
     if not time_log:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Time log not found")
     
@@ -5,6 +5,8 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.crud import user as crud_user
+from app.core.batch import parse_batch_ids, unique_ids, batch_items
+from app.schemas.batch import BatchItem
 from app.core.security import get_current_user, require_role
 from app.models.user import User
 
@@ -30,6 +32,23 @@ async def list_users(
     return [UserResponse.model_validate(user) for user in users]
 
 
+@router.get("/batch", response_model=list[BatchItem[UserResponse]])
+async def get_users_batch(
+    ids: str = Query(..., description="Comma-separated user ids"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get several users by id, in the requested order (others than yourself need admin/manager)."""
+    user_ids = parse_batch_ids(ids)
+    
+    # Same rule as GET /{user_id}: forbidden ids are reported, not fetched
+    def allowed(user_id: UUID) -> bool:
+        return current_user.id == user_id or current_user.role in ["admin", "manager"]
+    
+    found = crud_user.get_users_by_ids(db, [user_id for user_id in unique_ids(user_ids) if allowed(user_id)])
+    return batch_items(user_ids, found, UserResponse.model_validate, allowed)
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: UUID,
@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import Any
+from pydantic import BaseModel
+
+
+# Schema for a recorded slow query
+class SlowQueryResponse(BaseModel):
+    statement: str
+    parameters: dict[str, str] | list[str] | None
+    duration_ms: float
+    caller: str | None
+    recorded_at: datetime
+    plan: list[str] | None = None
+
+
+# Schema for stored request profile metadata
+class ProfileSummaryResponse(BaseModel):
+    id: str
+    method: str
+    path: str
+    route: str
+    status: int
+    duration_ms: float
+    sample_count: int
+    created_at: datetime
+
+
+# Schema for a top allocation site
+class AllocationStat(BaseModel):
+    location: str
+    size_bytes: int
+    count: int
+
+
+# Schema with full profile data
+class ProfileDetailResponse(ProfileSummaryResponse):
+    query_string: str
+    sample_interval_ms: float
+    folded_stacks: list[str]
+    top_allocations: list[AllocationStat]
+
+
+# Schema for the last run of a periodic task
+class PeriodicTaskStatus(BaseModel):
+    name: str
+    interval_seconds: int
+    last_started_at: datetime | None
+    last_finished_at: datetime | None
+    last_duration_ms: float | None
+    last_result: dict[str, Any] | None
+    last_error: str | None
+    last_node: str | None
+    run_count: int
+    failure_count: int
+    next_run_at: datetime | None
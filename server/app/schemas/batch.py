@@ -0,0 +1,12 @@
+from typing import Generic, TypeVar
+from uuid import UUID
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+# Schema for one entry of a batch fetch, in the order the ids were requested
+class BatchItem(BaseModel, Generic[T]):
+    id: UUID
+    status: int  # 200, or 404 / 403 with data omitted
+    data: T | None = None
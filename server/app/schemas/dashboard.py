@@ -0,0 +1,25 @@
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel
+from app.models.maintenance_request import RequestStage
+
+
+# Schema for per-team dashboard counts
+class DashboardTeamCount(BaseModel):
+    team_id: UUID
+    team_name: str
+    total_requests: int
+    open_requests: int
+    overdue_requests: int
+
+
+# Schema for the dashboard summary
+class DashboardSummaryResponse(BaseModel):
+    total_requests: int
+    open_requests: int
+    overdue_requests: int
+    unassigned_requests: int
+    by_stage: dict[RequestStage, int]
+    by_team: list[DashboardTeamCount] | None = None  # admin/manager only
+    warranty_expiring: int | None = None  # admin/manager only
+    generated_at: datetime
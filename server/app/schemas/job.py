@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+from pydantic import BaseModel, Field
+from app.models.background_job import JobStatus
+
+
+# Schema for enqueueing a job (the payload is validated against the kind's payload schema)
+class JobCreate(BaseModel):
+    kind: str
+    payload: dict[str, Any] = Field(default_factory=dict)
+    max_attempts: int | None = Field(None, ge=1, le=20)
+
+
+# Schema for job status and progress
+class JobResponse(BaseModel):
+    id: UUID
+    kind: str
+    payload: dict[str, Any]
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    progress: int
+    progress_total: int | None
+    result: dict[str, Any] | None
+    error: str | None
+    created_by: UUID | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+
+    model_config = {"from_attributes": True}
+
+
+# Payload of jobs that take no arguments
+class EmptyJobPayload(BaseModel):
+    model_config = {"extra": "forbid"}
+
+
+# Payload of a preventive request generation job
+class PreventiveGenerationPayload(BaseModel):
+    horizon_days: int | None = Field(None, ge=1, le=366)
+
+    model_config = {"extra": "forbid"}
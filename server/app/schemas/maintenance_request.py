@@ -2,6 +2,8 @@ from datetime import datetime, date
 from uuid import UUID
 from pydantic import BaseModel, Field, field_validator, model_validator
 from app.models.maintenance_request import RequestType, RequestStage
+from app.schemas.time_log import TimeLogDetailResponse
+from app.schemas.request_audit_log import RequestAuditLogDetailResponse
 
 
 # Base schema
@@ -22,7 +24,7 @@ class MaintenanceRequestBase(BaseModel):
 
 # Schema for creating a request (auto-fills from equipment)
 class MaintenanceRequestCreate(MaintenanceRequestBase):
-    pass
+    auto_assign: bool = False  # assign the least loaded active technician of the equipment's team
 
 
 # Schema for updating a request
@@ -43,6 +45,7 @@ class MaintenanceRequestResponse(MaintenanceRequestBase):
     stage: RequestStage
     created_at: datetime
     overdue: bool
+    schedule_id: UUID | None = None
 
     model_config = {"from_attributes": True}
 
@@ -72,9 +75,41 @@ class MaintenanceRequestDetailResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# Schema for the detail response with include= related data (only requested keys are returned)
+class MaintenanceRequestCompoundResponse(MaintenanceRequestDetailResponse):
+    time_logs: list[TimeLogDetailResponse] | None = None
+    audit_logs: list[RequestAuditLogDetailResponse] | None = None
+    hours_total: float | None = None
+
+
 # Schema for auto-fill data
 class MaintenanceRequestAutoFill(BaseModel):
     equipment_category: str
     maintenance_team_id: UUID
     maintenance_team_name: str
     equipment_location: str
+
+
+# Schema for per-day calendar aggregates (granularity=day)
+class CalendarDayResponse(BaseModel):
+    date: date
+    total: int
+    by_stage: dict[RequestStage, int]
+    by_type: dict[RequestType, int]
+
+
+# Schema for one page of a kanban board column
+class BoardColumnPage(BaseModel):
+    stage: RequestStage
+    cards: list[MaintenanceRequestDetailResponse]
+    next_cursor: str | None = None
+
+
+# Schema for a kanban board column with its total count
+class BoardColumnResponse(BoardColumnPage):
+    total: int
+
+
+# Schema for the whole kanban board
+class BoardResponse(BaseModel):
+    columns: list[BoardColumnResponse]
@@ -6,7 +6,7 @@ from pydantic import BaseModel
 # Base schema
 class MaintenanceTeamBase(BaseModel):
     name: str
-    description: str | None = None
+    specialization: str | None = None
 
 
 # Schema for creating a team
@@ -17,7 +17,7 @@ class MaintenanceTeamCreate(MaintenanceTeamBase):
 # Schema for updating a team
 class MaintenanceTeamUpdate(BaseModel):
     name: str | None = None
-    description: str | None = None
+    specialization: str | None = None
 
 
 # Schema for team response
@@ -0,0 +1,54 @@
+from datetime import datetime, date
+from uuid import UUID
+from pydantic import BaseModel, Field, model_validator
+from app.models.preventive_schedule import ScheduleUnit
+
+
+# Base schema
+class PreventiveScheduleBase(BaseModel):
+    name: str
+    subject: str
+    description: str | None = None
+    equipment_id: UUID | None = None
+    category: str | None = None
+    interval_unit: ScheduleUnit
+    interval_count: int = Field(1, ge=1)
+    start_date: date
+    end_date: date | None = None
+    is_active: bool = True
+
+    @model_validator(mode='after')
+    def validate_target(self):
+        """Ensure the schedule targets either one piece of equipment or a category"""
+        if (self.equipment_id is None) == (self.category is None):
+            raise ValueError('Set exactly one of equipment_id or category')
+        if self.end_date is not None and self.end_date < self.start_date:
+            raise ValueError('end_date must not be before start_date')
+        return self
+
+
+# Schema for creating a schedule
+class PreventiveScheduleCreate(PreventiveScheduleBase):
+    pass
+
+
+# Schema for updating a schedule (the target cannot change)
+class PreventiveScheduleUpdate(BaseModel):
+    name: str | None = None
+    subject: str | None = None
+    description: str | None = None
+    interval_unit: ScheduleUnit | None = None
+    interval_count: int | None = Field(None, ge=1)
+    start_date: date | None = None
+    end_date: date | None = None
+    is_active: bool | None = None
+
+
+# Schema for schedule response
+class PreventiveScheduleResponse(PreventiveScheduleBase):
+    id: UUID
+    created_by: UUID
+    created_at: datetime
+    generated_through: date | None
+
+    model_config = {"from_attributes": True}
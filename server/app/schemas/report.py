@@ -1,3 +1,5 @@
+from datetime import date
+from uuid import UUID
 from pydantic import BaseModel
 
 
@@ -23,3 +25,70 @@ class RequestCountByCategory(BaseModel):
 class RequestCountByStage(BaseModel):
     stage: str
     count: int
+
+
+# Schema for one ISO week of a technician's workload
+class TechnicianWeekWorkload(BaseModel):
+    week_start: date
+    iso_week: str
+    hours_logged: float
+    log_count: int
+
+
+# Schema for the technician workload report
+class TechnicianWorkload(BaseModel):
+    technician_id: UUID
+    technician_name: str
+    team_id: UUID
+    team_name: str
+    is_active: bool
+    open_requests: int
+    in_progress_requests: int
+    hours_logged: float
+    weeks: list[TechnicianWeekWorkload]
+
+
+# Schema for MTTR / MTBF of one piece of equipment
+class EquipmentReliability(BaseModel):
+    equipment_id: UUID
+    equipment_name: str
+    category: str | None
+    repair_count: int
+    mttr_hours: float | None
+    failure_count: int
+    mtbf_hours: float | None
+
+
+# Schema for MTTR / MTBF of an equipment category
+class CategoryReliability(BaseModel):
+    category: str | None
+    equipment_count: int
+    repair_count: int
+    mttr_hours: float | None
+    failure_count: int
+    mtbf_hours: float | None
+
+
+# Schema for one bucket of a trend series
+class TrendPoint(BaseModel):
+    period_start: date
+    opened: int
+    closed: int
+
+
+# Schema for the trend of one dimension value (team, category, type or "all")
+class TrendSeries(BaseModel):
+    key: str
+    label: str | None
+    opened: int
+    closed: int
+    points: list[TrendPoint]
+
+
+# Schema for the opened/closed trends report
+class TrendsResponse(BaseModel):
+    bucket: str
+    dimension: str
+    start_date: date
+    end_date: date
+    series: list[TrendSeries]
@@ -0,0 +1,30 @@
+from uuid import UUID
+from pydantic import BaseModel
+from app.schemas.equipment import EquipmentResponse
+from app.schemas.maintenance_request import MaintenanceRequestResponse
+from app.schemas.time_log import TimeLogResponse
+
+
+# Schemas for the changes of one entity type since a sync cursor
+class MaintenanceRequestChanges(BaseModel):
+    upserted: list[MaintenanceRequestResponse] = []
+    deleted: list[UUID] = []
+
+
+class TimeLogChanges(BaseModel):
+    upserted: list[TimeLogResponse] = []
+    deleted: list[UUID] = []
+
+
+class EquipmentChanges(BaseModel):
+    upserted: list[EquipmentResponse] = []
+    deleted: list[UUID] = []
+
+
+# Schema for a delta sync page
+class SyncChangesResponse(BaseModel):
+    cursor: str
+    has_more: bool
+    maintenance_requests: MaintenanceRequestChanges
+    time_logs: TimeLogChanges
+    equipment: EquipmentChanges
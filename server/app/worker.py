@@ -0,0 +1,143 @@
+"""
+Background job worker.
+
+Run from the server/ directory next to the API:
+    python -m app.worker
+    python -m app.worker --concurrency 8 --mode process --kind trends_refresh
+
+Each runner loops: claim one due job (SELECT ... FOR UPDATE SKIP LOCKED), run
+its handler, then record the result or the failed attempt. Runners sleep
+JOB_POLL_SECONDS when nothing is due. In thread mode the runners share this
+process's connection pool, which suits handlers that mostly wait on the
+database; in process mode each runner is a spawned process with its own
+engine, for CPU-heavy handlers. SIGINT/SIGTERM stop claiming new jobs and let
+running ones finish.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.crud import background_job as crud_job
+from app.jobs import JOB_KINDS, JobProgress
+
+logger = logging.getLogger("gearguard.worker")
+
+
+def run_one(session_factory: sessionmaker, worker_id: str, kinds: list[str]) -> bool:
+    """Claim and run one due job; False if none was due."""
+    db = session_factory()
+    try:
+        job = crud_job.claim_job(db, worker_id, kinds)
+        if job is None:
+            return False
+        job_id, kind, payload = job.id, job.kind, job.payload
+        attempts, max_attempts = job.attempts, job.max_attempts
+    finally:
+        db.close()
+
+    job_kind = JOB_KINDS[kind]
+    db = session_factory()
+    try:
+        result = job_kind.handler(
+            db, job_kind.payload_schema.model_validate(payload), JobProgress(session_factory, job_id, worker_id)
+        )
+    except Exception as exc:
+        db.rollback()
+        logger.exception("Job %s (%s) attempt %d/%d failed", job_id, kind, attempts, max_attempts)
+        status = crud_job.fail_job(db, job_id, worker_id, attempts, max_attempts, f"{type(exc).__name__}: {exc}")
+        logger.info("Job %s (%s) is now %s", job_id, kind, status.value)
+        return True
+    else:
+        crud_job.complete_job(db, job_id, worker_id, result)
+        logger.info("Job %s (%s) succeeded", job_id, kind)
+        return True
+    finally:
+        db.close()
+
+
+def run_jobs(session_factory: sessionmaker, worker_id: str, kinds: list[str], stop: threading.Event) -> None:
+    """Run due jobs until stop is set, waiting JOB_POLL_SECONDS whenever the queue is idle."""
+    while not stop.is_set():
+        try:
+            ran = run_one(session_factory, worker_id, kinds)
+        except Exception:
+            # Database unavailable or similar: back off and keep the runner alive
+            logger.exception("Job runner %s could not claim a job", worker_id)
+            ran = False
+        if not ran:
+            stop.wait(settings.JOB_POLL_SECONDS)
+
+
+def _handle_stop_signals(stop: threading.Event) -> None:
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+
+def _process_runner(worker_id: str, kinds: list[str]) -> None:
+    """Entry point of one runner process (spawned, so it opens its own engine)."""
+    from app.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    stop = threading.Event()
+    _handle_stop_signals(stop)
+    run_jobs(SessionLocal, worker_id, kinds, stop)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run GearGuard background jobs")
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_WORKER_CONCURRENCY,
+                        help="Jobs run at once")
+    parser.add_argument("--mode", choices=("thread", "process"), default=settings.JOB_WORKER_MODE,
+                        help="Run jobs on a thread pool or a process pool")
+    parser.add_argument("--kind", action="append", choices=sorted(JOB_KINDS), dest="kinds",
+                        help="Only run jobs of this kind (repeatable; default: all)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    kinds = args.kinds or sorted(JOB_KINDS)
+    worker_ids = [f"{socket.gethostname()}:{os.getpid()}:{index}" for index in range(max(args.concurrency, 1))]
+    logger.info("Starting %d %s runners for %s", len(worker_ids), args.mode, ", ".join(kinds))
+
+    stop = threading.Event()
+    _handle_stop_signals(stop)
+
+    if args.mode == "process":
+        context = multiprocessing.get_context("spawn")
+        runners = [context.Process(target=_process_runner, args=(worker_id, kinds), name=worker_id)
+                   for worker_id in worker_ids]
+    else:
+        from app.database import SessionLocal
+
+        runners = [threading.Thread(target=run_jobs, args=(SessionLocal, worker_id, kinds, stop), name=worker_id)
+                   for worker_id in worker_ids]
+    for runner in runners:
+        runner.start()
+
+    # Wake periodically so signals are handled while the runners work
+    while not stop.wait(1.0):
+        if not any(runner.is_alive() for runner in runners):
+            break
+    stop.set()
+    if args.mode == "process":
+        for runner in runners:
+            runner.terminate()  # SIGTERM: the runner finishes its current job, then exits
+
+    for runner in runners:
+        runner.join()
+    logger.info("Job workers stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""
+Benchmark harnesses for the GearGuard API.
+
+Run from the server/ directory, e.g.:
+    python -m benchmarks.http_load --help
+"""
@@ -0,0 +1,238 @@
+"""
+Benchmark for deleting an asset with a long maintenance history.
+
+Loads one equipment record with --requests historical maintenance requests
+(10,000 by default), each with its audit trail and time logs, using COPY, then
+deletes it and reports wall time and SQL statement count per mode:
+
+    orm_cascade   load every request and its time logs and audit logs into the
+                  session and let the ORM cascades delete them row by row, as
+                  delete_equipment did before the relationships were marked
+                  passive_deletes
+    db_cascade    a single DELETE of the equipment row; the ON DELETE CASCADE
+                  foreign keys remove the requests, time logs and audit logs
+    crud          app.crud.equipment.delete_equipment, i.e. db_cascade plus the
+                  change log tombstones, workload rollup and calendar upkeep
+
+Every run gets a freshly loaded asset. Fixture rows carry a unique suffix and
+are removed afterwards, so an existing dataset is left as it was.
+
+Usage (from the server/ directory, against Postgres):
+    python -m benchmarks.cascade_delete
+    python -m benchmarks.cascade_delete --requests 50000 --repeat 5 --mode db_cascade --mode crud
+"""
+import argparse
+import os
+import platform
+import random
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from benchmarks.dataset import BENCH_PASSWORD_HASH, CopyWriter
+from benchmarks.stats import summarize, write_results, load_results, compare
+
+MODES = ("orm_cascade", "db_cascade", "crud")
+HISTORY_DAYS = 5 * 365
+
+
+def create_support_rows(engine: Engine, suffix: str) -> dict[str, str]:
+    """Department, team, reporting user and technician shared by every loaded asset."""
+    ids = {key: str(uuid.uuid4()) for key in ("department_id", "team_id", "user_id", "technician_id")}
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO departments (id, name) VALUES (:department_id, :name)"),
+                     {**ids, "name": f"Cascade Department {suffix}"})
+        conn.execute(text("INSERT INTO maintenance_teams (id, name) VALUES (:team_id, :name)"),
+                     {**ids, "name": f"Cascade Team {suffix}"})
+        conn.execute(text(
+            "INSERT INTO users (id, name, email, role, password_hash, is_active, created_at) "
+            "VALUES (:user_id, 'Cascade Technician', :email, 'technician', :password_hash, TRUE, NOW())"
+        ), {**ids, "email": f"cascade-{suffix}@bench.gearguard.com", "password_hash": BENCH_PASSWORD_HASH})
+        conn.execute(text(
+            "INSERT INTO technicians (id, user_id, team_id, is_active) VALUES (:technician_id, :user_id, :team_id, TRUE)"
+        ), ids)
+    return ids
+
+
+def load_asset(engine: Engine, support: dict[str, str], suffix: str, index: int,
+               requests: int, rng: random.Random) -> tuple[str, dict[str, int]]:
+    """COPY one asset with `requests` repaired requests, their audit trail and time logs."""
+    equipment_id = str(uuid.uuid4())
+    now = datetime.utcnow().replace(microsecond=0)
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        out = CopyWriter(cursor)
+        out.write("equipment", (
+            equipment_id, f"Cascade Asset {index}", f"CASCADE-{index}-{suffix}", "Machinery",
+            (now - timedelta(days=HISTORY_DAYS)).date().isoformat(), None, "Cascade Bay",
+            support["department_id"], None, support["team_id"], "active",
+        ))
+        out.flush("equipment")
+        for i in range(requests):
+            request_id = str(uuid.uuid4())
+            created_at = now - timedelta(minutes=rng.randint(0, HISTORY_DAYS * 24 * 60))
+            out.write("maintenance_requests", (
+                request_id, f"Fault #{i}", f"Historical request {i}", "corrective", equipment_id,
+                support["user_id"], support["technician_id"], None, "repaired", False, created_at.isoformat(),
+            ))
+            changed_at = created_at
+            for old_stage, new_stage in ((None, "new"), ("new", "in_progress"), ("in_progress", "repaired")):
+                out.write("request_audit_logs", (
+                    str(uuid.uuid4()), request_id, old_stage, new_stage, support["user_id"], changed_at.isoformat()
+                ))
+                changed_at += timedelta(minutes=rng.randint(10, 24 * 60))
+            for _ in range(rng.randint(1, 3)):
+                out.write("time_logs", (
+                    str(uuid.uuid4()), request_id, support["technician_id"],
+                    round(rng.uniform(0.25, 8.0), 2), (created_at + (changed_at - created_at) * rng.random()).isoformat()
+                ))
+            if out.should_flush("maintenance_requests"):
+                out.flush("maintenance_requests", "request_audit_logs", "time_logs")
+        out.flush("maintenance_requests", "request_audit_logs", "time_logs")
+        raw.commit()
+        cursor.close()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE equipment, maintenance_requests, request_audit_logs, time_logs"))
+    return equipment_id, out.counts
+
+
+def delete_orm_cascade(engine: Engine, session_factory, equipment_id: uuid.UUID) -> None:
+    """Load the whole history into the session and let the ORM delete it row by row."""
+    from app.models.equipment import Equipment
+
+    db = session_factory()
+    try:
+        equipment = db.get(Equipment, equipment_id)
+        # Lazy loads per request, exactly what the cascade did without passive_deletes
+        for request in equipment.maintenance_requests:
+            request.time_logs, request.audit_logs
+        db.delete(equipment)
+        db.commit()
+    finally:
+        db.close()
+
+
+def delete_db_cascade(engine: Engine, session_factory, equipment_id: uuid.UUID) -> None:
+    """One DELETE; the foreign keys cascade to requests, time logs and audit logs."""
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM equipment WHERE id = :id"), {"id": equipment_id})
+
+
+def delete_crud(engine: Engine, session_factory, equipment_id: uuid.UUID) -> None:
+    """The API's delete path."""
+    from app.crud.equipment import delete_equipment
+
+    db = session_factory()
+    try:
+        if not delete_equipment(db, equipment_id):
+            raise RuntimeError(f"Equipment {equipment_id} was not found")
+    finally:
+        db.close()
+
+
+DELETERS: dict[str, Callable] = {
+    "orm_cascade": delete_orm_cascade,
+    "db_cascade": delete_db_cascade,
+    "crud": delete_crud,
+}
+
+
+def remove_support_rows(engine: Engine, support: dict[str, str], suffix: str) -> None:
+    """Delete whatever a failed run left behind, then the shared fixture rows."""
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM equipment WHERE serial_number LIKE :pattern"),
+                     {"pattern": f"CASCADE-%-{suffix}"})
+        conn.execute(text("DELETE FROM request_daily_trends WHERE team_id = :team_id"), support)
+        conn.execute(text("DELETE FROM technician_weekly_workload WHERE technician_id = :technician_id"), support)
+        conn.execute(text("DELETE FROM technicians WHERE id = :technician_id"), support)
+        conn.execute(text("DELETE FROM maintenance_teams WHERE id = :team_id"), support)
+        conn.execute(text("DELETE FROM departments WHERE id = :department_id"), support)
+        conn.execute(text("DELETE FROM users WHERE id = :user_id"), support)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Time deleting an asset with a long request history")
+    parser.add_argument("--database-url", help="Postgres URL (defaults to DATABASE_URL / app settings)")
+    parser.add_argument("--requests", type=int, default=10_000, help="Historical requests on the asset")
+    parser.add_argument("--mode", action="append", choices=MODES, dest="modes",
+                        help="Delete mode to run (repeatable; default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Deletes per mode, each on a fresh asset")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmarks/results/cascade_delete.json")
+    parser.add_argument("--compare", help="Previous result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Flag modes whose median grew by more than this fraction")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from app.core.sql_stats import track_queries
+    from app.database import engine, SessionLocal
+
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("The cascade delete benchmark requires PostgreSQL (it loads rows with COPY)")
+
+    rng = random.Random(args.seed)
+    suffix = uuid.uuid4().hex[:8]
+    support = create_support_rows(engine, suffix)
+    results = {}
+    try:
+        for mode in args.modes or MODES:
+            samples, statements = [], []
+            for run in range(args.repeat):
+                equipment_id, counts = load_asset(engine, support, suffix, run, args.requests, rng)
+                started = time.perf_counter()
+                with track_queries() as stats:
+                    DELETERS[mode](engine, SessionLocal, uuid.UUID(equipment_id))
+                samples.append(time.perf_counter() - started)
+                statements.append(stats.count)
+            results[mode] = {
+                **summarize(samples),
+                "statements": max(statements),
+                "rows_deleted": sum(counts.values()),
+            }
+            print(f"{mode:<12} p50 {results[mode]['p50_ms']:>10.1f} ms  max {results[mode]['max_ms']:>10.1f} ms  "
+                  f"{results[mode]['statements']:>6} statements  {results[mode]['rows_deleted']:,} rows")
+    finally:
+        remove_support_rows(engine, support, suffix)
+
+    write_results(args.output, {
+        "benchmark": "cascade_delete",
+        "timestamp": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"requests": args.requests, "repeat": args.repeat, "seed": args.seed},
+        "modes": results,
+    })
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressions = compare(load_results(args.compare)["modes"], results,
+                              metric="p50_ms", threshold=args.threshold)
+        if regressions:
+            print("\nRegressions (p50):")
+            for reg in regressions:
+                print(f"  {reg['name']}: {reg['baseline']} ms -> {reg['current']} ms (+{reg['change_pct']}%)")
+            return 1
+        print("\nNo p50 regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
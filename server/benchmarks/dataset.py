@@ -0,0 +1,368 @@
+"""
+Parametric synthetic data generator for scale testing.
+
+Produces N departments, teams, technicians, users and equipment plus M
+maintenance requests with realistic stage, audit trail and time log
+distributions from a fixed random seed, and streams them into Postgres with
+COPY. Rows are generated and copied in chunks, so memory stays flat and ten
+million rows load in minutes. Every generated user shares BENCH_PASSWORD,
+whose bcrypt hash is precomputed instead of hashed per user.
+
+Usage (from the server/ directory; TRUNCATES all application tables):
+    python -m benchmarks.dataset --scale medium
+    python -m benchmarks.dataset --equipment 100000 --requests 5000000 --seed 7
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+BENCH_PASSWORD = "password123"
+# bcrypt hash of BENCH_PASSWORD, precomputed so loading users costs nothing
+BENCH_PASSWORD_HASH = "$2b$12$UKq80wbSYMc0npGk5OtbxuIY4KbBU8utF.EzGzaDfjLdMiyEsT1Bq"
+BENCH_ADMIN_EMAIL = "bench.admin@bench.gearguard.com"
+
+# Category -> relative share of the asset base
+CATEGORIES = {
+    "Server": 8, "Network": 10, "Storage": 4, "Laptop": 20, "Printer": 8,
+    "Machinery": 15, "HVAC": 10, "Electrical": 10, "Forklift": 5, "Conveyor": 10,
+}
+# Stage mix for requests by age: (max age in days, weights for new/in_progress/repaired/scrap)
+STAGE_WEIGHTS_BY_AGE = (
+    (7, (55, 35, 9, 1)),
+    (30, (25, 30, 42, 3)),
+    (90, (8, 12, 75, 5)),
+    (None, (2, 3, 87, 8)),
+)
+PREVENTIVE_SHARE = 0.3
+COPY_CHUNK_ROWS = 50_000
+
+TABLE_COLUMNS = {
+    "departments": ("id", "name", "description"),
+    "maintenance_teams": ("id", "name", "specialization"),
+    "users": ("id", "name", "email", "role", "password_hash", "is_active", "created_at"),
+    "technicians": ("id", "user_id", "team_id", "is_active"),
+    "equipment": (
+        "id", "name", "serial_number", "category", "purchase_date", "warranty_expiry",
+        "location", "department_id", "assigned_employee", "maintenance_team_id", "status",
+    ),
+    "maintenance_requests": (
+        "id", "subject", "description", "request_type", "equipment_id", "detected_by",
+        "assigned_to", "scheduled_date", "stage", "overdue", "created_at",
+    ),
+    "request_audit_logs": ("id", "request_id", "old_stage", "new_stage", "changed_by", "changed_at"),
+    "time_logs": ("id", "request_id", "technician_id", "hours_spent", "logged_at"),
+}
+
+
+@dataclass(frozen=True)
+class DatasetScale:
+    departments: int
+    teams: int
+    technicians: int
+    users: int
+    equipment: int
+    requests: int
+    history_days: int = 365
+
+
+SCALES = {
+    "small": DatasetScale(departments=5, teams=4, technicians=20, users=50, equipment=500, requests=5_000),
+    "medium": DatasetScale(departments=20, teams=10, technicians=100, users=500, equipment=5_000, requests=50_000),
+    "large": DatasetScale(departments=50, teams=25, technicians=500, users=2_000, equipment=50_000, requests=500_000),
+    "xlarge": DatasetScale(
+        departments=200, teams=100, technicians=2_000, users=20_000, equipment=250_000, requests=3_000_000,
+        history_days=3 * 365,
+    ),
+}
+
+
+class CopyWriter:
+    """Buffer rows per table and flush them to Postgres with COPY ... FROM STDIN."""
+
+    def __init__(self, cursor, chunk_rows: int = COPY_CHUNK_ROWS):
+        self.cursor = cursor
+        self.chunk_rows = chunk_rows
+        self.buffers: dict[str, io.StringIO] = {}
+        self.writers: dict[str, csv.writer] = {}
+        self.pending: dict[str, int] = {}
+        self.counts: dict[str, int] = {}
+
+    def write(self, table: str, row: tuple) -> None:
+        if table not in self.buffers:
+            self.buffers[table] = io.StringIO()
+            self.writers[table] = csv.writer(self.buffers[table])
+            self.pending[table] = 0
+            self.counts.setdefault(table, 0)
+        self.writers[table].writerow(row)
+        self.pending[table] += 1
+        self.counts[table] += 1
+
+    def flush(self, *tables: str) -> None:
+        """Flush the given tables (in order), or all tables in insertion order."""
+        for table in tables or list(self.buffers):
+            buffer = self.buffers.get(table)
+            if buffer is None or not self.pending[table]:
+                continue
+            buffer.seek(0)
+            columns = ", ".join(TABLE_COLUMNS[table])
+            self.cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+            self.buffers[table] = io.StringIO()
+            self.writers[table] = csv.writer(self.buffers[table])
+            self.pending[table] = 0
+
+    def should_flush(self, table: str) -> bool:
+        return self.pending.get(table, 0) >= self.chunk_rows
+
+
+class DatasetGenerator:
+    """Deterministic row generator for one dataset scale and seed."""
+
+    def __init__(self, scale: DatasetScale, seed: int = 42, now: datetime | None = None):
+        self.scale = scale
+        self.rng = random.Random(seed)
+        # Anchor timestamps to midnight so the same seed always yields the same rows per day
+        self.now = now or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def uuid(self) -> str:
+        # Formatting the hex directly is several times faster than uuid.UUID()
+        h = f"{self.rng.getrandbits(128):032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+    def _stage_for_age(self, age_days: float) -> str:
+        for max_age, weights in STAGE_WEIGHTS_BY_AGE:
+            if max_age is None or age_days <= max_age:
+                return self.rng.choices(("new", "in_progress", "repaired", "scrap"), weights=weights)[0]
+        return "repaired"
+
+    def _hours(self) -> float:
+        # Log-normal work durations: median about 1.5 h, long tail capped at 12 h
+        return round(min(max(self.rng.lognormvariate(0.4, 0.8), 0.25), 12.0), 2)
+
+    def generate(self, out: CopyWriter) -> None:
+        rng = self.rng
+        scale = self.scale
+        now = self.now
+
+        departments = [self.uuid() for _ in range(scale.departments)]
+        for i, dept_id in enumerate(departments):
+            out.write("departments", (dept_id, f"Department {i}", f"Synthetic department {i}"))
+
+        teams = [self.uuid() for _ in range(scale.teams)]
+        categories = list(CATEGORIES)
+        for i, team_id in enumerate(teams):
+            out.write("maintenance_teams", (team_id, f"Team {i}", categories[i % len(categories)]))
+        out.flush("departments", "maintenance_teams")
+
+        users = []
+        admin_id = self.uuid()
+        users.append(admin_id)
+        out.write("users", (
+            admin_id, "Bench Admin", BENCH_ADMIN_EMAIL, "admin", BENCH_PASSWORD_HASH, True, now.isoformat()
+        ))
+        manager_count = max(1, scale.teams // 2)
+        for i in range(manager_count):
+            user_id = self.uuid()
+            users.append(user_id)
+            out.write("users", (
+                user_id, f"Manager {i}", f"bench.manager{i}@bench.gearguard.com", "manager",
+                BENCH_PASSWORD_HASH, True, now.isoformat()
+            ))
+
+        technicians_by_team: dict[str, list[str]] = {team_id: [] for team_id in teams}
+        technician_rows = []
+        for i in range(scale.technicians):
+            user_id = self.uuid()
+            users.append(user_id)
+            out.write("users", (
+                user_id, f"Technician {i}", f"bench.tech{i}@bench.gearguard.com", "technician",
+                BENCH_PASSWORD_HASH, True, now.isoformat()
+            ))
+            tech_id = self.uuid()
+            team_id = teams[i % len(teams)]
+            technicians_by_team[team_id].append(tech_id)
+            technician_rows.append((tech_id, user_id, team_id, rng.random() > 0.05))
+
+        for i in range(scale.users):
+            user_id = self.uuid()
+            users.append(user_id)
+            created_at = now - timedelta(days=rng.randint(0, scale.history_days))
+            out.write("users", (
+                user_id, f"User {i}", f"bench.user{i}@bench.gearguard.com", "user",
+                BENCH_PASSWORD_HASH, True, created_at.isoformat()
+            ))
+            if out.should_flush("users"):
+                out.flush("users")
+        out.flush("users")
+
+        for row in technician_rows:
+            out.write("technicians", row)
+        out.flush("technicians")
+
+        # Equipment: categories by share, a long-tailed failure weight per asset
+        equipment = []
+        equipment_weights = []
+        category_weights = list(CATEGORIES.values())
+        for i in range(scale.equipment):
+            eq_id = self.uuid()
+            category = rng.choices(categories, weights=category_weights)[0]
+            team_id = teams[categories.index(category) % len(teams)] if rng.random() < 0.8 else rng.choice(teams)
+            purchase_date = (now - timedelta(days=rng.randint(30, 10 * 365))).date()
+            warranty_expiry = purchase_date + timedelta(days=rng.choice((365, 730, 1095, 1825)))
+            status = "scrapped" if rng.random() < 0.03 else "active"
+            out.write("equipment", (
+                eq_id, f"{category} {i}", f"SN-{i:09d}", category, purchase_date.isoformat(),
+                warranty_expiry.isoformat(), f"Building {rng.randint(1, 40)} / Room {rng.randint(1, 300)}",
+                rng.choice(departments), f"Employee {rng.randint(1, max(scale.users, 1))}", team_id, status,
+            ))
+            equipment.append((eq_id, team_id, category))
+            equipment_weights.append(rng.paretovariate(1.5))
+            if out.should_flush("equipment"):
+                out.flush("equipment")
+        out.flush("equipment")
+
+        cumulative = []
+        total = 0.0
+        for weight in equipment_weights:
+            total += weight
+            cumulative.append(total)
+
+        history_minutes = scale.history_days * 24 * 60
+        for i in range(scale.requests):
+            eq_id, team_id, category = rng.choices(equipment, cum_weights=cumulative)[0]
+            request_id = self.uuid()
+            created_at = now - timedelta(minutes=rng.randint(0, history_minutes))
+            age_days = (now - created_at).total_seconds() / 86400
+            stage = self._stage_for_age(age_days)
+            preventive = rng.random() < PREVENTIVE_SHARE
+            scheduled_date = None
+            if preventive or rng.random() < 0.15:
+                scheduled_date = (created_at + timedelta(days=rng.randint(1, 45))).date()
+            detected_by = rng.choice(users)
+            team_techs = technicians_by_team.get(team_id) or []
+            assigned_to = rng.choice(team_techs) if team_techs and (stage != "new" or rng.random() < 0.3) else None
+
+            out.write("maintenance_requests", (
+                request_id,
+                f"{'Scheduled service' if preventive else 'Fault'}: {category} #{i}",
+                f"Synthetic {'preventive' if preventive else 'corrective'} request {i}",
+                "preventive" if preventive else "corrective",
+                eq_id, detected_by, assigned_to,
+                scheduled_date.isoformat() if scheduled_date else None,
+                stage, False, created_at.isoformat(),
+            ))
+
+            # Audit trail: creation, then new -> in_progress -> repaired/scrap as far as the stage got
+            changed_at = created_at
+            out.write("request_audit_logs", (self.uuid(), request_id, None, "new", detected_by, changed_at.isoformat()))
+            path = {"new": (), "in_progress": ("in_progress",), "repaired": ("in_progress", "repaired"),
+                    "scrap": ("in_progress", "scrap")}[stage]
+            previous = "new"
+            for next_stage in path:
+                changed_at = min(changed_at + timedelta(minutes=rng.randint(10, 72 * 60)), now)
+                out.write("request_audit_logs", (
+                    self.uuid(), request_id, previous, next_stage, rng.choice(users), changed_at.isoformat()
+                ))
+                previous = next_stage
+
+            if assigned_to is not None and stage != "new":
+                for _ in range(1 + min(int(rng.expovariate(0.8)), 6)):
+                    logged_at = created_at + (changed_at - created_at) * rng.random()
+                    out.write("time_logs", (self.uuid(), request_id, assigned_to, self._hours(), logged_at.isoformat()))
+
+            if out.should_flush("maintenance_requests"):
+                out.flush("maintenance_requests", "request_audit_logs", "time_logs")
+        out.flush("maintenance_requests", "request_audit_logs", "time_logs")
+
+
+def clear_dataset(engine: Engine) -> None:
+    """Remove all rows from the application tables."""
+    with engine.begin() as conn:
+        # Rollups, their watermarks and the scheduler's run log have no foreign keys to the data;
+        # left behind they would keep stale rows and skip the reloaded history
+        conn.execute(text(
+            "TRUNCATE time_logs, request_audit_logs, maintenance_requests, equipment, "
+            "technicians, maintenance_teams, departments, users, change_log, analytics_watermarks, "
+            "request_daily_trends, periodic_task_runs CASCADE"
+        ))
+
+
+def load_dataset(engine: Engine, scale: DatasetScale, seed: int = 42) -> dict[str, int]:
+    """Replace the database contents with a synthetic dataset and return row counts."""
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("The synthetic data generator requires PostgreSQL (it loads rows with COPY)")
+
+    clear_dataset(engine)
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        out = CopyWriter(cursor)
+        DatasetGenerator(scale, seed).generate(out)
+        raw.commit()
+        cursor.close()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+    # COPY bypasses the time log crud, so fill the weekly workload rollup from the loaded rows
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO technician_weekly_workload (technician_id, week_start, hours_logged, log_count) "
+            "SELECT technician_id, date_trunc('week', logged_at)::date, SUM(hours_spent), COUNT(*) "
+            "FROM time_logs GROUP BY 1, 2"
+        ))
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE"))
+
+    return out.counts
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load a synthetic GearGuard dataset with COPY")
+    parser.add_argument("--database-url", help="Postgres URL (defaults to DATABASE_URL / app settings)")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="Preset to start from")
+    for field in fields(DatasetScale):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", type=int, help=f"Override {field.name}")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    overrides = {
+        field.name: getattr(args, field.name)
+        for field in fields(DatasetScale)
+        if getattr(args, field.name) is not None
+    }
+    scale = replace(SCALES[args.scale], **overrides)
+
+    from app.database import engine
+
+    print(f"Generating dataset {scale} with seed {args.seed}...")
+    started = time.perf_counter()
+    counts = load_dataset(engine, scale, seed=args.seed)
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    for table, count in counts.items():
+        print(f"  {table:<22} {count:>12,}")
+    print(f"Loaded {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""
+End-to-end HTTP load benchmark for the GearGuard API.
+
+Boots app.main:app against a Postgres database (optionally loading a synthetic
+dataset first), drives a weighted mix of realistic user flows with concurrent
+clients, and writes throughput plus p50/p95/p99 latency per endpoint as JSON.
+A previous result file can be passed with --compare to flag regressions.
+
+Examples (from the server/ directory):
+    python -m benchmarks.http_load --load-dataset small --mix mixed --duration 30
+    python -m benchmarks.http_load --transport uvicorn --workers 4 --concurrency 64
+    python -m benchmarks.http_load --compare results/baseline.json --output results/current.json
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import httpx
+
+from benchmarks.dataset import BENCH_ADMIN_EMAIL, BENCH_PASSWORD, SCALES, load_dataset
+from benchmarks.stats import summarize, write_results, load_results, compare
+
+# Scenario name -> weighted list of flows
+MIXES = {
+    "dashboard": {"dashboard": 1},
+    "dashboard_summary": {"dashboard_summary": 1},
+    "kanban": {"kanban": 1},
+    "list_search": {"list_search": 1},
+    "login": {"login": 1},
+    "mixed": {"dashboard": 3, "kanban": 3, "list_search": 3, "login": 1},
+}
+SEARCH_TERMS = ["Server", "Network", "HVAC", "Laptop 1", "Building 7", "Fault", "SN-00000"]
+STAGES = ["new", "in_progress", "repaired"]
+
+
+class LoadClient:
+    """One simulated user issuing requests and recording latencies."""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: dict, token: str, rng: random.Random):
+        self.client = client
+        self.recorder = recorder
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.rng = rng
+
+    async def call(self, name: str, method: str, url: str, **kwargs) -> httpx.Response | None:
+        kwargs.setdefault("headers", self.headers)
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.recorder[name]["errors"] += 1
+            return None
+        self.recorder[name]["latencies"].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.recorder[name]["errors"] += 1
+        return response
+
+    async def dashboard(self) -> None:
+        """Headline numbers on the dashboard home page."""
+        await asyncio.gather(
+            self.call("GET /api/reports/requests-by-team", "GET", "/api/reports/requests-by-team"),
+            self.call("GET /api/reports/requests-by-category", "GET", "/api/reports/requests-by-category"),
+            self.call("GET /api/reports/requests-by-stage", "GET", "/api/reports/requests-by-stage"),
+            self.call("GET /api/maintenance-requests/overdue", "GET", "/api/maintenance-requests/overdue"),
+            self.call("GET /api/equipment", "GET", "/api/equipment/"),
+            self.call("GET /api/technicians", "GET", "/api/technicians/"),
+        )
+
+    async def dashboard_summary(self) -> None:
+        """Headline numbers from the single summary endpoint."""
+        await self.call("GET /api/dashboard/summary", "GET", "/api/dashboard/summary")
+
+    async def kanban(self) -> None:
+        """Load the board and drag one card to another column."""
+        response = await self.call(
+            "GET /api/maintenance-requests", "GET", "/api/maintenance-requests/", params={"limit": 100}
+        )
+        if response is None or response.status_code != 200 or not response.json():
+            return
+        card = self.rng.choice(response.json())
+        await self.call(
+            "PATCH /api/maintenance-requests/{request_id}", "PATCH",
+            f"/api/maintenance-requests/{card['id']}",
+            json={"stage": self.rng.choice(STAGES)}
+        )
+
+    async def list_search(self) -> None:
+        """Search equipment and requests, then open one result."""
+        term = self.rng.choice(SEARCH_TERMS)
+        response = await self.call("GET /api/equipment?search=", "GET", "/api/equipment/", params={"search": term})
+        await self.call(
+            "GET /api/maintenance-requests?search=", "GET", "/api/maintenance-requests/", params={"search": term}
+        )
+        if response is not None and response.status_code == 200 and response.json():
+            equipment = self.rng.choice(response.json())
+            await self.call("GET /api/equipment/{equipment_id}", "GET", f"/api/equipment/{equipment['id']}")
+
+    async def login(self, email: str, password: str) -> None:
+        await self.call(
+            "POST /api/auth/login", "POST", "/api/auth/login",
+            data={"username": email, "password": password}, headers={}
+        )
+
+
+def _build_client(args) -> tuple[httpx.AsyncClient, subprocess.Popen | None]:
+    if args.transport == "asgi":
+        from app.main import app
+        transport = httpx.ASGITransport(app=app)
+        return httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=args.timeout), None
+
+    base_url = args.base_url or f"http://127.0.0.1:{args.port}"
+    process = None
+    if not args.base_url:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+             "--port", str(args.port), "--workers", str(args.workers), "--log-level", "warning"],
+            env=os.environ.copy()
+        )
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            try:
+                if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        else:
+            process.terminate()
+            raise RuntimeError("uvicorn did not become healthy within 30 seconds")
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    return httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits), process
+
+
+async def _login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post("/api/auth/login", data={"username": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run(args) -> dict:
+    client, process = _build_client(args)
+    recorder: dict[str, dict] = defaultdict(lambda: {"latencies": [], "errors": 0})
+    mix = MIXES[args.mix]
+    flows, weights = zip(*mix.items())
+    email = args.email or BENCH_ADMIN_EMAIL
+    password = args.password or BENCH_PASSWORD
+
+    try:
+        token = await _login(client, email, password)
+
+        # Warm up connections, caches and the import of lazily loaded modules
+        warmup = LoadClient(client, defaultdict(lambda: {"latencies": [], "errors": 0}), token, random.Random(0))
+        for flow in flows:
+            await (warmup.login(email, password) if flow == "login" else getattr(warmup, flow)())
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        iterations = 0
+
+        async def worker(worker_id: int) -> None:
+            nonlocal iterations
+            user = LoadClient(client, recorder, token, random.Random(args.seed + worker_id))
+            while time.perf_counter() < deadline:
+                flow = user.rng.choices(flows, weights=weights)[0]
+                if flow == "login":
+                    await user.login(email, password)
+                else:
+                    await getattr(user, flow)()
+                iterations += 1
+
+        await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.aclose()
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    endpoints = {}
+    total_requests = 0
+    total_errors = 0
+    for name, data in sorted(recorder.items()):
+        summary = summarize(data["latencies"])
+        summary["errors"] = data["errors"]
+        summary["throughput_rps"] = round(len(data["latencies"]) / elapsed, 2)
+        endpoints[name] = summary
+        total_requests += len(data["latencies"])
+        total_errors += data["errors"]
+
+    return {
+        "benchmark": "http_load",
+        "timestamp": datetime.utcnow().isoformat(),
+        "config": {
+            "transport": args.transport,
+            "mix": args.mix,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "workers": args.workers if args.transport == "uvicorn" else 1,
+            "dataset": args.load_dataset,
+            "seed": args.seed,
+        },
+        "totals": {
+            "requests": total_requests,
+            "errors": total_errors,
+            "flows": iterations,
+            "elapsed_s": round(elapsed, 3),
+            "throughput_rps": round(total_requests / elapsed, 2),
+        },
+        "endpoints": endpoints,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="GearGuard end-to-end HTTP load benchmark")
+    parser.add_argument("--database-url", help="Postgres URL (defaults to DATABASE_URL / app settings)")
+    parser.add_argument("--load-dataset", choices=sorted(SCALES),
+                        help="Replace the database contents with a synthetic dataset before running")
+    parser.add_argument("--transport", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--base-url", help="Benchmark an already running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers (uvicorn transport only)")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="mixed")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run after warmup")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--email", help="Login email (defaults to the synthetic admin)")
+    parser.add_argument("--password", help="Login password")
+    parser.add_argument("--output", default="benchmarks/results/http_load.json")
+    parser.add_argument("--compare", help="Previous result file to compare against")
+    parser.add_argument("--regression-threshold", type=float, default=0.10,
+                        help="Flag endpoints whose p95 grew by more than this fraction")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.database_url:
+        # Settings are read at import time, so this must happen before importing app
+        os.environ["DATABASE_URL"] = args.database_url
+
+    if args.load_dataset:
+        from app.database import engine
+        print(f"Loading {args.load_dataset} dataset...")
+        counts = load_dataset(engine, SCALES[args.load_dataset], seed=args.seed)
+        print("Loaded " + ", ".join(f"{count} {name}" for name, count in counts.items()))
+
+    results = asyncio.run(run(args))
+    write_results(args.output, results)
+
+    print(f"\n{'endpoint':<50} {'count':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, stats in results["endpoints"].items():
+        print(
+            f"{name:<50} {stats['count']:>7} {stats['errors']:>5} {stats['throughput_rps']:>8} "
+            f"{stats.get('p50_ms', 0):>8} {stats.get('p95_ms', 0):>8} {stats.get('p99_ms', 0):>8}"
+        )
+    totals = results["totals"]
+    print(f"\nTotal: {totals['requests']} requests, {totals['errors']} errors, {totals['throughput_rps']} req/s")
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        regressions = compare(load_results(args.compare)["endpoints"], results["endpoints"],
+                              threshold=args.regression_threshold)
+        if regressions:
+            print("\nRegressions (p95):")
+            for reg in regressions:
+                print(f"  {reg['name']}: {reg['baseline']} ms -> {reg['current']} ms (+{reg['change_pct']}%)")
+            return 1
+        print("\nNo p95 regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""
+Microbenchmarks for hot inner pieces of the API, measured without HTTP.
+
+Groups:
+    crud           every app.crud query function against the synthetic dataset (needs Postgres)
+    serialization  MaintenanceRequestDetailResponse construction for a page of requests
+    security       create_access_token / decode_token
+    validation     pydantic validation of EquipmentCreate
+
+Each benchmark is calibrated to run for --min-time seconds per repeat and
+repeated --repeat times. Results (per-op min/median/mean/stdev/p95 across
+repeats) are written as JSON; --compare flags benchmarks whose median got
+slower than --threshold against a previous run.
+
+Examples (from the server/ directory):
+    python -m benchmarks.micro --skip-db
+    python -m benchmarks.micro --load-dataset small --output benchmarks/results/micro-baseline.json
+    python -m benchmarks.micro --filter crud. --compare benchmarks/results/micro-baseline.json
+"""
+import argparse
+import os
+import platform
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from benchmarks.dataset import SCALES, load_dataset
+from benchmarks.stats import percentile, write_results, load_results, compare
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[[], object]
+    # Number of logical items processed per call (e.g. rows serialized)
+    items: int = 1
+
+
+def measure(bench: Benchmark, repeat: int, min_time: float) -> dict:
+    """Calibrate the loop count, then time `repeat` runs and summarize per-op seconds."""
+    bench.func()  # warmup
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            bench.func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 4 or loops >= 1_000_000:
+            break
+        loops *= 2
+    loops = max(1, int(loops * (min_time / max(elapsed, 1e-9))))
+
+    per_op = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            bench.func()
+        per_op.append((time.perf_counter() - start) / loops)
+
+    values = sorted(per_op)
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "items_per_op": bench.items,
+        "min_us": round(values[0] * 1e6, 3),
+        "median_us": round(statistics.median(values) * 1e6, 3),
+        "mean_us": round(statistics.fmean(values) * 1e6, 3),
+        "stdev_us": round(statistics.stdev(values) * 1e6, 3) if len(values) > 1 else 0.0,
+        "p95_us": round(percentile(values, 95) * 1e6, 3),
+        "ops_per_s": round(1 / statistics.median(values), 1),
+    }
+
+
+def security_benchmarks() -> list[Benchmark]:
+    from app.core.security import create_access_token, decode_token
+
+    token = create_access_token({"sub": str(uuid.uuid4())}, timedelta(minutes=30))
+    return [
+        Benchmark("security.create_access_token",
+                  lambda: create_access_token({"sub": "00000000-0000-0000-0000-000000000001"},
+                                              timedelta(minutes=30))),
+        Benchmark("security.decode_token", lambda: decode_token(token)),
+    ]
+
+
+def validation_benchmarks() -> list[Benchmark]:
+    from app.schemas.equipment import EquipmentCreate
+
+    payload = {
+        "name": "CNC Machine Model X500",
+        "serial_number": "CNC-2020-088",
+        "category": "Machinery",
+        "department_id": str(uuid.uuid4()),
+        "assigned_employee": "Manufacturing",
+        "location": "Manufacturing Floor 1",
+        "purchase_date": "2020-08-15",
+        "warranty_expiry": "2025-08-15",
+        "maintenance_team_id": str(uuid.uuid4()),
+        "status": "active",
+    }
+    payload_json = EquipmentCreate(**payload).model_dump_json()
+    return [
+        Benchmark("validation.EquipmentCreate.python", lambda: EquipmentCreate.model_validate(payload)),
+        Benchmark("validation.EquipmentCreate.json", lambda: EquipmentCreate.model_validate_json(payload_json)),
+    ]
+
+
+def serialization_benchmarks(page_size: int = 100) -> list[Benchmark]:
+    """Build a page of transient ORM objects shaped like list_requests results."""
+    from app.models import User, MaintenanceTeam, Technician, Equipment, MaintenanceRequest
+    from app.models.maintenance_request import RequestStage, RequestType
+    from app.routers.maintenance_requests import build_detail_response, request_is_overdue
+
+    team = MaintenanceTeam(id=uuid.uuid4(), name="Mechanical Team")
+    reporter = User(id=uuid.uuid4(), name="Henry User")
+    technician = Technician(id=uuid.uuid4(), user=User(id=uuid.uuid4(), name="Dave Technician"))
+    stages = list(RequestStage)
+    requests = []
+    for i in range(page_size):
+        equipment = Equipment(
+            id=uuid.uuid4(), name=f"Asset {i}", category="Machinery", location="Floor 1",
+            maintenance_team_id=team.id, maintenance_team=team
+        )
+        assigned = technician if i % 3 else None
+        requests.append(MaintenanceRequest(
+            id=uuid.uuid4(), subject=f"Request {i}", description="x" * 200,
+            request_type=RequestType.corrective, equipment_id=equipment.id, equipment=equipment,
+            detected_by=reporter.id, detected_by_user=reporter,
+            assigned_to=assigned.id if assigned else None, assigned_technician=assigned,
+            scheduled_date=(datetime.utcnow() - timedelta(days=i % 20 - 10)).date(),
+            stage=stages[i % len(stages)], overdue=False, created_at=datetime.utcnow(),
+        ))
+
+    def build_page():
+        today = datetime.utcnow().date()
+        return [build_detail_response(req, request_is_overdue(req, today)) for req in requests]
+
+    def dump_page():
+        return [response.model_dump(mode="json") for response in build_page()]
+
+    return [
+        Benchmark(f"serialization.build_detail_response[{page_size}]", build_page, items=page_size),
+        Benchmark(f"serialization.build_and_dump[{page_size}]", dump_page, items=page_size),
+    ]
+
+
+def crud_benchmarks(session) -> list[Benchmark]:
+    """One benchmark per app.crud query function, with ids sampled from the dataset."""
+    from app.crud import (
+        department, maintenance_team, technician, equipment, maintenance_request,
+        time_log, request_audit_log, user, report, dashboard,
+    )
+    from app.models import (
+        Department, MaintenanceTeam, Technician, Equipment, MaintenanceRequest, TimeLog, RequestAuditLog, User,
+    )
+    from app.models.maintenance_request import RequestStage
+
+    def first_id(model):
+        return session.query(model.id).order_by(model.id).limit(1).scalar()
+
+    ids = {model.__name__: first_id(model) for model in (
+        Department, MaintenanceTeam, Technician, Equipment, MaintenanceRequest, TimeLog, RequestAuditLog, User,
+    )}
+    if not all(ids.values()):
+        raise RuntimeError("The database is empty; run with --load-dataset first")
+    tech_user_id = session.query(Technician.user_id).filter(Technician.id == ids["Technician"]).scalar()
+    email = session.query(User.email).filter(User.id == ids["User"]).scalar()
+    today = datetime.utcnow()
+
+    def run(func, *args, **kwargs):
+        def call():
+            result = func(session, *args, **kwargs)
+            # Keep the identity map from growing across loops
+            session.expunge_all()
+            return result
+        return call
+
+    def uncached_calendar_counts(db, start_date, end_date):
+        maintenance_request.calendar_month_cache.clear()
+        return maintenance_request.get_calendar_day_counts(db, start_date, end_date)
+
+    return [
+        Benchmark("crud.department.get_department", run(department.get_department, ids["Department"])),
+        Benchmark("crud.department.get_departments", run(department.get_departments)),
+        Benchmark("crud.maintenance_team.get_team", run(maintenance_team.get_team, ids["MaintenanceTeam"])),
+        Benchmark("crud.maintenance_team.get_teams", run(maintenance_team.get_teams)),
+        Benchmark("crud.technician.get_technician", run(technician.get_technician, ids["Technician"])),
+        Benchmark("crud.technician.get_technician_by_user_id",
+                  run(technician.get_technician_by_user_id, tech_user_id)),
+        Benchmark("crud.technician.get_technicians", run(technician.get_technicians)),
+        Benchmark("crud.equipment.get_equipment", run(equipment.get_equipment, ids["Equipment"])),
+        Benchmark("crud.equipment.get_equipment_with_details",
+                  run(equipment.get_equipment_with_details, ids["Equipment"])),
+        Benchmark("crud.equipment.get_equipment_list", run(equipment.get_equipment_list)),
+        Benchmark("crud.equipment.get_equipment_list[search]", run(equipment.get_equipment_list, search="Server")),
+        Benchmark("crud.equipment.get_equipment_categories", run(equipment.get_equipment_categories)),
+        Benchmark("crud.maintenance_request.get_request",
+                  run(maintenance_request.get_request, ids["MaintenanceRequest"])),
+        Benchmark("crud.maintenance_request.get_request_with_details",
+                  run(maintenance_request.get_request_with_details, ids["MaintenanceRequest"])),
+        Benchmark("crud.maintenance_request.get_request_with_includes",
+                  run(maintenance_request.get_request_with_includes, ids["MaintenanceRequest"],
+                      set(maintenance_request.REQUEST_INCLUDES))),
+        Benchmark("crud.maintenance_request.get_requests", run(maintenance_request.get_requests)),
+        Benchmark("crud.maintenance_request.get_requests[fields]",
+                  run(maintenance_request.get_requests, fields=["id", "subject", "stage"])),
+        Benchmark("crud.maintenance_request.get_requests[search]",
+                  run(maintenance_request.get_requests, search="Fault")),
+        Benchmark("crud.maintenance_request.get_board", run(maintenance_request.get_board)),
+        Benchmark("crud.maintenance_request.get_board_column",
+                  run(maintenance_request.get_board_column, RequestStage.new)),
+        Benchmark("crud.maintenance_request.get_equipment_auto_fill_data",
+                  run(maintenance_request.get_equipment_auto_fill_data, ids["Equipment"])),
+        Benchmark("crud.maintenance_request.get_calendar_requests[month]",
+                  run(maintenance_request.get_calendar_requests, today - timedelta(days=30), today)),
+        Benchmark("crud.maintenance_request.get_calendar_day_counts[year, uncached]",
+                  run(uncached_calendar_counts, today.date() - timedelta(days=365), today.date())),
+        Benchmark("crud.maintenance_request.get_calendar_day_requests",
+                  run(maintenance_request.get_calendar_day_requests, today.date() - timedelta(days=1), 200)),
+        Benchmark("crud.maintenance_request.get_overdue_requests", run(maintenance_request.get_overdue_requests)),
+        Benchmark("crud.time_log.get_time_log", run(time_log.get_time_log, ids["TimeLog"])),
+        Benchmark("crud.time_log.get_time_logs", run(time_log.get_time_logs)),
+        Benchmark("crud.request_audit_log.get_audit_log",
+                  run(request_audit_log.get_audit_log, ids["RequestAuditLog"])),
+        Benchmark("crud.request_audit_log.get_audit_logs", run(request_audit_log.get_audit_logs)),
+        Benchmark("crud.user.get_user", run(user.get_user, ids["User"])),
+        Benchmark("crud.user.get_user_by_email", run(user.get_user_by_email, email)),
+        Benchmark("crud.user.get_users", run(user.get_users)),
+        Benchmark("crud.user.get_users[search]", run(user.get_users, search="Technician")),
+        Benchmark("crud.report.get_requests_by_team", run(report.get_requests_by_team)),
+        Benchmark("crud.report.get_requests_by_category", run(report.get_requests_by_category)),
+        Benchmark("crud.report.get_requests_by_stage", run(report.get_requests_by_stage)),
+        Benchmark("crud.dashboard.get_summary_rows",
+                  run(dashboard.get_summary_rows, today.date(), today.date() + timedelta(days=30))),
+    ]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="GearGuard microbenchmarks")
+    parser.add_argument("--database-url", help="Postgres URL (defaults to DATABASE_URL / app settings)")
+    parser.add_argument("--load-dataset", choices=sorted(SCALES),
+                        help="Replace the database contents with a synthetic dataset first")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-db", action="store_true", help="Skip the crud group")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2, help="Target seconds per repeat")
+    parser.add_argument("--output", default="benchmarks/results/micro.json")
+    parser.add_argument("--compare", help="Previous result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Flag benchmarks whose median grew by more than this fraction")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    benchmarks = security_benchmarks() + validation_benchmarks() + serialization_benchmarks()
+
+    session = None
+    if not args.skip_db:
+        from app.database import engine, SessionLocal
+        if args.load_dataset:
+            print(f"Loading {args.load_dataset} dataset...")
+            load_dataset(engine, SCALES[args.load_dataset], seed=args.seed)
+        session = SessionLocal()
+        benchmarks += crud_benchmarks(session)
+
+    results = {}
+    try:
+        for bench in benchmarks:
+            if args.filter not in bench.name:
+                continue
+            results[bench.name] = measure(bench, args.repeat, args.min_time)
+            stats = results[bench.name]
+            print(f"{bench.name:<60} median {stats['median_us']:>12.1f} us  "
+                  f"stdev {stats['stdev_us']:>10.1f} us  ({stats['loops']} loops x {stats['repeat']})")
+    finally:
+        if session is not None:
+            session.close()
+
+    write_results(args.output, {
+        "benchmark": "micro",
+        "timestamp": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"repeat": args.repeat, "min_time": args.min_time, "dataset": args.load_dataset},
+        "benchmarks": results,
+    })
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressions = compare(load_results(args.compare)["benchmarks"], results,
+                              metric="median_us", threshold=args.threshold)
+        if regressions:
+            print("\nRegressions (median):")
+            for reg in regressions:
+                print(f"  {reg['name']}: {reg['baseline']} us -> {reg['current']} us (+{reg['change_pct']}%)")
+            return 1
+        print("\nNo median regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,455 @@
+"""
+SQL query-count budget check for every API route.
+
+Calls each route once through the ASGI app, reads the statement count from the
+Server-Timing header emitted by QueryStatsMiddleware, and compares it with the
+budget declared in BUDGETS. The app runs with SQL_STRICT_LOADING enabled, so
+any lazy relationship load that is not covered by an eager load option fails
+the route instead of silently adding queries. Routes registered on the app
+without a declared budget fail the check too.
+
+Fixture rows are created with unique names and removed afterwards, so the
+check can run against any development database (from the server/ directory):
+    python -m benchmarks.query_budget
+    python -m benchmarks.query_budget --database-url postgresql://.../gearguard_test -v
+"""
+import argparse
+import asyncio
+import os
+import re
+import sys
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+# Strict loading is configured at import time, before the app is imported
+os.environ.setdefault("SQL_STRICT_LOADING", "true")
+os.environ.setdefault("SQL_STATS_ENABLED", "true")
+
+import httpx
+
+_QUERY_COUNT = re.compile(r'desc="(\d+) queries"')
+
+
+@dataclass
+class RouteBudget:
+    method: str
+    path: str
+    max_queries: int
+    # Builds the request kwargs (url, json, data, ...) from the fixture context
+    request: Callable[[dict], dict]
+    # Routes that lazy-load children on purpose can opt out of strict loading
+    strict: bool = True
+    expected_status: int | None = None
+
+
+def _get(url: str) -> Callable[[dict], dict]:
+    return lambda ctx: {"url": url.format(**ctx)}
+
+
+def _batch(url: str, *id_keys: str) -> Callable[[dict], dict]:
+    """Batch fetch of fixture ids plus one unknown id (a 404 marker)."""
+    return lambda ctx: {
+        "url": url, "params": {"ids": ",".join([*(str(ctx[key]) for key in id_keys), str(uuid.uuid4())])}
+    }
+
+
+# Routes that cannot be called once and measured, with the reason
+UNBUDGETED = {
+    ("GET", "/api/events/stream"): "long-lived Server-Sent Events stream (one auth query, then no SQL)",
+}
+
+# Budgets include the user lookup done by get_current_user on authenticated routes.
+# Request mutations also count the pg_notify of their realtime event (Postgres only).
+# Order matters: POST routes store the created ids that later PATCH/DELETE routes use.
+BUDGETS = [
+    RouteBudget("GET", "/", 0, _get("/")),
+    RouteBudget("GET", "/health", 0, _get("/health")),
+    RouteBudget("GET", "/metrics", 0, _get("/metrics")),
+
+    RouteBudget("POST", "/api/auth/login", 1, lambda ctx: {
+        "url": "/api/auth/login", "data": {"username": ctx["admin_email"], "password": ctx["password"]}
+    }),
+    RouteBudget("POST", "/api/auth/register", 3, lambda ctx: {
+        "url": "/api/auth/register", "auth": False,
+        "json": {"email": f"register-{ctx['suffix']}@budget.gearguard.com", "name": "Budget Register",
+                 "password": ctx["password"]},
+    }, expected_status=201),
+
+    RouteBudget("GET", "/api/users/me", 1, _get("/api/users/me")),
+    RouteBudget("GET", "/api/users/", 2, _get("/api/users/")),
+    RouteBudget("GET", "/api/users/batch", 2, _batch("/api/users/batch", "admin_id", "tech_user_id")),
+    RouteBudget("GET", "/api/users/{user_id}", 2, _get("/api/users/{tech_user_id}")),
+    RouteBudget("POST", "/api/users/", 4, lambda ctx: {
+        "url": "/api/users/", "store": "new_user_id",
+        "json": {"email": f"new-{ctx['suffix']}@budget.gearguard.com", "name": "Budget New",
+                 "password": ctx["password"]},
+    }, expected_status=201),
+    RouteBudget("PATCH", "/api/users/{user_id}", 2, lambda ctx: {
+        "url": f"/api/users/{ctx['new_user_id']}", "json": {"name": "Budget Renamed"}
+    }),
+    RouteBudget("DELETE", "/api/users/{user_id}", 2, lambda ctx: {
+        "url": f"/api/users/{ctx['new_user_id']}"
+    }, expected_status=204),
+
+    RouteBudget("GET", "/api/departments/", 2, _get("/api/departments/")),
+    RouteBudget("GET", "/api/departments/{department_id}", 2, _get("/api/departments/{department_id}")),
+    RouteBudget("POST", "/api/departments/", 3, lambda ctx: {
+        "url": "/api/departments/", "store": "new_department_id",
+        "json": {"name": f"Budget Department New {ctx['suffix']}"},
+    }, expected_status=201),
+    RouteBudget("PATCH", "/api/departments/{department_id}", 2, lambda ctx: {
+        "url": f"/api/departments/{ctx['new_department_id']}", "json": {"description": "Updated"}
+    }),
+    RouteBudget("DELETE", "/api/departments/{department_id}", 2, lambda ctx: {
+        "url": f"/api/departments/{ctx['new_department_id']}"
+    }, expected_status=204),
+
+    RouteBudget("GET", "/api/maintenance-teams/", 2, _get("/api/maintenance-teams/")),
+    RouteBudget("GET", "/api/maintenance-teams/batch", 2, _batch("/api/maintenance-teams/batch", "team_id")),
+    RouteBudget("GET", "/api/maintenance-teams/{team_id}", 2, _get("/api/maintenance-teams/{team_id}")),
+    RouteBudget("POST", "/api/maintenance-teams/", 3, lambda ctx: {
+        "url": "/api/maintenance-teams/", "store": "new_team_id",
+        "json": {"name": f"Budget Team New {ctx['suffix']}", "specialization": "Budget"},
+    }, expected_status=201),
+    RouteBudget("PATCH", "/api/maintenance-teams/{team_id}", 2, lambda ctx: {
+        "url": f"/api/maintenance-teams/{ctx['new_team_id']}", "json": {"specialization": "Updated"}
+    }),
+    RouteBudget("DELETE", "/api/maintenance-teams/{team_id}", 2, lambda ctx: {
+        "url": f"/api/maintenance-teams/{ctx['new_team_id']}"
+    }, expected_status=204),
+
+    RouteBudget("GET", "/api/technicians/", 2, _get("/api/technicians/")),
+    RouteBudget("GET", "/api/technicians/batch", 2, _batch("/api/technicians/batch", "technician_id")),
+    RouteBudget("GET", "/api/technicians/{technician_id}", 2, _get("/api/technicians/{technician_id}")),
+    RouteBudget("POST", "/api/technicians/", 4, lambda ctx: {
+        "url": "/api/technicians/", "store": "new_technician_id",
+        "json": {"user_id": ctx["spare_user_id"], "team_id": ctx["team_id"]},
+    }, expected_status=201),
+    RouteBudget("PATCH", "/api/technicians/{technician_id}", 2, lambda ctx: {
+        "url": f"/api/technicians/{ctx['new_technician_id']}", "json": {"is_active": False}
+    }),
+    RouteBudget("DELETE", "/api/technicians/{technician_id}", 2, lambda ctx: {
+        "url": f"/api/technicians/{ctx['new_technician_id']}"
+    }, expected_status=204),
+
+    RouteBudget("GET", "/api/equipment/", 3, _get("/api/equipment/")),
+    RouteBudget("GET", "/api/equipment/categories", 2, _get("/api/equipment/categories")),
+    RouteBudget("GET", "/api/equipment/batch", 3, _batch("/api/equipment/batch", "equipment_id")),
+    RouteBudget("GET", "/api/equipment/{equipment_id}", 4, _get("/api/equipment/{equipment_id}")),
+    RouteBudget("GET", "/api/equipment/{equipment_id}/maintenance-count", 4,
+                _get("/api/equipment/{equipment_id}/maintenance-count")),
+    RouteBudget("POST", "/api/equipment/", 4, lambda ctx: {
+        "url": "/api/equipment/", "store": "new_equipment_id",
+        "json": {"name": "Budget Asset New", "serial_number": f"BUDGET-NEW-{ctx['suffix']}",
+                 "category": "Budget", "department_id": ctx["department_id"], "location": "Lab",
+                 "maintenance_team_id": ctx["team_id"]},
+    }, expected_status=201),
+    RouteBudget("PATCH", "/api/equipment/{equipment_id}", 3, lambda ctx: {
+        "url": f"/api/equipment/{ctx['new_equipment_id']}", "json": {"location": "Lab 2"}
+    }),
+    RouteBudget("DELETE", "/api/equipment/{equipment_id}", 7, lambda ctx: {
+        "url": f"/api/equipment/{ctx['new_equipment_id']}"
+    }, expected_status=204),
+
+    RouteBudget("GET", "/api/maintenance-requests/", 2, _get("/api/maintenance-requests/")),
+    RouteBudget("GET", "/api/maintenance-requests/calendar", 2, lambda ctx: {
+        "url": "/api/maintenance-requests/calendar",
+        "params": {"start_date": ctx["month_start"], "end_date": ctx["month_end"]},
+    }),
+    RouteBudget("GET", "/api/maintenance-requests/calendar/day/{day}", 2,
+                _get("/api/maintenance-requests/calendar/day/{yesterday}")),
+    RouteBudget("GET", "/api/maintenance-requests/board", 2, _get("/api/maintenance-requests/board")),
+    RouteBudget("GET", "/api/maintenance-requests/board/{stage}", 2,
+                _get("/api/maintenance-requests/board/in_progress")),
+    RouteBudget("GET", "/api/maintenance-requests/overdue", 2, _get("/api/maintenance-requests/overdue")),
+    RouteBudget("GET", "/api/maintenance-requests/equipment/{equipment_id}/auto-fill", 2,
+                _get("/api/maintenance-requests/equipment/{equipment_id}/auto-fill")),
+    RouteBudget("GET", "/api/maintenance-requests/batch", 2,
+                _batch("/api/maintenance-requests/batch", "request_id")),
+    RouteBudget("GET", "/api/maintenance-requests/{request_id}", 4, lambda ctx: {
+        "url": f"/api/maintenance-requests/{ctx['request_id']}",
+        "params": {"include": "time_logs,audit_logs,hours_total"},
+    }),
+    RouteBudget("POST", "/api/maintenance-requests/", 7, lambda ctx: {
+        "url": "/api/maintenance-requests/", "store": "new_request_id",
+        "json": {"subject": "Budget request", "equipment_id": ctx["equipment_id"]},
+    }, expected_status=201),
+    RouteBudget("PATCH", "/api/maintenance-requests/{request_id}", 6, lambda ctx: {
+        "url": f"/api/maintenance-requests/{ctx['new_request_id']}", "json": {"stage": "in_progress"}
+    }),
+    RouteBudget("DELETE", "/api/maintenance-requests/{request_id}", 6, lambda ctx: {
+        "url": f"/api/maintenance-requests/{ctx['new_request_id']}"
+    }, expected_status=204),
+
+    RouteBudget("GET", "/api/time-logs/", 2, _get("/api/time-logs/")),
+    RouteBudget("GET", "/api/time-logs/{time_log_id}", 2, _get("/api/time-logs/{time_log_id}")),
+    RouteBudget("POST", "/api/time-logs/", 5, lambda ctx: {
+        "url": "/api/time-logs/", "store": "new_time_log_id",
+        "json": {"request_id": ctx["request_id"], "technician_id": ctx["technician_id"],
+                 "hours_spent": 1.5, "logged_at": datetime.utcnow().isoformat()},
+    }, expected_status=201),
+    RouteBudget("PATCH", "/api/time-logs/{time_log_id}", 5, lambda ctx: {
+        "url": f"/api/time-logs/{ctx['new_time_log_id']}", "json": {"hours_spent": 2}
+    }),
+    RouteBudget("DELETE", "/api/time-logs/{time_log_id}", 4, lambda ctx: {
+        "url": f"/api/time-logs/{ctx['new_time_log_id']}"
+    }, expected_status=204),
+
+    RouteBudget("GET", "/api/preventive-schedules/", 2, _get("/api/preventive-schedules/")),
+    RouteBudget("POST", "/api/preventive-schedules/", 4, lambda ctx: {
+        "url": "/api/preventive-schedules/", "store": "new_schedule_id",
+        "json": {"name": "Budget PM", "subject": "Budget inspection", "equipment_id": ctx["equipment_id"],
+                 "interval_unit": "week", "start_date": date.today().isoformat()},
+    }, expected_status=201),
+    RouteBudget("GET", "/api/preventive-schedules/{schedule_id}", 2, lambda ctx: {
+        "url": f"/api/preventive-schedules/{ctx['new_schedule_id']}"
+    }),
+    RouteBudget("PATCH", "/api/preventive-schedules/{schedule_id}", 3, lambda ctx: {
+        "url": f"/api/preventive-schedules/{ctx['new_schedule_id']}", "json": {"interval_count": 2}
+    }),
+    RouteBudget("POST", "/api/preventive-schedules/generate", 3, lambda ctx: {
+        "url": "/api/preventive-schedules/generate", "params": {"horizon_days": 28}
+    }, expected_status=202),
+    RouteBudget("DELETE", "/api/preventive-schedules/{schedule_id}", 2, lambda ctx: {
+        "url": f"/api/preventive-schedules/{ctx['new_schedule_id']}"
+    }, expected_status=204),
+
+    RouteBudget("GET", "/api/reports/requests-by-team", 2, _get("/api/reports/requests-by-team")),
+    RouteBudget("GET", "/api/reports/requests-by-category", 2, _get("/api/reports/requests-by-category")),
+    RouteBudget("GET", "/api/reports/requests-by-stage", 2, _get("/api/reports/requests-by-stage")),
+    RouteBudget("GET", "/api/reports/technician-workload", 3, _get("/api/reports/technician-workload")),
+    RouteBudget("POST", "/api/reports/reliability/refresh", 3, lambda ctx: {
+        "url": "/api/reports/reliability/refresh"
+    }, expected_status=202),
+    RouteBudget("GET", "/api/reports/reliability/equipment", 2, _get("/api/reports/reliability/equipment")),
+    RouteBudget("GET", "/api/reports/reliability/categories", 2, _get("/api/reports/reliability/categories")),
+    RouteBudget("POST", "/api/reports/trends/refresh", 3, lambda ctx: {
+        "url": "/api/reports/trends/refresh"
+    }, expected_status=202),
+    RouteBudget("GET", "/api/reports/trends", 2, lambda ctx: {
+        "url": "/api/reports/trends", "params": {"bucket": "week", "dimension": "team"}
+    }),
+
+    RouteBudget("GET", "/api/dashboard/summary", 2, _get("/api/dashboard/summary")),
+    RouteBudget("GET", "/api/sync/changes", 5, _get("/api/sync/changes")),
+
+    RouteBudget("POST", "/api/jobs/", 3, lambda ctx: {
+        "url": "/api/jobs/", "store": "new_job_id", "json": {"kind": "trends_refresh"}
+    }, expected_status=202),
+    RouteBudget("GET", "/api/jobs/", 2, _get("/api/jobs/")),
+    RouteBudget("GET", "/api/jobs/kinds", 1, _get("/api/jobs/kinds")),
+    RouteBudget("GET", "/api/jobs/{job_id}", 2, lambda ctx: {"url": f"/api/jobs/{ctx['new_job_id']}"}),
+
+    RouteBudget("GET", "/api/admin/slow-queries", 1, _get("/api/admin/slow-queries")),
+    RouteBudget("DELETE", "/api/admin/slow-queries", 1, _get("/api/admin/slow-queries"), expected_status=204),
+    RouteBudget("GET", "/api/admin/periodic-tasks", 2, _get("/api/admin/periodic-tasks")),
+    RouteBudget("GET", "/api/admin/profiles", 1, _get("/api/admin/profiles")),
+    RouteBudget("GET", "/api/admin/profiles/{profile_id}", 1, _get("/api/admin/profiles/missing"),
+                expected_status=404),
+    RouteBudget("GET", "/api/admin/profiles/{profile_id}/folded", 1, _get("/api/admin/profiles/missing/folded"),
+                expected_status=404),
+    RouteBudget("DELETE", "/api/admin/profiles/{profile_id}", 1, _get("/api/admin/profiles/missing"),
+                expected_status=404),
+]
+
+
+def create_fixtures(password: str) -> dict:
+    """Insert one row of each kind for the read routes to find."""
+    from app.core.security import get_password_hash
+    from app.database import SessionLocal
+    from app.models import (
+        User, Department, MaintenanceTeam, Technician, Equipment, MaintenanceRequest, TimeLog, RequestAuditLog,
+    )
+    from app.models.user import UserRole
+    from app.models.maintenance_request import RequestStage, RequestType
+
+    suffix = uuid.uuid4().hex[:8]
+    password_hash = get_password_hash(password)
+    today = date.today()
+
+    admin = User(id=uuid.uuid4(), email=f"admin-{suffix}@budget.gearguard.com", password_hash=password_hash,
+                 name="Budget Admin", role=UserRole.admin)
+    tech_user = User(id=uuid.uuid4(), email=f"tech-{suffix}@budget.gearguard.com", password_hash=password_hash,
+                     name="Budget Technician", role=UserRole.technician)
+    spare_user = User(id=uuid.uuid4(), email=f"spare-{suffix}@budget.gearguard.com", password_hash=password_hash,
+                      name="Budget Spare", role=UserRole.technician)
+    department = Department(id=uuid.uuid4(), name=f"Budget Department {suffix}")
+    team = MaintenanceTeam(id=uuid.uuid4(), name=f"Budget Team {suffix}", specialization="Budget")
+    technician = Technician(id=uuid.uuid4(), user_id=tech_user.id, team_id=team.id)
+    equipment = Equipment(id=uuid.uuid4(), name="Budget Asset", serial_number=f"BUDGET-{suffix}",
+                          category="Budget", location="Lab", department_id=department.id,
+                          maintenance_team_id=team.id, purchase_date=today - timedelta(days=400),
+                          warranty_expiry=today + timedelta(days=400))
+    request = MaintenanceRequest(id=uuid.uuid4(), subject="Budget fixture", request_type=RequestType.preventive,
+                                 equipment_id=equipment.id, detected_by=admin.id, assigned_to=technician.id,
+                                 scheduled_date=today - timedelta(days=1), stage=RequestStage.in_progress)
+    audit_log = RequestAuditLog(id=uuid.uuid4(), request_id=request.id, old_stage=None,
+                                new_stage=RequestStage.new, changed_by=admin.id)
+    time_log = TimeLog(id=uuid.uuid4(), request_id=request.id, technician_id=technician.id,
+                       hours_spent=1, logged_at=datetime.utcnow())
+
+    ctx = {
+        "suffix": suffix,
+        "password": password,
+        "admin_email": admin.email,
+        "admin_id": str(admin.id),
+        "tech_user_id": str(tech_user.id),
+        "spare_user_id": str(spare_user.id),
+        "department_id": str(department.id),
+        "team_id": str(team.id),
+        "technician_id": str(technician.id),
+        "equipment_id": str(equipment.id),
+        "request_id": str(request.id),
+        "time_log_id": str(time_log.id),
+        "yesterday": (today - timedelta(days=1)).isoformat(),
+        "month_start": (today.replace(day=1)).isoformat(),
+        "month_end": (today.replace(day=1) + timedelta(days=31)).isoformat(),
+    }
+
+    db = SessionLocal()
+    try:
+        for group in ((admin, tech_user, spare_user, department, team), (technician, equipment),
+                      (request,), (audit_log, time_log)):
+            db.add_all(group)
+            db.flush()
+        db.commit()
+    finally:
+        db.close()
+
+    return ctx
+
+
+def remove_fixtures(ctx: dict) -> None:
+    """Delete everything the check created, children first."""
+    from sqlalchemy import text
+    from app.database import engine
+
+    suffix = ctx["suffix"]
+    fixture_requests = ("SELECT id FROM maintenance_requests WHERE equipment_id IN "
+                        "(SELECT id FROM equipment WHERE serial_number LIKE :pattern)")
+    with engine.begin() as conn:
+        for table in ("time_logs", "request_audit_logs"):
+            conn.execute(text(f"DELETE FROM {table} WHERE request_id IN ({fixture_requests})"),
+                         {"pattern": f"BUDGET-%{suffix}"})
+        conn.execute(text(f"DELETE FROM maintenance_requests WHERE id IN ({fixture_requests})"),
+                     {"pattern": f"BUDGET-%{suffix}"})
+        conn.execute(text("DELETE FROM equipment_reliability_stats WHERE equipment_id IN "
+                          "(SELECT id FROM equipment WHERE serial_number LIKE :pattern)"),
+                     {"pattern": f"BUDGET-%{suffix}"})
+        conn.execute(text("DELETE FROM preventive_schedules WHERE equipment_id IN "
+                          "(SELECT id FROM equipment WHERE serial_number LIKE :pattern)"),
+                     {"pattern": f"BUDGET-%{suffix}"})
+        conn.execute(text("DELETE FROM equipment WHERE serial_number LIKE :pattern"),
+                     {"pattern": f"BUDGET-%{suffix}"})
+        conn.execute(text("DELETE FROM request_daily_trends WHERE team_id IN "
+                          "(SELECT id FROM maintenance_teams WHERE name LIKE :pattern)"),
+                     {"pattern": f"Budget Team%{suffix}"})
+        conn.execute(text("DELETE FROM technician_weekly_workload WHERE technician_id IN "
+                          "(SELECT id FROM technicians WHERE team_id IN "
+                          "(SELECT id FROM maintenance_teams WHERE name LIKE :pattern))"),
+                     {"pattern": f"Budget Team%{suffix}"})
+        conn.execute(text("DELETE FROM technicians WHERE team_id IN "
+                          "(SELECT id FROM maintenance_teams WHERE name LIKE :pattern)"),
+                     {"pattern": f"Budget Team%{suffix}"})
+        conn.execute(text("DELETE FROM maintenance_teams WHERE name LIKE :pattern"),
+                     {"pattern": f"Budget Team%{suffix}"})
+        conn.execute(text("DELETE FROM departments WHERE name LIKE :pattern"),
+                     {"pattern": f"Budget Department%{suffix}"})
+        conn.execute(text("DELETE FROM request_audit_logs WHERE changed_by IN "
+                          "(SELECT id FROM users WHERE email LIKE :pattern)"),
+                     {"pattern": f"%-{suffix}@budget.gearguard.com"})
+        conn.execute(text("DELETE FROM background_jobs WHERE created_by IN "
+                          "(SELECT id FROM users WHERE email LIKE :pattern)"),
+                     {"pattern": f"%-{suffix}@budget.gearguard.com"})
+        conn.execute(text("DELETE FROM users WHERE email LIKE :pattern"),
+                     {"pattern": f"%-{suffix}@budget.gearguard.com"})
+
+
+def check_coverage(app) -> list[str]:
+    """Return routes registered on the app that have no declared budget."""
+    from fastapi.routing import APIRoute
+
+    declared = {(budget.method, budget.path) for budget in BUDGETS} | set(UNBUDGETED)
+    missing = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        for method in route.methods:
+            if (method, route.path_format) not in declared:
+                missing.append(f"{method} {route.path_format}")
+    return sorted(missing)
+
+
+async def run_budgets(app, ctx: dict, verbose: bool = False) -> list[str]:
+    from app.core.sql_stats import strict_loading
+
+    failures = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://budget") as client:
+        login = await client.post("/api/auth/login",
+                                  data={"username": ctx["admin_email"], "password": ctx["password"]})
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        for budget in BUDGETS:
+            label = f"{budget.method} {budget.path}"
+            kwargs = budget.request(ctx)
+            store = kwargs.pop("store", None)
+            if kwargs.pop("auth", True):
+                kwargs["headers"] = headers
+
+            try:
+                with strict_loading(budget.strict):
+                    response = await client.request(budget.method, **kwargs)
+            except Exception as exc:
+                failures.append(f"{label}: raised {type(exc).__name__}: {exc}")
+                continue
+
+            expected_status = budget.expected_status or 200
+            if response.status_code != expected_status:
+                failures.append(f"{label}: status {response.status_code} (expected {expected_status}) "
+                                f"{response.text[:200]}")
+                continue
+            if store:
+                ctx[store] = response.json()["id"]
+
+            match = _QUERY_COUNT.search(response.headers.get("server-timing", ""))
+            if match is None:
+                failures.append(f"{label}: no Server-Timing query count (is SQL_STATS_ENABLED on?)")
+                continue
+            count = int(match.group(1))
+            if count > budget.max_queries:
+                failures.append(f"{label}: {count} queries, budget {budget.max_queries}")
+            elif verbose:
+                print(f"ok   {label:<70} {count:>3} / {budget.max_queries}")
+
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check per-route SQL query budgets")
+    parser.add_argument("--database-url", help="Postgres URL (defaults to DATABASE_URL / app settings)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print passing routes too")
+    args = parser.parse_args(argv)
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from app.main import app
+
+    failures = [f"{route}: no query budget declared" for route in check_coverage(app)]
+    ctx = create_fixtures(password="budget-password")
+    try:
+        failures += asyncio.run(run_budgets(app, ctx, verbose=args.verbose))
+    finally:
+        remove_fixtures(ctx)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"\n{len(BUDGETS) - len(failures)} passed, {len(failures)} failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
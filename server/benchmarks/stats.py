@@ -0,0 +1,75 @@
+"""
+Shared statistics and result-comparison helpers for the benchmark harnesses.
+"""
+import json
+import math
+import statistics
+from pathlib import Path
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Linear-interpolated percentile of an already sorted list (q in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize latency samples (seconds) as milliseconds."""
+    values = sorted(samples)
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": round(statistics.fmean(values) * 1000, 3),
+        "min_ms": round(values[0] * 1000, 3),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3),
+        "stdev_ms": round(statistics.stdev(values) * 1000, 3) if len(values) > 1 else 0.0,
+    }
+
+
+def write_results(path: str, results: dict) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(results, indent=2, sort_keys=True, default=str) + "\n")
+
+
+def load_results(path: str) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+def compare(
+    baseline: dict[str, dict],
+    current: dict[str, dict],
+    metric: str = "p95_ms",
+    threshold: float = 0.10
+) -> list[dict]:
+    """
+    Compare per-name summaries and return the entries whose metric grew by
+    more than threshold (a fraction, e.g. 0.10 for 10%).
+    """
+    regressions = []
+    for name, stats in current.items():
+        before = baseline.get(name, {}).get(metric)
+        after = stats.get(metric)
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        if change > threshold:
+            regressions.append({
+                "name": name,
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "change_pct": round(change * 100, 1),
+            })
+    return regressions
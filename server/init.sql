@@ -35,6 +35,30 @@ CREATE TYPE request_stage AS ENUM (
   'scrap'
 );
 
+CREATE TYPE schedule_unit AS ENUM (
+  'day',
+  'week',
+  'month'
+);
+
+CREATE TYPE change_entity AS ENUM (
+  'maintenance_request',
+  'time_log',
+  'equipment'
+);
+
+CREATE TYPE change_operation AS ENUM (
+  'upsert',
+  'delete'
+);
+
+CREATE TYPE job_status AS ENUM (
+  'queued',
+  'running',
+  'succeeded',
+  'failed'
+);
+
 -- 3️⃣ Users
 -- ==============================================================================
 CREATE TABLE users (
@@ -179,17 +203,200 @@ CREATE TABLE request_audit_logs (
     ON DELETE RESTRICT
 );
 
--- 11️⃣ Indexes (Performance)
+-- 11️⃣ Change Log (delta sync)
+-- ==============================================================================
+-- One row per create/update/delete, written in the same transaction as the
+-- change. Deletes are kept as tombstones. Entity ids are not foreign keys so
+-- rows outlive the entities they describe.
+CREATE TABLE change_log (
+  seq BIGSERIAL PRIMARY KEY,
+  entity_type change_entity NOT NULL,
+  entity_id UUID NOT NULL,
+  operation change_operation NOT NULL,
+  changed_at TIMESTAMP NOT NULL DEFAULT NOW(),
+  txid BIGINT NOT NULL DEFAULT txid_current()
+);
+
+-- 12️⃣ Technician Weekly Workload (report rollup)
+-- ==============================================================================
+-- Hours logged per technician per ISO week (week_start is the Monday). Kept in
+-- step with time_logs by the application in the same transaction as each
+-- create/update/delete, so reports never re-aggregate the full time log history.
+CREATE TABLE technician_weekly_workload (
+  technician_id UUID NOT NULL,
+  week_start DATE NOT NULL,
+  hours_logged NUMERIC(10,2) NOT NULL DEFAULT 0,
+  log_count INTEGER NOT NULL DEFAULT 0,
+
+  PRIMARY KEY (technician_id, week_start),
+
+  CONSTRAINT fk_workload_technician
+    FOREIGN KEY (technician_id) REFERENCES technicians(id)
+    ON DELETE CASCADE
+);
+
+-- 13️⃣ Analytics Watermarks
+-- ==============================================================================
+-- Position, as (timestamp, id), up to which each incremental analytics job has
+-- read its source table. Jobs lock their row while they run.
+CREATE TABLE analytics_watermarks (
+  name VARCHAR(50) PRIMARY KEY,
+  position_at TIMESTAMP,
+  position_id UUID,
+  refreshed_at TIMESTAMP
+);
+
+-- 14️⃣ Equipment Reliability Stats (MTTR / MTBF)
+-- ==============================================================================
+-- Running totals per equipment from request_audit_logs: MTTR is
+-- repair_seconds / repair_count, MTBF is
+-- (last_failure_at - first_failure_at) / (failure_count - 1).
+CREATE TABLE equipment_reliability_stats (
+  equipment_id UUID PRIMARY KEY,
+  repair_count INTEGER NOT NULL DEFAULT 0,
+  repair_seconds BIGINT NOT NULL DEFAULT 0,
+  failure_count INTEGER NOT NULL DEFAULT 0,
+  first_failure_at TIMESTAMP,
+  last_failure_at TIMESTAMP,
+
+  CONSTRAINT fk_reliability_equipment
+    FOREIGN KEY (equipment_id) REFERENCES equipment(id)
+    ON DELETE CASCADE
+);
+
+-- 15️⃣ Request Daily Trends (report rollup)
+-- ==============================================================================
+-- Requests opened and closed (moved to repaired or scrap) per day, team,
+-- equipment category ('' for none) and request type, fed incrementally from
+-- request_audit_logs. Team ids are not foreign keys so history outlives teams.
+CREATE TABLE request_daily_trends (
+  day DATE NOT NULL,
+  team_id UUID NOT NULL,
+  category VARCHAR(100) NOT NULL,
+  request_type request_type NOT NULL,
+  opened INTEGER NOT NULL DEFAULT 0,
+  closed INTEGER NOT NULL DEFAULT 0,
+
+  PRIMARY KEY (day, team_id, category, request_type)
+);
+
+-- 16️⃣ Preventive Maintenance Schedules
+-- ==============================================================================
+-- A schedule targets one piece of equipment or every active asset of a
+-- category. Occurrences fall on start_date + k * interval_count units (monthly
+-- ones keep start_date's day of month, clamped to the month's end). The
+-- generator inserts one preventive request per (schedule, equipment, date);
+-- the unique constraint makes re-runs no-ops.
+CREATE TABLE preventive_schedules (
+  id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+  name VARCHAR(255) NOT NULL,
+  subject VARCHAR(255) NOT NULL,
+  description TEXT,
+  equipment_id UUID,
+  category VARCHAR(100),
+  interval_unit schedule_unit NOT NULL,
+  interval_count INTEGER NOT NULL DEFAULT 1 CHECK (interval_count > 0),
+  start_date DATE NOT NULL,
+  end_date DATE,
+  is_active BOOLEAN NOT NULL DEFAULT TRUE,
+  created_by UUID NOT NULL,
+  created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+  generated_through DATE,
+
+  CONSTRAINT fk_schedule_equipment
+    FOREIGN KEY (equipment_id) REFERENCES equipment(id)
+    ON DELETE CASCADE,
+
+  CONSTRAINT fk_schedule_created_by
+    FOREIGN KEY (created_by) REFERENCES users(id)
+    ON DELETE RESTRICT,
+
+  CONSTRAINT schedule_target_check
+    CHECK ((equipment_id IS NULL) <> (category IS NULL)),
+
+  CONSTRAINT schedule_range_check
+    CHECK (end_date IS NULL OR end_date >= start_date)
+);
+
+ALTER TABLE maintenance_requests
+  ADD COLUMN schedule_id UUID,
+  ADD CONSTRAINT fk_request_schedule
+    FOREIGN KEY (schedule_id) REFERENCES preventive_schedules(id)
+    ON DELETE SET NULL,
+  ADD CONSTRAINT uq_request_schedule_occurrence
+    UNIQUE (schedule_id, equipment_id, scheduled_date);
+
+-- 17️⃣ Background Jobs
+-- ==============================================================================
+-- Durable queue for the job workers. Workers claim the oldest due queued job
+-- with SELECT ... FOR UPDATE SKIP LOCKED, so concurrent workers never block
+-- on or run the same job. A failed attempt is re-queued with a later
+-- run_after (exponential backoff) until max_attempts is reached. A running
+-- job whose lease (locked_at) has expired belongs to a dead worker and is
+-- claimed again.
+CREATE TABLE background_jobs (
+  id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+  kind VARCHAR(100) NOT NULL,
+  payload JSONB NOT NULL DEFAULT '{}',
+  status job_status NOT NULL DEFAULT 'queued',
+  attempts INTEGER NOT NULL DEFAULT 0,
+  max_attempts INTEGER NOT NULL CHECK (max_attempts > 0),
+  run_after TIMESTAMP NOT NULL DEFAULT NOW(),
+  locked_by VARCHAR(255),
+  locked_at TIMESTAMP,
+  progress INTEGER NOT NULL DEFAULT 0,
+  progress_total INTEGER,
+  result JSONB,
+  error TEXT,
+  created_by UUID,
+  created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+  started_at TIMESTAMP,
+  finished_at TIMESTAMP,
+
+  CONSTRAINT fk_job_created_by
+    FOREIGN KEY (created_by) REFERENCES users(id)
+    ON DELETE SET NULL
+);
+
+-- 18️⃣ Periodic Task Runs
+-- ==============================================================================
+-- Every API worker runs the in-app scheduler; a task only runs on the worker
+-- holding its pg_try_advisory_lock, which then records the run here. A task
+-- is due once last_started_at + its interval has passed.
+CREATE TABLE periodic_task_runs (
+  name VARCHAR(100) PRIMARY KEY,
+  last_started_at TIMESTAMP,
+  last_finished_at TIMESTAMP,
+  last_duration_ms DOUBLE PRECISION,
+  last_result JSONB,
+  last_error TEXT,
+  last_node VARCHAR(255),
+  run_count INTEGER NOT NULL DEFAULT 0,
+  failure_count INTEGER NOT NULL DEFAULT 0
+);
+
+-- 19️⃣ Indexes (Performance)
 -- ==============================================================================
 CREATE INDEX idx_requests_stage ON maintenance_requests(stage);
 CREATE INDEX idx_requests_equipment ON maintenance_requests(equipment_id);
 CREATE INDEX idx_requests_assigned_to ON maintenance_requests(assigned_to);
+CREATE INDEX idx_requests_scheduled_date ON maintenance_requests(scheduled_date);
 CREATE INDEX idx_equipment_team ON equipment(maintenance_team_id);
+CREATE INDEX idx_equipment_category ON equipment(category);
 CREATE INDEX idx_users_email ON users(email);
 CREATE INDEX idx_users_role ON users(role);
 CREATE INDEX idx_technicians_user ON technicians(user_id);
 CREATE INDEX idx_time_logs_request ON time_logs(request_id);
 CREATE INDEX idx_audit_logs_request ON request_audit_logs(request_id);
+CREATE INDEX idx_audit_logs_position ON request_audit_logs(changed_at, id);
+CREATE INDEX idx_change_log_position ON change_log(txid, seq);
+CREATE INDEX idx_workload_week ON technician_weekly_workload(week_start);
+CREATE INDEX idx_schedules_equipment ON preventive_schedules(equipment_id);
+CREATE INDEX idx_schedules_category ON preventive_schedules(category);
+CREATE INDEX idx_jobs_due ON background_jobs(run_after) WHERE status = 'queued';
+CREATE INDEX idx_jobs_lease ON background_jobs(locked_at) WHERE status = 'running';
+CREATE INDEX idx_jobs_created ON background_jobs(created_at);
+CREATE INDEX idx_requests_overdue_open ON maintenance_requests(scheduled_date) WHERE stage IN ('new', 'in_progress');
 
 -- ==============================================================================
 -- Database Schema Initialization Complete